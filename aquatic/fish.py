@@ -1,90 +1,177 @@
 # Importation des modules nécessaires
-# random : pour les choix aléatoires (déplacement, reproduction)
 # typing : pour le typage statique des variables
-import random
+# Les choix aléatoires (déplacement, reproduction) sont servis par le flux de tirages de la grille (grid.stream)
 from typing import List, Set, Tuple, Optional, Any
+from aquatic.store import EMPTY, FISH, BIRTHS
 
 class Fish:
     """Classe représentant un poisson dans la simulation Wa-Tor.
-    Cette classe gère le comportement d'un poisson dans l'écosystème."""
-    
-    # Variable de classe (statique) pour générer des identifiants uniques
-    # Chaque poisson aura un ID unique incrémenté à chaque création
-    compteur_id_poisson: int = 0
-
-    def __init__(self, grid: Any, x: int, y: int, reproduction_time: int = 5, alive: bool = True) -> None:
-        """Initialise un nouveau poisson avec ses caractéristiques de base.
-        
+    Cette classe gère le comportement d'un poisson dans l'écosystème.
+
+    Un poisson est une vue légère sur une cellule du stockage de la grille
+    (``grid.store``) : son âge, son identifiant et son état de vie sont lus
+    et écrits directement dans les tableaux du stockage. Seules la grille
+    et la position sont conservées dans l'objet.
+
+    La classe n'a pas de ``__dict__`` (``__slots__``), et les vues créées à
+    chaque chronon sont recyclées par la grille (``grid.view_pool``) au lieu
+    d'être rendues au ramasse-miettes. Une naissance n'alloue aucun objet :
+    le nouveau-né est écrit directement dans le stockage (``spawn``)."""
+
+    # Seuls attributs d'une vue (pas de __dict__ par entité)
+    __slots__ = ("grid", "x", "y", "id")
+
+    # Code de l'espèce dans le stockage de la grille
+    SPECIES: int = FISH
+
+    def __init__(self, grid: Any, x: int, y: int, reproduction_time: Optional[int] = None,
+                 alive: bool = True) -> None:
+        """Initialise un nouveau poisson et le place dans la grille.
+
         Args:
             grid (Any): Référence à la grille de simulation où le poisson évolue
             x (int): Position x initiale dans la grille
             y (int): Position y initiale dans la grille
-            reproduction_time (int, optional): Âge nécessaire pour la reproduction. Defaults to 5.
+            reproduction_time (Optional[int], optional): Âge nécessaire pour la reproduction.
+                C'est un paramètre de l'espèce, partagé par tous les poissons de la grille et fixé par
+                Grid.populate_grid : une valeur donnée ici le remplace pour toute l'espèce, None
+                (par défaut) le laisse inchangé. Defaults to None.
             alive (bool, optional): État de vie initial du poisson. Defaults to True.
+                Un poisson créé mort n'est pas placé dans la grille.
         """
         # Initialisation des attributs de base du poisson
         self.grid: Any = grid  # Référence à la grille de simulation
         self.x: int = x  # Position x dans la grille
         self.y: int = y  # Position y dans la grille
-        self.age: int = 0  # Âge initial du poisson
-        self.reproduction_time: int = reproduction_time  # Âge nécessaire pour la reproduction
-        self.alive: bool = alive  # État de vie du poisson
-        self.id: int = Fish.compteur_id_poisson  # Attribution d'un ID unique
-        Fish.compteur_id_poisson += 1  # Incrémentation du compteur pour le prochain poisson
-        
+        self.id: int = self.allocate_ids(grid, 1)  # Attribution d'un ID unique dans la grille
+        if reproduction_time is not None:
+            grid.store.reproduction_time[self.SPECIES] = reproduction_time  # Âge nécessaire pour la reproduction
+        if alive:
+            # Âge initial à 0, placement dans le stockage de la grille
+            grid.store.place(self.cell, self.SPECIES, 0, 0, self.id)
+
+    @classmethod
+    def view(cls, grid: Any, x: int, y: int) -> 'Fish':
+        """Crée une vue sur l'entité déjà présente dans une cellule, sans la recréer.
+
+        Args:
+            grid (Any): Grille de simulation
+            x (int): Position x de l'entité
+            y (int): Position y de l'entité
+
+        Returns:
+            Fish: Vue sur l'entité de la cellule (x, y), réutilisée si la grille en a une en réserve
+        """
+        pool = grid.view_pool[cls.SPECIES]
+        entity = pool.pop() if pool else cls.__new__(cls)
+        entity.grid = grid
+        entity.x = x
+        entity.y = y
+        entity.id = grid.store.ids[grid.store.index(x, y)]
+        return entity
+
+    @classmethod
+    def spawn(cls, grid: Any, cell: int, energy: int = 0) -> None:
+        """Fait naître une entité de l'espèce dans une cellule vide, sans créer d'objet.
+
+        Args:
+            grid (Any): Grille de simulation
+            cell (int): Indice de la cellule (vide) du nouveau-né
+            energy (int, optional): Énergie initiale (requins). Defaults to 0.
+        """
+        store = grid.store
+        store.place(cell, cls.SPECIES, 0, energy, store.allocate_ids(cls.SPECIES, 1))
+        store.events[BIRTHS] += 1
+
+    @classmethod
+    def allocate_ids(cls, grid: Any, count: int) -> int:
+        """Réserve ``count`` identifiants consécutifs pour de nouvelles entités de l'espèce.
+        Les compteurs d'identifiants appartiennent au stockage de la grille.
+
+        Args:
+            grid (Any): Grille de simulation
+            count (int): Nombre d'identifiants à réserver
+
+        Returns:
+            int: Premier identifiant réservé
+        """
+        return grid.store.allocate_ids(cls.SPECIES, count)
+
+    @property
+    def cell(self) -> int:
+        """Indice de la cellule du poisson dans le stockage de la grille."""
+        return self.x * self.grid.point_y + self.y
+
+    @property
+    def alive(self) -> bool:
+        """Le poisson est vivant tant que sa cellule le contient encore."""
+        store = self.grid.store
+        cell = self.cell
+        return store.species[cell] == self.SPECIES and store.ids[cell] == self.id
+
+    @alive.setter
+    def alive(self, value: bool) -> None:
+        # Tuer le poisson revient à libérer sa cellule
+        if not value and self.alive:
+            self.grid.store.clear(self.cell)
+
+    @property
+    def age(self) -> int:
+        """Âge du poisson, lu dans le stockage de la grille."""
+        return self.grid.store.age[self.cell]
+
+    @age.setter
+    def age(self, value: int) -> None:
+        self.grid.store.age[self.cell] = value
+
+    @property
+    def reproduction_time(self) -> int:
+        """Âge nécessaire pour la reproduction (paramètre de l'espèce)."""
+        return self.grid.store.reproduction_time[self.SPECIES]
+
     def die(self) -> None:
-        """Marque le poisson comme mort.
+        """Marque le poisson comme mort et libère sa cellule.
         Cette méthode est appelée quand le poisson meurt (mangé par un requin)."""
         self.alive = False
-        
+
     def remove_fish(self, grid: Any) -> None:
         """Supprime le poisson de la grille de simulation.
-        
+
         Args:
             grid (Any): Grille de simulation où le poisson doit être supprimé
         """
-        # Supprime le poisson de la grille en mettant la cellule à None
-        grid.cells[self.x][self.y] = None
-        self.alive = False 
+        # Supprime le poisson de la grille en vidant sa cellule
+        self.alive = False
 
     def step(self) -> None:
         """Fait vieillir le poisson d'un tour en incrémentant son âge.
         Cette méthode est appelée à chaque tour de simulation."""
         self.age += 1
-            
+
     def get_empty_neighbors(self, grid: Any, x: int, y: int) -> List[Tuple[int, int]]:
         """Trouve les cellules vides adjacentes à la position du poisson.
-        
+
         Args:
             grid (Any): Grille de simulation
             x (int): Position x du poisson
             y (int): Position y du poisson
-            
+
         Returns:
             List[Tuple[int, int]]: Liste des coordonnées des cellules vides adjacentes
         """
-        # Directions possibles : haut, bas, gauche, droite
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        neighbors = []
-        # Vérifie chaque direction pour trouver les cases vides
-        for dx, dy in directions:
-            # Utilise les coordonnées toroïdales (la grille est un tore)
-            nx, ny = grid.get_toroidal_coords(x + dx, y + dy)
-            if grid.cells[nx][ny] is None:
-                neighbors.append((nx, ny))
-        return neighbors
-    
+        return grid.get_empty_neighbors(x, y)
+
     def position(self) -> Tuple[int, int]:
         """Retourne la position actuelle du poisson.
-        
+
         Returns:
             Tuple[int, int]: Coordonnées (x, y) du poisson
         """
         return (self.x, self.y)
-    
+
     def handle_fish(self, grid: Any, x: int, y: int, already_moved: Set[Tuple[int, int]]) -> None:
         """Gère le comportement complet du poisson pendant un tour de simulation.
-        
+
         Args:
             grid (Any): Grille de simulation
             x (int): Position x actuelle
@@ -93,11 +180,11 @@ class Fish:
         """
         # Fait vieillir le poisson
         self.step()
-        # Cherche les cases vides adjacentes
-        empty = self.get_empty_neighbors(grid, x, y)
+        # Cherche les cases vides adjacentes (indices à plat, lus dans la table des voisins de la grille)
+        empty = grid.neighbor_cells(x * grid.point_y + y, EMPTY)
         # Si une case vide est trouvée, déplace le poisson
         if empty:
-            nx, ny = random.choice(empty)
+            nx, ny = divmod(grid.stream.choice(empty), grid.point_y)
             grid.move_entity(self, x, y, nx, ny, already_moved)
 
         # Vérifie si le poisson peut se reproduire
@@ -106,20 +193,16 @@ class Fish:
 
     def reproduce_entity(self, grid: Any, x: int, y: int) -> None:
         """Crée un nouveau poisson dans une case vide adjacente.
-        
+
         Args:
             grid (Any): Grille de simulation
             x (int): Position x du parent
             y (int): Position y du parent
         """
         # Cherche les cases vides adjacentes pour la reproduction
-        empty = self.get_empty_neighbors(grid, x, y)
+        empty = grid.neighbor_cells(x * grid.point_y + y, EMPTY)
         if empty:
-            # Choisit une case vide aléatoire
-            nx, ny = random.choice(empty)
-            # Crée un nouveau poisson
-            baby = Fish(grid, nx, ny, reproduction_time=self.reproduction_time)
-            # Place le nouveau poisson dans la grille
-            grid.cells[nx][ny] = baby
+            # Place un nouveau poisson dans une case vide aléatoire, directement dans le stockage
+            Fish.spawn(grid, grid.stream.choice(empty))
             # Réinitialise l'âge du parent après reproduction
             self.age = 0
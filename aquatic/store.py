@@ -0,0 +1,302 @@
+"""
+Stockage compact des entités de la simulation Wa-Tor (structure de tableaux).
+
+Au lieu d'un objet Python par poisson ou requin, l'état de toutes les entités
+est rangé dans des tableaux typés (module ``array``) indexés par cellule,
+avec l'indice à plat ``x * point_y + y`` (même ordre que ``cells[x][y]``) :
+- ``species`` : 0 = eau, 1 = poisson, 2 = requin (1 octet par cellule)
+- ``age`` : âge de l'entité (4 octets)
+- ``energy`` : énergie du requin (4 octets)
+- ``ids`` : identifiant unique de l'entité (8 octets)
+
+Les paramètres communs à toute une espèce (temps de reproduction, énergie
+gagnée en mangeant un poisson) sont stockés une seule fois. Le nombre
+d'entités de chaque espèce (``counts``) est tenu à jour à chaque écriture,
+ce qui évite de parcourir toute la grille pour compter les populations.
+
+Lorsque ``track_changes`` est activé (une interface graphique est branchée),
+les cellules dont l'espèce change sont notées dans ``dirty`` : le rendu ne
+redessine alors que ces cellules.
+Lorsque ``track_occupancy`` est activé (moteur objet), l'ensemble ``occupied``
+des cellules occupées est lui aussi tenu à jour : un chronon parcourt alors les
+entités vivantes sans balayer toutes les cellules de la grille.
+Les classes Fish et Shark ne sont plus que des vues sur une cellule du stockage.
+"""
+# Importation des modules nécessaires
+# array : tableaux typés compacts (utilisables directement par NumPy, sans copie)
+import re
+from array import array
+from typing import List, Optional, Set, Tuple
+
+# Codes des espèces stockés dans le tableau ``species``
+EMPTY: int = 0
+FISH: int = 1
+SHARK: int = 2
+
+# Indices des compteurs d'événements (``events``) et noms correspondants
+MOVES: int = 0  # Déplacements (y compris celui d'un requin vers le poisson qu'il mange)
+MEALS: int = 1  # Poissons mangés
+BIRTHS: int = 2  # Naissances
+STARVATIONS: int = 3  # Requins morts de faim
+EVENT_NAMES: Tuple[str, ...] = ("moves", "meals", "births", "starvations")
+
+# Octet non nul du tableau des espèces (cellule occupée), recherché en C
+OCCUPIED = re.compile(b"[^\x00]")
+
+
+class EntityStore:
+    """Stockage de l'état de toutes les entités d'une grille, une case par cellule."""
+
+    def __init__(self, point_x: int, point_y: int) -> None:
+        """Initialise un stockage vide pour une grille de la taille donnée.
+
+        Args:
+            point_x (int): Largeur de la grille
+            point_y (int): Hauteur de la grille
+        """
+        self.point_x: int = point_x  # Largeur de la grille
+        self.point_y: int = point_y  # Hauteur de la grille
+        size = point_x * point_y
+        self.species: array = array('B', bytes(size))  # Espèce présente dans chaque cellule
+        self.age: array = array('i', [0]) * size  # Âge de l'entité de chaque cellule
+        self.energy: array = array('i', [0]) * size  # Énergie du requin de chaque cellule
+        self.ids: array = array('q', [0]) * size  # Identifiant de l'entité de chaque cellule
+        # Paramètres par espèce (indexés par code d'espèce)
+        self.reproduction_time: List[int] = [0, 5, 5]  # Temps de reproduction des poissons et des requins
+        self.energy_from_fish: int = 15  # Énergie gagnée par un requin en mangeant un poisson
+        # Nombre d'entités vivantes de chaque espèce (indexé par code d'espèce, counts[EMPTY] inutilisé)
+        self.counts: List[int] = [0, 0, 0]
+        # Compteurs cumulés des événements de la simulation (indexés par MOVES, MEALS, BIRTHS, STARVATIONS),
+        # incrémentés par les moteurs ; l'instrumentation en calcule la variation à chaque chronon
+        self.events: List[int] = [0, 0, 0, 0]
+        # Prochain identifiant libre de chaque espèce (indexé par code d'espèce) : les identifiants
+        # sont propres à la grille, deux grilles du même processus ne partagent aucun compteur
+        self.next_ids: List[int] = [0, 0, 0]
+        # Suivi des cellules modifiées depuis le dernier dessin
+        self.track_changes: bool = False  # Activé uniquement quand un rendu est branché
+        self.dirty: Set[int] = set()  # Cellules dont l'espèce a changé
+        self.all_dirty: bool = True  # Toute la grille doit être redessinée
+        # Index des cellules occupées (voir track_occupancy)
+        self.track_occupancy: bool = False  # Activé par le moteur objet
+        self.occupied: Set[int] = set()  # Cellules contenant une entité
+
+    def index(self, x: int, y: int) -> int:
+        """Retourne l'indice à plat de la cellule (x, y).
+
+        Args:
+            x (int): Coordonnée x de la cellule
+            y (int): Coordonnée y de la cellule
+
+        Returns:
+            int: Indice de la cellule dans les tableaux du stockage
+        """
+        return x * self.point_y + y
+
+    def allocate_ids(self, species: int, count: int) -> int:
+        """Réserve ``count`` identifiants consécutifs pour de nouvelles entités d'une espèce.
+
+        Args:
+            species (int): Code de l'espèce (FISH ou SHARK)
+            count (int): Nombre d'identifiants à réserver
+
+        Returns:
+            int: Premier identifiant réservé
+        """
+        first = self.next_ids[species]
+        self.next_ids[species] += count
+        return first
+
+    def place(self, cell: int, species: int, age: int, energy: int, entity_id: int) -> None:
+        """Place une entité dans une cellule.
+
+        Args:
+            cell (int): Indice de la cellule
+            species (int): Code de l'espèce (FISH ou SHARK)
+            age (int): Âge de l'entité
+            energy (int): Énergie de l'entité
+            entity_id (int): Identifiant unique de l'entité
+        """
+        previous = self.species[cell]
+        if previous != EMPTY:
+            self.counts[previous] -= 1
+        self.counts[species] += 1
+        if self.track_changes:
+            self.dirty.add(cell)
+        if self.track_occupancy:
+            self.occupied.add(cell)
+        self.species[cell] = species
+        self.age[cell] = age
+        self.energy[cell] = energy
+        self.ids[cell] = entity_id
+
+    def clear(self, cell: int) -> None:
+        """Vide une cellule.
+
+        Args:
+            cell (int): Indice de la cellule
+        """
+        previous = self.species[cell]
+        if previous != EMPTY:
+            self.counts[previous] -= 1
+            if self.track_changes:
+                self.dirty.add(cell)
+            if self.track_occupancy:
+                self.occupied.discard(cell)
+        self.species[cell] = EMPTY
+        self.age[cell] = 0
+        self.energy[cell] = 0
+        self.ids[cell] = 0
+
+    def move(self, src: int, dst: int) -> None:
+        """Déplace l'entité de la cellule ``src`` vers la cellule ``dst``.
+
+        Args:
+            src (int): Indice de la cellule de départ
+            dst (int): Indice de la cellule d'arrivée
+        """
+        if src == dst:
+            return
+        species, age, energy, ids = self.species, self.age, self.energy, self.ids
+        if species[dst] != EMPTY:
+            # L'entité de la cellule d'arrivée est écrasée
+            self.counts[species[dst]] -= 1
+        species[dst], age[dst], energy[dst], ids[dst] = species[src], age[src], energy[src], ids[src]
+        species[src], age[src], energy[src], ids[src] = EMPTY, 0, 0, 0
+        if self.track_changes:
+            self.dirty.add(src)
+            self.dirty.add(dst)
+        if self.track_occupancy:
+            self.occupied.discard(src)
+            self.occupied.add(dst)
+
+    def clear_all(self) -> None:
+        """Vide toutes les cellules."""
+        size = self.point_x * self.point_y
+        self.species[:] = array('B', bytes(size))
+        self.age[:] = array('i', [0]) * size
+        self.energy[:] = array('i', [0]) * size
+        self.ids[:] = array('q', [0]) * size
+        self.counts = [0, 0, 0]
+        self.occupied = set()
+        self.mark_all_dirty()
+
+    def swap(self, other: 'EntityStore') -> None:
+        """Échange le contenu des cellules avec un autre stockage de même taille (double tampon).
+        Les tableaux, les compteurs de population et l'index des cellules occupées sont échangés ;
+        les paramètres, les événements et les identifiants restent ceux de ce stockage.
+        Les deux stockages doivent tenir l'index des cellules occupées (index_occupancy).
+
+        Args:
+            other (EntityStore): Stockage contenant le nouvel état des cellules
+        """
+        if self.track_changes:
+            # Seules les cellules dont l'espèce change sont à redessiner
+            self.dirty.update(cell for cell in self.occupied | other.occupied
+                              if self.species[cell] != other.species[cell])
+        self.species, other.species = other.species, self.species
+        self.age, other.age = other.age, self.age
+        self.energy, other.energy = other.energy, self.energy
+        self.ids, other.ids = other.ids, self.ids
+        self.counts, other.counts = other.counts, self.counts
+        self.occupied, other.occupied = other.occupied, self.occupied
+
+    def adopt(self, species: memoryview, age: memoryview, energy: memoryview, ids: memoryview) -> None:
+        """Remplace les tableaux du stockage par des tampons fournis par un moteur (ex. mémoire partagée
+        du moteur tiled), après y avoir recopié le contenu actuel : le moteur écrit ensuite directement
+        dans l'état de la grille. Comme ceux d'un point de reprise projeté en mémoire (interface/snapshot.py),
+        les tampons sont des memoryview au format des tableaux remplacés ("B", "i", "i", "q").
+
+        Args:
+            species (memoryview): Nouveau tableau des espèces
+            age (memoryview): Nouveau tableau des âges
+            energy (memoryview): Nouveau tableau des énergies
+            ids (memoryview): Nouveau tableau des identifiants
+
+        Raises:
+            ValueError: Si un tampon n'a pas le format ou la taille du tableau qu'il remplace
+        """
+        buffers = (species, age, energy, ids)
+        for old, new in zip((self.species, self.age, self.energy, self.ids), buffers):
+            if new.format != old.typecode or len(new) != len(old):
+                raise ValueError(f"Tampon incompatible : {len(new)} x {new.format!r} "
+                                 f"au lieu de {len(old)} x {old.typecode!r}")
+            new[:] = old
+        self.species, self.age, self.energy, self.ids = buffers
+
+    def count(self, species: int) -> int:
+        """Retourne le nombre d'entités d'une espèce, tenu à jour à chaque écriture (O(1)).
+
+        Args:
+            species (int): Code de l'espèce
+
+        Returns:
+            int: Nombre d'entités de cette espèce
+        """
+        return self.counts[species]
+
+    def scan(self, species: int) -> int:
+        """Compte les cellules occupées par une espèce en parcourant toute la grille.
+        Sert à vérifier les compteurs incrémentaux (mode debug de Grid).
+
+        Args:
+            species (int): Code de l'espèce
+
+        Returns:
+            int: Nombre d'entités de cette espèce
+        """
+        # bytes.count parcourt les octets en C, bien plus vite que array.count
+        return bytes(self.species).count(species)
+
+    def recount(self) -> None:
+        """Recalcule les compteurs (et l'index des cellules occupées, s'il est tenu)
+        après une écriture directe dans les tableaux (ex. moteur NumPy, point de reprise)."""
+        self.counts = [0, self.scan(FISH), self.scan(SHARK)]
+        if self.track_occupancy:
+            self.occupied = self.scan_occupied()
+
+    def scan_occupied(self) -> Set[int]:
+        """Retrouve les cellules occupées en parcourant toute la grille (en C, octet par octet).
+
+        Returns:
+            Set[int]: Indices des cellules contenant une entité
+        """
+        return {match.start() for match in OCCUPIED.finditer(bytes(self.species))}
+
+    def occupied_cells(self) -> List[int]:
+        """Retourne les cellules occupées, dans l'ordre croissant des indices.
+
+        Un ensemble Python ne rétrécit jamais : après une hécatombe, le parcourir coûterait
+        encore autant que la population maximale atteinte. L'index est donc reconstruit à
+        la taille de la population actuelle à chaque appel (une fois par chronon).
+
+        Returns:
+            List[int]: Indices des cellules contenant une entité
+        """
+        cells = sorted(self.occupied)
+        self.occupied = set(cells)
+        return cells
+
+    def index_occupancy(self) -> None:
+        """Active l'index des cellules occupées, construit à partir du contenu actuel de la grille."""
+        self.track_occupancy = True
+        self.occupied = self.scan_occupied()
+
+    def mark_all_dirty(self) -> None:
+        """Demande que toute la grille soit redessinée (après un remplissage ou une remise à zéro)."""
+        self.all_dirty = True
+        self.dirty = set()
+
+    def take_dirty(self) -> Optional[Set[int]]:
+        """Retourne les cellules modifiées depuis le dernier appel et remet le suivi à zéro.
+
+        Returns:
+            Optional[Set[int]]: Indices des cellules modifiées, ou None si toute la grille doit être redessinée
+        """
+        changed = None if self.all_dirty else self.dirty
+        self.all_dirty = False
+        self.dirty = set()
+        return changed
+
+    def nbytes(self) -> int:
+        """Retourne la mémoire occupée par les tableaux du stockage, en octets."""
+        return sum(a.itemsize * len(a) for a in (self.species, self.age, self.energy, self.ids))
@@ -1,9 +1,27 @@
-import tkinter as tk
-from tkinter import ttk
+from array import array
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+import atexit
+from itertools import accumulate, count
+from operator import add, itemgetter, lt
 import csv
 import os
+import queue
+import threading
+import time
+
+# Colonnes du fichier d'historique
+FIELDNAMES: List[str] = ['date', 'chronons', 'fish_count', 'shark_count']
+
+# Fichier d'historique à la racine du projet (indépendant du répertoire courant)
+DEFAULT_HISTORY_FILE: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'simulation_history.csv')
+
+# Seuils d'écriture par défaut : nombre de lignes en attente, ou délai en secondes
+DEFAULT_FLUSH_ROWS: int = 100
+DEFAULT_FLUSH_INTERVAL: float = 2.0
+
+# Taille maximale d'un bloc lu par HistoryTail (les lignes sont analysées bloc par bloc)
+READ_CHUNK: int = 1 << 18
 
 class SimulationHistory:
     """
@@ -13,16 +31,50 @@ class SimulationHistory:
     - Charger l'historique depuis un fichier CSV
     - Afficher l'historique dans une interface graphique
     - Effacer l'historique
+
+    Les lignes enregistrées à chaque chronon (``record``) sont gardées en
+    mémoire puis ajoutées au fichier par lots, dès que ``flush_rows`` lignes
+    sont en attente ou que ``flush_interval`` secondes se sont écoulées.
+    Avec ``background=True``, l'écriture est confiée à un thread dédié : la
+    boucle de simulation n'attend jamais le disque. Les lignes en attente
+    sont écrites à l'arrêt de la simulation (``flush``) et à la sortie du
+    programme (``close``, enregistré avec atexit).
     """
     
-    def __init__(self):
+    def __init__(self, history_file: Optional[str] = None, flush_rows: int = DEFAULT_FLUSH_ROWS,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL, background: bool = False):
         """
         Initialise l'historique des simulations.
-        Crée une liste vide pour stocker les simulations et charge l'historique existant.
+        L'historique existant n'est chargé qu'au premier accès à ``simulations``.
+
+        Args:
+            history_file (Optional[str], optional): Fichier de sauvegarde. Defaults to None (racine du projet).
+            flush_rows (int, optional): Nombre de lignes en attente déclenchant une écriture. Defaults to 100.
+            flush_interval (float, optional): Délai maximal entre deux écritures, en secondes. Defaults to 2.0.
+            background (bool, optional): Écrire dans un thread dédié. Defaults to False.
         """
-        self.simulations: List[Dict] = []  # Liste des simulations avec leurs données
-        self.history_file = "simulation_history.csv"  # Fichier de sauvegarde
-        self.load_history()  # Chargement de l'historique existant
+        self.history_file: str = history_file or DEFAULT_HISTORY_FILE  # Fichier de sauvegarde
+        self.flush_rows: int = flush_rows  # Taille d'un lot d'écriture
+        self.flush_interval: float = flush_interval  # Délai maximal entre deux écritures
+        self.background: bool = background  # Écriture dans un thread dédié
+        self._simulations: Optional[List[Dict]] = None  # Chargées à la demande
+        self.pending: List[Dict] = []  # Lignes en attente d'écriture
+        self.last_flush: float = time.monotonic()  # Heure de la dernière écriture
+        self.lock = threading.Lock()  # Protège l'accès au fichier
+        self.batches: Optional[queue.Queue] = None  # Lots transmis au thread d'écriture
+        self.writer: Optional[threading.Thread] = None  # Thread d'écriture
+        self.exit_registered: bool = False  # close() enregistré avec atexit
+
+    @property
+    def simulations(self) -> List[Dict]:
+        """Liste des simulations, chargée depuis le fichier au premier accès."""
+        if self._simulations is None:
+            self.load_history()
+        return self._simulations
+
+    @simulations.setter
+    def simulations(self, value: List[Dict]) -> None:
+        self._simulations = value
     
     def add_simulation(self, chronons: int, fish_count: int, shark_count: int):
         """
@@ -33,42 +85,154 @@ class SimulationHistory:
             fish_count (int): Nombre de poissons à la fin de la simulation
             shark_count (int): Nombre de requins à la fin de la simulation
         """
-        # Création d'un dictionnaire avec les données de la simulation
-        simulation = {
+        simulation = self.record(chronons, fish_count, shark_count)
+        if self._simulations is not None:
+            self._simulations.append(simulation)  # Ajout à la liste déjà chargée
+        self.flush()  # Une fin de simulation est écrite immédiatement
+
+    def record(self, chronons: int, fish_count: int, shark_count: int) -> Dict:
+        """
+        Enregistre l'état d'un chronon. La ligne est mise en attente et n'est
+        écrite qu'avec le lot suivant.
+
+        Args:
+            chronons (int): Numéro du chronon
+            fish_count (int): Nombre de poissons
+            shark_count (int): Nombre de requins
+
+        Returns:
+            Dict: Ligne enregistrée
+        """
+        # Création d'un dictionnaire avec les données du chronon
+        row = {
             'date': datetime.now().isoformat(),  # Date et heure actuelles
             'chronons': chronons,  # Nombre de tours
             'fish_count': fish_count,  # Nombre de poissons
             'shark_count': shark_count  # Nombre de requins
         }
-        self.simulations.append(simulation)  # Ajout à la liste
-        self.save_history()  # Sauvegarde dans le fichier
+        self.pending.append(row)
+        if not self.exit_registered:
+            # Les lignes en attente sont écrites à la sortie du programme
+            atexit.register(self.close)
+            self.exit_registered = True
+        if len(self.pending) >= self.flush_rows or time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+        return row
+
+    def flush(self) -> None:
+        """Écrit les lignes en attente (ou les confie au thread d'écriture)."""
+        self.last_flush = time.monotonic()
+        if not self.pending:
+            return
+        rows, self.pending = self.pending, []
+        if self.background:
+            if self.writer is None:
+                self.start_writer()
+            self.batches.put(rows)
+        else:
+            self.append_rows(rows)
+
+    def start_writer(self) -> None:
+        """Démarre le thread d'écriture en arrière-plan."""
+        self.batches = queue.Queue()
+        self.writer = threading.Thread(target=self._write_batches, name="wator-history", daemon=True)
+        self.writer.start()
+
+    def _write_batches(self) -> None:
+        """Boucle du thread d'écriture : écrit chaque lot reçu, jusqu'à la valeur None."""
+        while True:
+            rows = self.batches.get()
+            if rows is None:
+                return
+            self.append_rows(rows)
+            self.batches.task_done()
+
+    def append_rows(self, rows: List[Dict]) -> None:
+        """
+        Ajoute des lignes à la fin du fichier en une seule écriture.
+        L'en-tête est écrit si le fichier est nouveau ou vide.
+
+        Args:
+            rows (List[Dict]): Lignes à ajouter
+        """
+        with self.lock:
+            try:
+                new_file = not os.path.exists(self.history_file) or os.path.getsize(self.history_file) == 0
+                with open(self.history_file, 'a', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+                    if new_file:
+                        writer.writeheader()  # Écriture de l'en-tête
+                    writer.writerows(rows)  # Écriture du lot
+            except Exception as e:
+                print(f"Erreur lors de la sauvegarde de l'historique : {e}")
+
+    def close(self) -> None:
+        """Écrit les lignes en attente et arrête le thread d'écriture."""
+        self.flush()
+        if self.writer is not None:
+            self.batches.put(None)
+            self.writer.join()
+            self.writer = None
     
     def save_history(self):
         """
         Sauvegarde l'historique dans un fichier CSV.
         Le fichier contient les colonnes : date, chronons, fish_count, shark_count.
+        Les lignes encore en attente sont abandonnées (le fichier est réécrit en entier).
         """
-        try:
-            with open(self.history_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['date', 'chronons', 'fish_count', 'shark_count'])
-                writer.writeheader()  # Écriture de l'en-tête
-                writer.writerows(self.simulations)  # Écriture des données
-        except Exception as e:
-            print(f"Erreur lors de la sauvegarde de l'historique : {e}")
+        self.pending = []
+        self.rewrite(self.simulations)
+
+    def clear(self) -> None:
+        """
+        Efface l'historique : le fichier ne garde que l'en-tête. Les lignes en attente sont
+        abandonnées et les lots déjà confiés au thread d'écriture sont écrits avant l'effacement,
+        pour qu'aucun ne soit ajouté au fichier effacé.
+        """
+        self.pending = []
+        self.rewrite([])
+        if self._simulations is not None:
+            self._simulations = []
+
+    def rewrite(self, rows: List[Dict]) -> None:
+        """
+        Réécrit le fichier en entier, une fois écrits les lots confiés au thread d'écriture.
+        Le nouveau contenu est écrit dans un fichier temporaire qui remplace ensuite l'ancien :
+        le fichier d'historique change d'identité (voir HistoryTail.read_records).
+
+        Args:
+            rows (List[Dict]): Lignes du nouveau fichier
+        """
+        if self.writer is not None:
+            self.batches.join()  # Attente de l'écriture des lots déjà confiés au thread
+        temporary = self.history_file + '.tmp'
+        with self.lock:
+            try:
+                with open(temporary, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+                    writer.writeheader()  # Écriture de l'en-tête
+                    writer.writerows(rows)  # Écriture des données
+                os.replace(temporary, self.history_file)
+            except Exception as e:
+                print(f"Erreur lors de la sauvegarde de l'historique : {e}")
     
     def load_history(self):
         """
         Charge l'historique depuis le fichier CSV.
         Si le fichier n'existe pas ou s'il y a une erreur, initialise une liste vide.
         """
+        self._simulations = []
+        self.flush()  # Les lignes en attente doivent figurer dans le fichier lu
+        if self.writer is not None:
+            self.batches.join()  # Attente de l'écriture des lots déjà confiés au thread
         if os.path.exists(self.history_file):
             try:
-                with open(self.history_file, 'r', newline='', encoding='utf-8') as f:
+                with self.lock, open(self.history_file, 'r', newline='', encoding='utf-8') as f:
                     reader = csv.DictReader(f)
-                    self.simulations = list(reader)  # Conversion en liste
+                    self._simulations = list(reader)  # Conversion en liste
             except Exception as e:
                 print(f"Erreur lors du chargement de l'historique : {e}")
-                self.simulations = []  # Initialisation d'une liste vide en cas d'erreur
+                self._simulations = []  # Initialisation d'une liste vide en cas d'erreur
     
     def show_history_window(self):
         """
@@ -80,6 +244,10 @@ class SimulationHistory:
         - Nombre de poissons
         - Nombre de requins
         """
+        # Import local : le reste de la classe doit rester utilisable sans affichage (mode headless)
+        import tkinter as tk
+        from tkinter import ttk
+
         # Création de la fenêtre d'historique
         history_window = tk.Toplevel()
         history_window.title("Historique des Simulations")
@@ -131,8 +299,7 @@ class SimulationHistory:
             Efface l'historique des simulations.
             Vide la liste des simulations et le tableau d'affichage.
             """
-            self.simulations = []  # Vidage de la liste
-            self.save_history()  # Sauvegarde du fichier vide
+            self.clear()  # Vidage de la liste et du fichier
             for item in tree.get_children():
                 tree.delete(item)  # Effacement du tableau
         
@@ -142,4 +309,263 @@ class SimulationHistory:
         
         # Ajout du bouton d'effacement
         clear_button = ttk.Button(button_frame, text="Effacer l'historique", command=clear_history)
-        clear_button.pack(side=tk.RIGHT) 
\ No newline at end of file
+        clear_button.pack(side=tk.RIGHT)
+
+
+class HistoryTail:
+    """
+    Lecture incrémentale du fichier d'historique (à la manière de ``tail -f``).
+    La position dans le fichier est mémorisée : chaque appel à ``poll`` ne lit
+    que les lignes ajoutées depuis l'appel précédent. Une ligne incomplète
+    (en cours d'écriture) est laissée pour l'appel suivant. Si le fichier
+    raccourcit ou est remplacé par un autre (historique effacé ou réécrit par
+    SimulationHistory, même s'il a déjà regrossi), la lecture reprend depuis le début.
+    """
+
+    def __init__(self, history_file: Optional[str] = None):
+        """
+        Initialise la lecture au début du fichier.
+
+        Args:
+            history_file (Optional[str], optional): Fichier à suivre. Defaults to None (racine du projet).
+        """
+        self.history_file: str = history_file or DEFAULT_HISTORY_FILE  # Fichier suivi
+        self.reset()
+
+    def reset(self) -> None:
+        """Reprend la lecture depuis le début du fichier."""
+        self.offset: int = 0  # Position (en octets) de la prochaine ligne à lire
+        self.identity: Optional[Tuple[int, int]] = None  # Périphérique et inode du fichier lu
+        self.fieldnames: Optional[List[str]] = None  # En-tête du fichier, lu avec la première ligne
+        self.previous_chronons: Optional[int] = None  # Chronon de la dernière ligne lue
+
+    def read_records(self) -> Tuple[bool, List[int], List[List[str]]]:
+        """
+        Lit les lignes de données complètes ajoutées depuis le dernier appel (l'en-tête est mis de côté),
+        par blocs d'au plus READ_CHUNK octets : un gros fichier se lit en plusieurs appels.
+
+        Returns:
+            Tuple[bool, List[int], List[List[str]]]: (True si le fichier a été tronqué et relu
+                depuis le début, position de chaque ligne en octets, valeurs de chaque ligne)
+        """
+        truncated = False
+        try:
+            stat = os.stat(self.history_file)
+            size, identity = stat.st_size, (stat.st_dev, stat.st_ino)
+        except OSError:
+            size, identity = 0, None
+        if size < self.offset or (self.identity is not None and identity != self.identity):
+            # Le fichier a été effacé ou remplacé : tout est relu
+            self.reset()
+            truncated = True
+        self.identity = identity
+        if size == self.offset:
+            return truncated, [], []
+
+        with open(self.history_file, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read(min(size - self.offset, READ_CHUNK))
+        # Seules les lignes terminées sont lues ; la fin incomplète attend le prochain appel
+        lines = data[:data.rfind(b'\n') + 1].split(b'\n')[:-1]
+        # Position de chaque ligne : cumul des longueurs, plus un octet par saut de ligne déjà passé
+        offsets = list(map(add, accumulate(map(len, lines), initial=self.offset), count()))
+        self.offset = offsets.pop()
+
+        records = list(csv.reader(b'\n'.join(lines).decode('utf-8').split('\n')))
+        # Les lignes vides sont ignorées
+        if not all(records):
+            offsets = [offset for offset, values in zip(offsets, records) if values]
+            records = [values for values in records if values]
+        if records and self.fieldnames is None:
+            self.fieldnames = records.pop(0)  # Première ligne : en-tête
+            offsets.pop(0)
+        return truncated, offsets, records
+
+    def starts_simulation(self, chronons: Optional[int]) -> bool:
+        """
+        Indique si une ligne commence une nouvelle simulation : le nombre de chronons
+        diminue (ou c'est la première ligne).
+
+        Args:
+            chronons (Optional[int]): Chronon de la ligne lue (None s'il est illisible)
+
+        Returns:
+            bool: True au début d'une nouvelle simulation
+        """
+        new_simulation = self.previous_chronons is None or (
+            chronons is not None and chronons < self.previous_chronons)
+        self.previous_chronons = chronons
+        return new_simulation
+
+    def poll(self) -> Tuple[bool, List[Dict]]:
+        """
+        Lit les lignes complètes ajoutées depuis le dernier appel (au plus READ_CHUNK octets).
+        Chaque ligne reçoit la clé ``new_simulation`` (voir ``starts_simulation``).
+
+        Returns:
+            Tuple[bool, List[Dict]]: (True si le fichier a été tronqué et relu depuis le début, nouvelles lignes)
+        """
+        truncated, _, records = self.read_records()
+        rows = []
+        for values in records:
+            row = dict(zip(self.fieldnames, values))
+            row['new_simulation'] = self.starts_simulation(to_int(row.get('chronons')))
+            rows.append(row)
+        return truncated, rows
+
+
+class HistoryIndex(HistoryTail):
+    """
+    Index compact d'un fichier d'historique, pour l'afficher sans le charger.
+    Pour chaque ligne, seuls sa position dans le fichier (array 'q'), son
+    chronon et les populations (array 'i') et le début de simulation
+    (array 'B') sont gardés en mémoire, soit 21 octets par ligne. Les autres
+    colonnes sont relues dans le fichier, uniquement pour les lignes
+    affichées (``rows``). L'index est complété à chaque ``update`` avec les
+    seules lignes ajoutées depuis l'appel précédent.
+    """
+
+    def reset(self) -> None:
+        """Vide l'index et reprend la lecture depuis le début du fichier."""
+        super().reset()
+        self.offsets: array = array('q')  # Position de chaque ligne dans le fichier
+        self.chronons: array = array('i')  # Chronon de chaque ligne
+        self.fish: array = array('i')  # Nombre de poissons de chaque ligne
+        self.sharks: array = array('i')  # Nombre de requins de chaque ligne
+        self.new_simulation: array = array('B')  # 1 si la ligne commence une nouvelle simulation
+
+    def __len__(self) -> int:
+        """Retourne le nombre de lignes indexées."""
+        return len(self.offsets)
+
+    def update(self) -> bool:
+        """
+        Ajoute à l'index les lignes écrites depuis le dernier appel.
+
+        Returns:
+            bool: True si le fichier a été tronqué (l'index a été reconstruit depuis le début)
+        """
+        truncated = False
+        while True:
+            start = self.offset
+            reset, offsets, records = self.read_records()
+            truncated = truncated or reset
+            if records:
+                self.append_records(offsets, records)
+            if self.offset == start:
+                return truncated
+
+    def append_records(self, offsets: List[int], records: List[List[str]]) -> None:
+        """
+        Ajoute à l'index un bloc de lignes lues dans le fichier.
+
+        Args:
+            offsets (List[int]): Position de chaque ligne
+            records (List[List[str]]): Valeurs de chaque ligne
+        """
+        names = self.fieldnames or FIELDNAMES
+        chronons, fish, sharks = (int_column(records, names.index(name))
+                                  for name in ('chronons', 'fish_count', 'shark_count'))
+        self.offsets.extend(offsets)
+        if None in chronons or None in fish or None in sharks:
+            # Valeurs illisibles : traitement ligne par ligne
+            self.new_simulation.extend([self.starts_simulation(value) for value in chronons])
+            self.chronons.extend([value or 0 for value in chronons])
+            self.fish.extend([value or 0 for value in fish])
+            self.sharks.extend([value or 0 for value in sharks])
+            return
+        # Cas courant : une nouvelle simulation commence quand le chronon diminue
+        self.new_simulation.append(self.starts_simulation(chronons[0]))
+        self.new_simulation.extend(map(lt, chronons[1:], chronons[:-1]))
+        self.previous_chronons = chronons[-1]
+        self.chronons.extend(chronons)
+        self.fish.extend(fish)
+        self.sharks.extend(sharks)
+
+    def rows(self, start: int, count: int) -> List[Dict]:
+        """
+        Relit dans le fichier les lignes ``start`` à ``start + count - 1``.
+
+        Args:
+            start (int): Numéro de la première ligne
+            count (int): Nombre de lignes à lire
+
+        Returns:
+            List[Dict]: Lignes lues, avec la clé ``new_simulation``
+        """
+        start = max(0, start)
+        stop = min(len(self), start + count)
+        if start >= stop:
+            return []
+        end = self.offsets[stop] if stop < len(self) else self.offset
+        with open(self.history_file, 'rb') as f:
+            f.seek(self.offsets[start])
+            lines = f.read(end - self.offsets[start]).decode('utf-8').splitlines()
+        rows = []
+        for number, values in zip(range(start, stop), csv.reader(line for line in lines if line)):
+            row = dict(zip(self.fieldnames, values))
+            row['new_simulation'] = bool(self.new_simulation[number])
+            rows.append(row)
+        return rows
+
+    def decimate(self, buckets: int) -> List[Dict]:
+        """
+        Résume l'historique en ``buckets`` tranches de lignes consécutives
+        (minimum, maximum et moyenne des populations de chaque tranche), pour
+        parcourir un très long historique d'un coup d'œil.
+
+        Args:
+            buckets (int): Nombre maximal de tranches
+
+        Returns:
+            List[Dict]: Une entrée par tranche : first, last (numéros de lignes), chronons (premier, dernier),
+                fish et sharks (minimum, moyenne, maximum)
+        """
+        total = len(self)
+        if total == 0 or buckets <= 0:
+            return []
+        size = -(-total // buckets)  # Taille d'une tranche (arrondie au supérieur)
+        summary = []
+        for first in range(0, total, size):
+            last = min(total, first + size) - 1
+            entry = {'first': first, 'last': last,
+                     'chronons': (self.chronons[first], self.chronons[last])}
+            for name, values in (('fish', self.fish), ('sharks', self.sharks)):
+                bucket = values[first:last + 1]
+                entry[name] = (min(bucket), sum(bucket) / len(bucket), max(bucket))
+            summary.append(entry)
+        return summary
+
+
+def int_column(records: List[List[str]], position: int) -> List[Optional[int]]:
+    """
+    Extrait une colonne d'entiers des lignes lues dans le fichier d'historique.
+
+    Args:
+        records (List[List[str]]): Valeurs de chaque ligne
+        position (int): Position de la colonne
+
+    Returns:
+        List[Optional[int]]: Valeur de chaque ligne (None si elle est absente ou illisible)
+    """
+    try:
+        # Cas courant : toutes les valeurs sont lisibles, conversion en une passe
+        return list(map(int, map(itemgetter(position), records)))
+    except (IndexError, ValueError):
+        return [to_int(values[position]) if position < len(values) else None for values in records]
+
+
+def to_int(value: Optional[str]) -> Optional[int]:
+    """
+    Convertit une valeur lue dans le fichier d'historique en entier.
+
+    Args:
+        value (Optional[str]): Valeur lue
+
+    Returns:
+        Optional[int]: Entier, ou None si la valeur est absente ou illisible
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,222 @@
+"""
+Format binaire des points de reprise (checkpoints) de la simulation Wa-Tor.
+
+Un point de reprise contient tout ce qu'il faut pour reprendre une simulation
+exactement où elle s'était arrêtée : les tableaux du stockage (``species``,
+``age``, ``energy``, ``ids``, tels quels, sans créer d'objet Fish/Shark),
+l'état des générateurs aléatoires, le numéro du chronon, les compteurs et les
+paramètres. Structure du fichier :
+
+- préambule de ``PREAMBLE_SIZE`` octets : ``MAGIC``, position et longueur de l'en-tête
+- les tableaux, chacun aligné sur ``ALIGNMENT`` octets, bruts ou compressés (zlib)
+- l'en-tête JSON (à la fin, car il contient la position de chaque tableau)
+
+Les tableaux non compressés sont donc lisibles directement à leur position
+dans le fichier (et projetables en mémoire). Le fichier est écrit sous un nom
+temporaire puis renommé : un arrêt brutal pendant l'écriture laisse intact le
+point de reprise précédent.
+"""
+# Importation des modules nécessaires
+# struct : préambule binaire ; zlib : compression optionnelle des tableaux
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+from aquatic.store import EntityStore
+
+# Signature des fichiers de point de reprise et version du format
+MAGIC: bytes = b"WATORCKP"
+FORMAT_VERSION: int = 1
+# Préambule : signature, position de l'en-tête, longueur de l'en-tête (entiers little-endian)
+PREAMBLE: struct.Struct = struct.Struct("<8sQQ")
+PREAMBLE_SIZE: int = 64
+ALIGNMENT: int = 64  # Alignement de chaque tableau dans le fichier
+CHUNK_BYTES: int = 1 << 22  # Taille des morceaux compressés ou décompressés à la fois
+DEFAULT_COMPRESSION_LEVEL: int = 1  # Niveau zlib : rapide, suffisant pour des grilles très répétitives
+
+# Tableaux du stockage enregistrés, dans l'ordre du fichier
+ARRAYS: Tuple[str, ...] = ("species", "age", "energy", "ids")
+
+
+def _pad(f: BinaryIO) -> None:
+    """Complète le fichier par des zéros jusqu'à la prochaine position alignée."""
+    f.write(bytes(-f.tell() % ALIGNMENT))
+
+
+def typecode_of(data: Any) -> str:
+    """Retourne le code de type d'un tableau du stockage : un array, ou une memoryview
+    au format d'un code de type (mémoire partagée du moteur tiled, voir EntityStore.adopt).
+
+    Args:
+        data (Any): Tableau du stockage
+
+    Returns:
+        str: Code de type ("B", "i" ou "q")
+    """
+    return data.typecode if isinstance(data, array) else data.format
+
+
+def _write_array(f: BinaryIO, data: Any, level: Optional[int]) -> Dict[str, Any]:
+    """Écrit un tableau à la position courante (alignée) du fichier.
+
+    Args:
+        f (BinaryIO): Fichier ouvert en écriture binaire
+        data (Any): Tableau à écrire (voir typecode_of)
+        level (Optional[int]): Niveau de compression zlib, ou None pour écrire les octets bruts
+
+    Returns:
+        Dict[str, Any]: Description du tableau pour l'en-tête (type, nombre d'éléments, position, taille)
+    """
+    raw = memoryview(data).cast("B")
+    offset = f.tell()
+    if level is None:
+        f.write(raw)
+    else:
+        compressor = zlib.compressobj(level)
+        for start in range(0, len(raw), CHUNK_BYTES):
+            f.write(compressor.compress(raw[start:start + CHUNK_BYTES]))
+        f.write(compressor.flush())
+    entry = {"typecode": typecode_of(data), "count": len(data), "offset": offset,
+             "nbytes": f.tell() - offset, "compressed": level is not None}
+    _pad(f)
+    return entry
+
+
+def read_array(f: BinaryIO, entry: Dict[str, Any], target: Any, byteorder: str) -> None:
+    """Lit un tableau du fichier directement dans le tableau cible (sans copie intermédiaire).
+
+    Args:
+        f (BinaryIO): Fichier ouvert en lecture binaire
+        entry (Dict[str, Any]): Description du tableau dans l'en-tête
+        target (Any): Tableau du stockage à remplir (même type et même taille, voir typecode_of)
+        byteorder (str): Ordre des octets de la machine qui a écrit le fichier
+
+    Raises:
+        ValueError: Si le tableau du fichier ne correspond pas au tableau cible
+    """
+    typecode = typecode_of(target)
+    if entry["typecode"] != typecode or entry["count"] != len(target):
+        raise ValueError(f"Tableau incompatible : {entry['count']} x {entry['typecode']!r} "
+                         f"au lieu de {len(target)} x {typecode!r}")
+    out = memoryview(target).cast("B")
+    f.seek(entry["offset"])
+    if not entry["compressed"]:
+        if f.readinto(out) != len(out):
+            raise ValueError("Point de reprise tronqué")
+    else:
+        decompressor = zlib.decompressobj()
+        position = 0
+        remaining = entry["nbytes"]
+        while remaining:
+            chunk = f.read(min(CHUNK_BYTES, remaining))
+            if not chunk:
+                raise ValueError("Point de reprise tronqué")
+            remaining -= len(chunk)
+            data = decompressor.decompress(chunk)
+            out[position:position + len(data)] = data
+            position += len(data)
+        data = decompressor.flush()
+        out[position:position + len(data)] = data
+        position += len(data)
+        if position != len(out):
+            raise ValueError("Point de reprise tronqué")
+    if byteorder != sys.byteorder:
+        # Une memoryview n'a pas de byteswap : les octets passent par un array temporaire
+        swapped = array(typecode, out.tobytes())
+        swapped.byteswap()
+        out[:] = memoryview(swapped).cast("B")
+
+
+def write_checkpoint(path: str, store: EntityStore, state: Dict[str, Any],
+                     compress: bool = False, level: int = DEFAULT_COMPRESSION_LEVEL) -> None:
+    """Écrit un point de reprise.
+
+    Args:
+        path (str): Fichier de sortie (remplacé seulement une fois l'écriture terminée)
+        store (EntityStore): Stockage des entités de la grille
+        state (Dict[str, Any]): État de la simulation hors tableaux (sérialisable en JSON)
+        compress (bool): Compresse les tableaux avec zlib. Defaults to False.
+        level (int): Niveau de compression zlib. Defaults to DEFAULT_COMPRESSION_LEVEL.
+    """
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as f:
+        f.write(bytes(PREAMBLE_SIZE))
+        arrays = {name: _write_array(f, getattr(store, name), level if compress else None) for name in ARRAYS}
+        header = dict(state, format=FORMAT_VERSION, byteorder=sys.byteorder,
+                      point_x=store.point_x, point_y=store.point_y, arrays=arrays)
+        encoded = json.dumps(header).encode("utf-8")
+        header_offset = f.tell()
+        f.write(encoded)
+        f.seek(0)
+        f.write(PREAMBLE.pack(MAGIC, header_offset, len(encoded)))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+
+
+def read_header(f: BinaryIO) -> Dict[str, Any]:
+    """Lit l'en-tête d'un point de reprise.
+
+    Args:
+        f (BinaryIO): Fichier ouvert en lecture binaire
+
+    Returns:
+        Dict[str, Any]: En-tête (état de la simulation, dimensions, description des tableaux)
+
+    Raises:
+        ValueError: Si le fichier n'est pas un point de reprise ou si sa version n'est pas prise en charge
+    """
+    f.seek(0)
+    preamble = f.read(PREAMBLE.size)
+    if len(preamble) != PREAMBLE.size:
+        raise ValueError("Fichier trop court pour être un point de reprise")
+    magic, header_offset, header_length = PREAMBLE.unpack(preamble)
+    if magic != MAGIC:
+        raise ValueError("Ce fichier n'est pas un point de reprise Wa-Tor")
+    f.seek(header_offset)
+    header = json.loads(f.read(header_length).decode("utf-8"))
+    if header["format"] != FORMAT_VERSION:
+        raise ValueError(f"Version de point de reprise non prise en charge : {header['format']}")
+    return header
+
+
+def read_arrays(f: BinaryIO, header: Dict[str, Any], store: EntityStore) -> None:
+    """Lit les tableaux d'un point de reprise dans le stockage d'une grille de même taille.
+    Les compteurs de population sont recalculés et toute la grille est à redessiner.
+
+    Args:
+        f (BinaryIO): Fichier ouvert en lecture binaire
+        header (Dict[str, Any]): En-tête lu par read_header
+        store (EntityStore): Stockage à remplir
+    """
+    for name in ARRAYS:
+        read_array(f, header["arrays"][name], getattr(store, name), header["byteorder"])
+    store.recount()
+    store.mark_all_dirty()
+
+
+def random_state_to_json(state: Tuple) -> list:
+    """Convertit l'état d'un random.Random (getstate) en valeur JSON."""
+    version, internal, gauss_next = state
+    return [version, list(internal), gauss_next]
+
+
+def random_state_from_json(value: list) -> Tuple:
+    """Reconstruit l'état d'un random.Random (setstate) à partir de sa valeur JSON."""
+    version, internal, gauss_next = value
+    return version, tuple(internal), gauss_next
+
+
+def stream_state_to_json(state: Tuple) -> list:
+    """Convertit l'état d'un RandomStream (getstate) en valeur JSON."""
+    block_state, position = state
+    return [random_state_to_json(block_state), position]
+
+
+def stream_state_from_json(value: list) -> Tuple:
+    """Reconstruit l'état d'un RandomStream (setstate) à partir de sa valeur JSON."""
+    block_state, position = value
+    return random_state_from_json(block_state), position
@@ -1,31 +1,82 @@
 import random
-import os
-import csv
-from typing import List, Set, Tuple, Optional, Any
+import time
+from array import array
+from typing import Any, Dict, List, Optional, Set, Tuple
 from aquatic.fish import Fish
 from aquatic.shark import Shark
+from aquatic.store import EntityStore, EMPTY, FISH, SHARK, MOVES
 from history import SimulationHistory
-from datetime import datetime
+from interface import checkpoint
+from interface.instrumentation import Instrumentation
+from interface.recording import TrajectoryRecorder, DEFAULT_KEYFRAME_INTERVAL
+from interface.neighborhood import (NEIGHBORHOODS, VON_NEUMANN, directions_of, neighbor_index, sublattice_count,
+                                    sublattice_of)
+from interface.numpy_engine import VectorizedOcean
+from interface.random_stream import RandomStream
+from interface.synchronous import SynchronousUpdate
+from interface.tiled_engine import TiledOcean, tile_bounds
+from interface.renderer import LabelRenderer
 
-# Variables globales pour la gestion de la grille et de la simulation
-_grid_instance: Optional['Grid'] = None  # Instance unique de la grille (pattern Singleton)
-turn_count: int = 0  # Compteur de tours de simulation
-simulation_running: bool = False  # État de la simulation (en cours ou arrêtée)
+# Constantes du module (tout l'état d'une simulation appartient à son instance de Grid,
+# plusieurs grilles peuvent donc tourner dans le même processus)
+ENGINES: Tuple[str, ...] = ("objects", "numpy", "tiled")  # Moteurs de simulation disponibles
+SCHEDULES: Tuple[str, ...] = ("shuffle", "sublattice", "synchronous")  # Ordonnancements des entités dans un chronon
+SPECIES_CLASSES: Tuple[Optional[type], ...] = (None, Fish, Shark)  # Classe de chaque code d'espèce
+FISH_RATIO: float = 0.7  # Proportion initiale de poissons
+SHARK_RATIO: float = 0.1  # Proportion initiale de requins
+# Rythme de la simulation dans l'interface graphique (voir Grid.run_simulation)
+STEP_DELAY_MS: int = 500  # Délai entre deux chronons en mode normal
+TURBO_FPS: int = 25  # Images par seconde visées en mode turbo
+TURBO_BUSY_RATIO: float = 0.75  # Part de chaque image consacrée au calcul des chronons en mode turbo
+
+class CellColumn:
+    """Colonne ``cells[x]`` de la grille : vue sur le stockage des entités.
+    ``cells[x][y]`` retourne une vue Fish/Shark (ou None) et ``cells[x][y] = entité``
+    place l'entité dans la cellule."""
+
+    def __init__(self, grid: 'Grid', x: int) -> None:
+        """Initialise la vue sur la colonne x.
+
+        Args:
+            grid (Grid): Grille de simulation
+            x (int): Coordonnée x de la colonne
+        """
+        self.grid: 'Grid' = grid
+        self.x: int = x
+
+    def __getitem__(self, y: int) -> Optional[Fish]:
+        return self.grid.entity_at(self.x, y)
+
+    def __setitem__(self, y: int, entity: Optional[Fish]) -> None:
+        self.grid.put_entity(self.x, y, entity)
+
+    def __len__(self) -> int:
+        return self.grid.point_y
+
+    def __iter__(self):
+        return (self.grid.entity_at(self.x, y) for y in range(self.grid.point_y))
+
+
+class CellMatrix:
+    """Matrice ``cells`` de la grille, compatible avec l'ancienne liste de listes."""
+
+    def __init__(self, grid: 'Grid') -> None:
+        """Initialise la vue sur toutes les colonnes de la grille.
+
+        Args:
+            grid (Grid): Grille de simulation
+        """
+        self.columns: List[CellColumn] = [CellColumn(grid, x) for x in range(grid.point_x)]
+
+    def __getitem__(self, x: int) -> CellColumn:
+        return self.columns[x]
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __iter__(self):
+        return iter(self.columns)
 
-def get_grid_instance(point_x: Optional[int] = None, point_y: Optional[int] = None) -> Optional['Grid']:
-    """Retourne l'instance unique de la grille (pattern Singleton).
-    
-    Args:
-        point_x (Optional[int]): Largeur de la grille si création d'une nouvelle instance
-        point_y (Optional[int]): Hauteur de la grille si création d'une nouvelle instance
-        
-    Returns:
-        Optional[Grid]: L'instance unique de la grille, ou None si les dimensions ne sont pas fournies
-    """
-    global _grid_instance
-    if _grid_instance is None and point_x is not None and point_y is not None:
-        _grid_instance = Grid(point_x, point_y)
-    return _grid_instance
 
 class Grid:
     """Classe représentant la grille de simulation Wa-Tor.
@@ -36,21 +87,121 @@ class Grid:
     - La simulation
     - L'affichage
     - La sauvegarde de l'historique
+
+    L'état des entités est rangé dans un stockage compact indexé par cellule
+    (``self.store``, voir aquatic/store.py) ; ``cells[x][y]`` en donne une vue
+    Fish/Shark pour l'API historique.
+
+    Trois moteurs de simulation sont disponibles :
+    - ``"objects"`` : chaque entité joue à tour de rôle via les méthodes de Fish/Shark (moteur d'origine)
+    - ``"numpy"`` : le stockage est vu comme des tableaux NumPy et chaque chronon
+      est résolu par lots (voir interface/numpy_engine.py)
+    - ``"tiled"`` : comme ``"numpy"``, mais le tore est découpé en bandes jouées en
+      parallèle par un pool de processus (voir interface/tiled_engine.py)
+
+    Deux ordonnancements des entités dans un chronon sont disponibles, pour tous les moteurs :
+    - ``"shuffle"`` : ordre aléatoire global, tiré à chaque chronon (règle d'origine)
+    - ``"sublattice"`` : les cellules sont réparties en SUBLATTICES sous-réseaux de couleur
+      ``(x + 2 * y) % 5`` ; les sous-réseaux jouent l'un après l'autre, dans un ordre tiré à
+      chaque chronon. Si la largeur et la hauteur sont des multiples de 5, deux entités d'un
+      même sous-réseau n'ont aucun voisin commun : elles sont indépendantes et peuvent jouer
+      ensemble, sans conflit. Sinon, les entités de chaque sous-réseau jouent dans un ordre
+      mélangé et les conflits au bord du tore sont résolus au hasard (voir le README pour les
+      différences statistiques avec l'ordre aléatoire global)
+
+    Deux voisinages sont disponibles, pour tous les moteurs (voir interface/neighborhood.py) :
+    - ``"von_neumann"`` : les 4 cellules adjacentes (règle d'origine)
+    - ``"moore"`` : les 8 cellules adjacentes, diagonales comprises (neuf sous-réseaux
+      ``(x % 3) + 3 * (y % 3)`` pour l'ordonnancement ``"sublattice"``)
     """
     
-    def __init__(self, point_x: int, point_y: int) -> None:
+    def __init__(self, point_x: int, point_y: int, engine: str = "objects", seed: Optional[int] = None,
+                 debug: bool = False, processes: Optional[int] = None, schedule: str = "shuffle",
+                 neighborhood: str = VON_NEUMANN) -> None:
         """Initialise la grille avec les dimensions spécifiées.
         
         Args:
             point_x (int): Largeur de la grille
             point_y (int): Hauteur de la grille
+            engine (str, optional): Moteur de simulation ("objects", "numpy" ou "tiled"). Defaults to "objects".
+            seed (Optional[int], optional): Graine du générateur aléatoire de la grille.
+                Une même graine et les mêmes paramètres donnent la même simulation. Defaults to None.
+            debug (bool, optional): Vérifie les compteurs de population par un parcours
+                complet de la grille après chaque chronon. Defaults to False.
+            processes (Optional[int], optional): Nombre de processus du moteur "tiled"
+                (tous les cœurs par défaut, 1 pour tout jouer dans le processus courant). Defaults to None.
+            schedule (str, optional): Ordonnancement des entités ("shuffle", "sublattice" ou "synchronous",
+                ce dernier pour le moteur objet uniquement). Defaults to "shuffle".
+            neighborhood (str, optional): Voisinage des cellules ("von_neumann" ou "moore").
+                Defaults to "von_neumann".
+
+        Raises:
+            ValueError: Si le moteur, l'ordonnancement ou le voisinage demandé n'existe pas
         """
+        if engine not in ENGINES:
+            raise ValueError(f"Moteur inconnu : {engine!r} (choix possibles : {', '.join(ENGINES)})")
+        if schedule not in SCHEDULES:
+            raise ValueError(f"Ordonnancement inconnu : {schedule!r} (choix possibles : {', '.join(SCHEDULES)})")
+        if schedule == "synchronous" and engine != "objects":
+            raise ValueError(f"L'ordonnancement 'synchronous' n'est disponible qu'avec le moteur 'objects' "
+                             f"(moteur demandé : {engine!r})")
+        if neighborhood not in NEIGHBORHOODS:
+            raise ValueError(f"Voisinage inconnu : {neighborhood!r} (choix possibles : {', '.join(NEIGHBORHOODS)})")
         self.point_x: int = point_x  # Largeur de la grille
         self.point_y: int = point_y  # Hauteur de la grille
-        # Initialisation de la grille avec des cellules vides (None)
-        self.cells: List[List[Optional[Any]]] = [[None for _ in range(point_y)] for _ in range(point_x)]
+        self.engine: str = engine  # Moteur de simulation utilisé
+        self.schedule: str = schedule  # Ordonnancement des entités dans un chronon
+        self.neighborhood: str = neighborhood  # Voisinage des cellules
+        # Table des voisins de chaque cellule (moteur objet), construite à la première utilisation
+        self._neighbors: Optional[array] = None
+        self.neighbor_count: int = len(directions_of(neighborhood))  # Nombre de voisins d'une cellule
+        self.debug: bool = debug  # Vérification des compteurs après chaque chronon
+        # Stockage compact de toutes les entités, initialement vide
+        self.store: EntityStore = EntityStore(point_x, point_y)
+        self._cells: CellMatrix = CellMatrix(self)  # Vue cells[x][y] sur le stockage
+        # Vues Fish/Shark libérées à la fin d'un chronon, réutilisées par Fish.view (une liste par espèce)
+        self.view_pool: Tuple[List[Any], ...] = ([], [], [])
+        # Générateur aléatoire propre à la grille : tous les tirages (placement, ordre de jeu,
+        # déplacements, naissances) en dépendent, le module random global n'est jamais utilisé
+        self.seed: Optional[int] = seed  # Graine de la simulation
+        self.rng: random.Random = random.Random(seed)
+        # Moteur vectorisé, uniquement pour les moteurs "numpy" et "tiled"
+        # (sa graine est tirée du générateur de la grille)
+        self.ocean: Optional[VectorizedOcean] = None
+        # Tirages par blocs du moteur objet (ordre de jeu, déplacements, naissances),
+        # graine tirée elle aussi du générateur de la grille
+        self.stream: Optional[RandomStream] = None
+        # Chronon synchrone à double tampon (ordonnancement "synchronous")
+        self.synchronous: Optional[SynchronousUpdate] = None
+        if engine == "numpy":
+            self.ocean = VectorizedOcean(self.store, self.rng.getrandbits(64), schedule=schedule,
+                                         neighborhood=neighborhood)
+        elif engine == "tiled":
+            self.ocean = TiledOcean(self.store, self.rng.getrandbits(64), processes=processes, schedule=schedule,
+                                    neighborhood=neighborhood)
+        else:
+            # Moteur objet : les cellules occupées sont indexées, un chronon coûte O(population)
+            self.store.index_occupancy()
+            self.stream = RandomStream(self.rng.getrandbits(64))
+            if schedule == "synchronous":
+                self.synchronous = SynchronousUpdate(self.store, self.stream, neighborhood)
         self.cell_labels: Optional[List[List[Any]]] = None  # Labels pour l'interface graphique
-        self.history: SimulationHistory = SimulationHistory()  # Instance de l'historique
+        self.renderer: Optional[Any] = None  # Rendu graphique (LabelRenderer ou PixelRenderer)
+        # Historique CSV, branché par l'interface graphique (main.py) : sans historique, simulate_step
+        # n'écrit rien (grilles headless, mesures, balayages, tests)
+        self.history: Optional[SimulationHistory] = None
+        # Paramètres du dernier remplissage (réutilisés après une extinction)
+        self.population_parameters: Dict[str, Any] = {}
+        # Mesure des phases et des événements de chaque chronon (inactive sans observateur)
+        self.instrumentation: Instrumentation = Instrumentation()
+        # Enregistrement de la trajectoire (voir start_recording), inactif par défaut
+        self.recorder: Optional[TrajectoryRecorder] = None
+        self.turn_count: int = 0  # Compteur de tours de simulation
+        self.running: bool = False  # État de la simulation (en cours ou arrêtée)
+        # Mode turbo de l'interface : les chronons s'enchaînent sans délai, l'image est redessinée
+        # TURBO_FPS fois par seconde au plus (voir run_simulation)
+        self.turbo: bool = False
+        self.steps_per_tick: Optional[int] = None  # Chronons par image en mode turbo (None : selon le temps)
 
     def set_cell_labels(self, labels: List[List[Any]]) -> None:
         """Définit les labels de la grille pour l'interface graphique.
@@ -58,39 +209,130 @@ class Grid:
         Args:
             labels (List[List[Any]]): Matrice de labels pour l'interface graphique
         """
+        self.set_renderer(LabelRenderer(labels))
         self.cell_labels = labels
 
+    def set_renderer(self, renderer: Any) -> None:
+        """Définit le rendu graphique de la grille (voir interface/renderer.py).
+
+        Args:
+            renderer (Any): Objet disposant d'une méthode draw(grid, cells)
+        """
+        self.renderer = renderer
+        # Le stockage note désormais les cellules modifiées ; le prochain dessin est complet
+        self.store.track_changes = True
+        self.store.mark_all_dirty()
+
+    def draw(self) -> None:
+        """Dessine la grille avec le rendu graphique branché, s'il y en a un.
+        Seules les cellules modifiées depuis le dernier dessin sont redessinées."""
+        if self.renderer is not None:
+            self.renderer.draw(self, self.store.take_dirty())
+
+    @property
+    def cells(self) -> CellMatrix:
+        """Matrice des cellules : ``cells[x][y]`` est une vue Fish/Shark, ou None si la cellule est vide."""
+        return self._cells
+
+    @cells.setter
+    def cells(self, matrix: List[List[Optional[Fish]]]) -> None:
+        # Compatibilité : affecter une liste de listes remplace tout le contenu de la grille
+        entities = [(x, y, matrix[x][y]) for x in range(self.point_x) for y in range(self.point_y)
+                    if matrix[x][y] is not None]
+        self.store.clear_all()
+        for x, y, entity in entities:
+            self.put_entity(x, y, entity)
+
+    def entity_at(self, x: int, y: int) -> Optional[Fish]:
+        """Retourne une vue sur l'entité présente dans une cellule.
+
+        Args:
+            x (int): Coordonnée x de la cellule
+            y (int): Coordonnée y de la cellule
+
+        Returns:
+            Optional[Fish]: Vue Fish ou Shark sur l'entité, ou None si la cellule est vide
+        """
+        kind = SPECIES_CLASSES[self.store.species[self.store.index(x, y)]]
+        return None if kind is None else kind.view(self, x, y)
+
+    def put_entity(self, x: int, y: int, entity: Optional[Fish]) -> None:
+        """Place une entité dans une cellule (ou vide la cellule si entity vaut None).
+        L'état de l'entité (âge, énergie, ID) est recopié depuis sa position actuelle.
+
+        Args:
+            x (int): Coordonnée x de la cellule
+            y (int): Coordonnée y de la cellule
+            entity (Optional[Fish]): Entité à placer, ou None pour vider la cellule
+        """
+        cell = self.store.index(x, y)
+        if entity is None:
+            self.store.clear(cell)
+        elif entity.alive:
+            self.store.move(entity.cell, cell)
+        else:
+            # Entité détachée de la grille : elle est replacée avec un état neuf
+            self.store.place(cell, entity.SPECIES, 0, 0, entity.id)
+
     def populate_grid(self, fish_reproduction_time: int = 5, shark_reproduction_time: int = 5,
-                     shark_initial_energy: int = 30) -> None:
+                     shark_initial_energy: int = 30, fish_ratio: float = FISH_RATIO,
+                     shark_ratio: float = SHARK_RATIO, shark_energy_from_fish: int = 15) -> None:
         """Remplit la grille avec des requins et des poissons selon des proportions définies.
+        Les paramètres sont conservés : la grille est remplie à l'identique après une extinction.
         
         Args:
             fish_reproduction_time (int): Temps nécessaire pour la reproduction des poissons
             shark_reproduction_time (int): Temps nécessaire pour la reproduction des requins
             shark_initial_energy (int): Énergie initiale des requins
+            fish_ratio (float, optional): Proportion initiale de cellules occupées par des poissons. Defaults to 0.7.
+            shark_ratio (float, optional): Proportion initiale de cellules occupées par des requins. Defaults to 0.1.
+            shark_energy_from_fish (int, optional): Énergie gagnée par un requin en mangeant un poisson. Defaults to 15.
+
+        Raises:
+            ValueError: Si les proportions sont négatives ou dépassent la grille
         """
+        if fish_ratio < 0 or shark_ratio < 0 or fish_ratio + shark_ratio > 1:
+            raise ValueError(f"Proportions invalides : {fish_ratio} poissons, {shark_ratio} requins")
+        self.population_parameters = dict(fish_reproduction_time=fish_reproduction_time,
+                                          shark_reproduction_time=shark_reproduction_time,
+                                          shark_initial_energy=shark_initial_energy,
+                                          fish_ratio=fish_ratio, shark_ratio=shark_ratio,
+                                          shark_energy_from_fish=shark_energy_from_fish)
+        # Paramètres des espèces, partagés par toutes les entités et par tous les moteurs
+        self.store.energy_from_fish = shark_energy_from_fish
+        self.store.reproduction_time[FISH] = fish_reproduction_time
+        self.store.reproduction_time[SHARK] = shark_reproduction_time
+        if self.ocean is not None:
+            self.ocean.populate(fish_reproduction_time, shark_reproduction_time, shark_initial_energy,
+                                fish_ratio, shark_ratio)
+            return
+
         # Calcul du nombre total de cellules et des proportions
         total_cells: int = self.point_x * self.point_y
-        num_sharks: int = int(total_cells * 0.1)  # 10% de requins
-        num_fish: int = int(total_cells * 0.7)    # 70% de poissons
+        num_sharks: int = int(total_cells * shark_ratio)  # 10% de requins par défaut
+        num_fish: int = int(total_cells * fish_ratio)    # 70% de poissons par défaut
         total_entities: int = num_sharks + num_fish
         
         # Création et mélange de toutes les positions possibles
         all_positions: List[Tuple[int, int]] = [(x, y) for x in range(self.point_x) for y in range(self.point_y)]
-        random.shuffle(all_positions)
+        self.rng.shuffle(all_positions)
         
-        # Placement des requins
+        # Placement des requins (chaque requin se place lui-même dans le stockage)
         for i in range(num_sharks):
             x, y = all_positions[i]
-            shark = Shark(grid=self, x=x, y=y, shark_energy=shark_initial_energy, 
-                         shark_reproduction_time=shark_reproduction_time)
-            self.cells[x][y] = shark
+            Shark(grid=self, x=x, y=y, shark_energy=shark_initial_energy)
         
         # Placement des poissons
         for i in range(num_sharks, total_entities):
             x, y = all_positions[i]
-            fish = Fish(grid=self, x=x, y=y, reproduction_time=fish_reproduction_time, alive=True)
-            self.cells[x][y] = fish
+            Fish(grid=self, x=x, y=y, alive=True)
+
+    def clear_cells(self) -> None:
+        """Vide toutes les cellules de la grille, quel que soit le moteur."""
+        if self.ocean is not None:
+            self.ocean.clear()
+        else:
+            self.store.clear_all()
 
     def empty(self, x: int, y: int) -> bool:
         """Vérifie si une cellule est vide et dans les limites de la grille.
@@ -102,7 +344,8 @@ class Grid:
         Returns:
             bool: True si la cellule est vide et dans les limites, False sinon
         """
-        return 0 <= x < self.point_x and 0 <= y < self.point_y and self.cells[x][y] is None
+        return (0 <= x < self.point_x and 0 <= y < self.point_y
+                and self.store.species[self.store.index(x, y)] == EMPTY)
 
     def __str__(self) -> str:
         """Retourne une représentation textuelle de la grille avec des emojis.
@@ -110,19 +353,27 @@ class Grid:
         Returns:
             str: Représentation textuelle de la grille
         """
+        symbols = {None: ". ", Fish: "🐟 ", Shark: "🦈 "}
         grid_representation = ""
-        for row in self.cells:
+        for x in range(self.point_x):
             row_rep = ""
-            for cell in row:
-                if cell is None:
-                    row_rep += ". "  # Cellule vide
-                elif isinstance(cell, Fish):
-                    row_rep += "🐟 "  # Poisson
-                elif isinstance(cell, Shark):
-                    row_rep += "🦈 "  # Requin
+            for y in range(self.point_y):
+                row_rep += symbols[self.kind_at(x, y)]
             grid_representation += row_rep + "\n"
         return grid_representation
 
+    def kind_at(self, x: int, y: int) -> Optional[type]:
+        """Retourne l'espèce présente dans une cellule, quel que soit le moteur.
+
+        Args:
+            x (int): Coordonnée x de la cellule
+            y (int): Coordonnée y de la cellule
+
+        Returns:
+            Optional[type]: Fish, Shark, ou None si la cellule est vide
+        """
+        return SPECIES_CLASSES[self.store.species[self.store.index(x, y)]]
+
     def move_entity(self, entity: Any, x: int, y: int, nx: int, ny: int, already_moved: Set[Tuple[int, int]]) -> None:
         """Déplace une entité d'une position à une autre sur la grille.
         
@@ -140,25 +391,44 @@ class Grid:
             
         # Convertir les nouvelles coordonnées en coordonnées toroidales
         toroidal_nx, toroidal_ny = self.get_toroidal_coords(nx, ny)
-        # Déplacer l'entité
-        self.cells[toroidal_nx][toroidal_ny] = self.cells[x][y]
-        self.cells[x][y] = None
+        # Déplacer l'entité dans le stockage
+        self.store.events[MOVES] += 1
+        self.store.move(self.store.index(x, y), self.store.index(toroidal_nx, toroidal_ny))
         # Mettre à jour les coordonnées de l'entité
         entity.x, entity.y = toroidal_nx, toroidal_ny
         # Marquer la nouvelle position comme déjà déplacée
         already_moved.add((toroidal_nx, toroidal_ny))
 
+    @property
+    def fish_count(self) -> int:
+        """Nombre de poissons vivants, tenu à jour à chaque naissance et à chaque mort (O(1))."""
+        return self.store.counts[FISH]
+
+    @property
+    def shark_count(self) -> int:
+        """Nombre de requins vivants, tenu à jour à chaque naissance et à chaque mort (O(1))."""
+        return self.store.counts[SHARK]
+
     def count_entities(self) -> Tuple[int, int]:
-        """Compte le nombre de poissons et de requins dans la grille.
+        """Retourne le nombre de poissons et de requins dans la grille, sans parcourir la grille.
         
         Returns:
             Tuple[int, int]: Nombre de poissons et nombre de requins
         """
-        # Compte les poissons (en excluant les requins qui héritent de Fish)
-        fish_count = sum(isinstance(cell, Fish) and not isinstance(cell, Shark) for row in self.cells for cell in row)
-        # Compte les requins
-        shark_count = sum(isinstance(cell, Shark) for row in self.cells for cell in row)
-        return fish_count, shark_count
+        return self.fish_count, self.shark_count
+
+    def check_counts(self) -> None:
+        """Compare les compteurs incrémentaux avec un parcours complet de la grille (mode debug).
+
+        Raises:
+            RuntimeError: Si les compteurs ne correspondent pas au contenu de la grille
+        """
+        scanned = (self.store.scan(FISH), self.store.scan(SHARK))
+        if scanned != self.count_entities():
+            raise RuntimeError(f"Compteurs de population incohérents au tour {self.turn_count} : "
+                               f"{self.count_entities()} au lieu de {scanned} (poissons, requins)")
+        if self.store.track_occupancy and self.store.occupied != self.store.scan_occupied():
+            raise RuntimeError(f"Index des cellules occupées incohérent au tour {self.turn_count}")
 
     def update_info(self, label: Any) -> None:
         """Met à jour les informations affichées dans l'interface.
@@ -167,107 +437,197 @@ class Grid:
             label (Any): Label à mettre à jour
         """
         fish_count, shark_count = self.count_entities()
-        label.config(text=f"Tour : {turn_count}   🐟 Poissons : {fish_count}   🦈 Requins : {shark_count}")
+        label.config(text=f"Tour : {self.turn_count}   🐟 Poissons : {fish_count}   🦈 Requins : {shark_count}")
 
     def draw_grid_emojis(self) -> None:
-        """Dessine la grille avec des emojis colorés dans l'interface graphique."""
-        for x in range(self.point_x):
-            for y in range(self.point_y):
-                cell = self.cells[x][y]
-                if cell is None:
-                    # Eau (bleu océan)
-                    self.cell_labels[x][y].config(text="🌊", fg="#1E90FF", bg="white")
-                elif isinstance(cell, Shark):
-                    # Requin (rouge-orange)
-                    self.cell_labels[x][y].config(text="🦈", fg="#FF4500", bg="white")
-                elif isinstance(cell, Fish) and not isinstance(cell, Shark):
-                    # Poisson (vert)
-                    self.cell_labels[x][y].config(text="🐟", fg="#32CD32", bg="white")
-
-    def simulate_step(self, info_label: Any) -> bool:
+        """Dessine la grille avec des emojis colorés dans l'interface graphique.
+        Conservée pour compatibilité : dessine avec le rendu branché (voir draw)."""
+        self.draw()
+
+    def advance(self) -> Tuple[int, int]:
+        """Fait avancer la simulation d'un chronon, sans affichage ni écriture de l'historique.
+        C'est la seule méthode utilisée par le mode headless (wator/headless.py).
+
+        Returns:
+            Tuple[int, int]: Nombre de poissons et de requins après le chronon
+        """
+        instrumentation = self.instrumentation
+        recording = instrumentation.begin(self.turn_count + 1, self.engine, self.store.events)
+        try:
+            if self.ocean is not None:
+                # Moteur vectorisé : tout le chronon est résolu par lots
+                with instrumentation.phase("engine"):
+                    self.ocean.step()
+            else:
+                self.step_objects()
+            self.turn_count += 1
+            if self.debug:
+                with instrumentation.phase("checks"):
+                    self.check_counts()
+            if self.recorder is not None:
+                with instrumentation.phase("record"):
+                    self.recorder.record(self.turn_count, self.store.species)
+            counts = self.count_entities()
+            if recording:
+                instrumentation.end(self.store.events, *counts)
+            return counts
+        finally:
+            if recording:
+                # Relevé abandonné si le chronon a été interrompu (sinon déjà terminé par end)
+                instrumentation.abort()
+
+    def simulate_step(self, info_label: Any = None, redraw: bool = True) -> bool:
         """Exécute un tour de simulation.
         
         Args:
-            info_label (Any): Label pour afficher les informations
+            info_label (Any, optional): Label pour afficher les informations. Defaults to None.
+            redraw (bool, optional): Redessine la grille et les informations après le chronon
+                (False en mode turbo, qui redessine à son propre rythme). Defaults to True.
             
         Returns:
             bool: True si la simulation continue, False si elle est terminée
         """
-        global turn_count
-        already_moved: Set[Tuple[int, int]] = set()
+        instrumentation = self.instrumentation
+        recording = instrumentation.begin(self.turn_count + 1, self.engine, self.store.events)
+        try:
+            fish_count, shark_count = self.advance()
+
+            # Mise à jour de l'affichage (uniquement si l'interface graphique est branchée)
+            if redraw:
+                with instrumentation.phase("render"):
+                    self.draw()
+                if info_label is not None:
+                    with instrumentation.phase("info"):
+                        self.update_info(info_label)
         
-        # Mélanger toutes les entités pour un ordre aléatoire
-        entities = [self.cells[x][y] for x in range(self.point_x) for y in range(self.point_y) 
-                   if isinstance(self.cells[x][y], Shark) or (isinstance(self.cells[x][y], Fish) and not isinstance(self.cells[x][y], Shark))]
-        random.shuffle(entities)
-
-        # Traiter chaque entité
-        for entity in entities:
-            if entity is None:
-                continue
-            x, y = entity.x, entity.y
-            if (x, y) in already_moved:
-                continue
-            if isinstance(entity, Shark):
-                entity.handle_shark(x, y, already_moved)
-            elif isinstance(entity, Fish) and not isinstance(entity, Shark):
-                entity.handle_fish(self, x, y, already_moved)
-
-        # Mise à jour du compteur de tours et de l'affichage
-        turn_count += 1
-        self.draw_grid_emojis()
-        self.update_info(info_label)
+            # Sauvegarde de l'historique (mise en attente, écrite par lots)
+            if self.history is not None:
+                with instrumentation.phase("history"):
+                    self.history.record(self.turn_count, fish_count, shark_count)
         
-        # Sauvegarde de l'historique
-        history_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'simulation_history.csv')
-        try:
-            # Vérifier si le fichier existe déjà
-            file_exists = os.path.exists(history_file)
-            
-            with open(history_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                # Écrire l'en-tête si le fichier est nouveau
-                if not file_exists:
-                    writer.writerow(['date', 'chronons', 'fish_count', 'shark_count'])
-                # Écrire les données
-                fish_count, shark_count = self.count_entities()
-                writer.writerow([
-                    datetime.now().isoformat(),
-                    turn_count,
-                    fish_count,
-                    shark_count
-                ])
-        except Exception as e:
-            print(f"Erreur lors de la sauvegarde de l'historique : {e}")
+            # Vérifier si la simulation est terminée (plus de poissons ET plus de requins)
+            running = True
+            if fish_count == 0 and shark_count == 0:
+                self.running = False
+                with instrumentation.phase("reset"):
+                    if self.history is not None:
+                        self.history.flush()
+
+                    # Réinitialiser la grille pour une nouvelle partie
+                    self.clear_cells()
+                    self.populate_grid(**self.population_parameters)
+                    self.draw()
+                self.turn_count = 0  # Réinitialiser le compteur
+                if self.recorder is not None:
+                    self.recorder.record(self.turn_count, self.store.species)
+                running = False
+            if recording:
+                instrumentation.end(self.store.events, fish_count, shark_count)
+            return running
+        finally:
+            if recording:
+                instrumentation.abort()
+
+    def step_objects(self) -> None:
+        """Fait jouer chaque entité (moteur objet) dans un ordre aléatoire,
+        ou sous-réseau par sous-réseau avec l'ordonnancement "sublattice",
+        ou toutes ensemble sur l'état précédent avec l'ordonnancement "synchronous"."""
+        instrumentation = self.instrumentation
+        if self.synchronous is not None:
+            # Lecture de l'état précédent, écriture dans le second tampon (interface/synchronous.py)
+            with instrumentation.phase("update"):
+                self.synchronous.step()
+            return
+        already_moved: Set[Tuple[int, int]] = set()
         
-        # Vérifier si la simulation est terminée (plus de poissons ET plus de requins)
-        fish_count, shark_count = self.count_entities()
-        if fish_count == 0 and shark_count == 0:
-            global simulation_running
-            simulation_running = False
-            
-            # Réinitialiser la grille pour une nouvelle partie
-            self.cells = [[None for _ in range(self.point_y)] for _ in range(self.point_x)]
-            self.populate_grid()
-            self.draw_grid_emojis()
-            turn_count = 0  # Réinitialiser le compteur
-            return False
-        return True
+        # Mélanger toutes les entités pour un ordre aléatoire
+        with instrumentation.phase("collect"):
+            # Les entités sont lues dans l'index des cellules occupées (sans balayer la grille),
+            # dans l'ordre des cellules avant le mélange
+            species = self.store.species
+            entities = [SPECIES_CLASSES[species[cell]].view(self, *divmod(cell, self.point_y))
+                        for cell in self.store.occupied_cells()]
+        with instrumentation.phase("shuffle"):
+            self.stream.shuffle(entities)
+            if self.schedule == "sublattice":
+                # Les entités de chaque sous-réseau, indépendantes entre elles, jouent ensemble, dans
+                # l'ordre mélangé : si la taille de la grille n'est pas un multiple du nombre de couleurs,
+                # les conflits au bord du tore ne favorisent pas les plus petits indices
+                count = sublattice_count(self.neighborhood)
+                sublattices: List[List[Fish]] = [[] for _ in range(count)]
+                for entity in entities:
+                    sublattices[sublattice_of(entity.x, entity.y, self.neighborhood)].append(entity)
+                order = list(range(count))
+                self.stream.shuffle(order)
+                entities = [entity for color in order for entity in sublattices[color]]
+
+        # Traiter chaque entité encore vivante
+        with instrumentation.phase("update"):
+            for entity in entities:
+                x, y = entity.x, entity.y
+                if (x, y) in already_moved or not entity.alive:
+                    continue
+                if isinstance(entity, Shark):
+                    entity.handle_shark(x, y, already_moved)
+                elif isinstance(entity, Fish) and not isinstance(entity, Shark):
+                    entity.handle_fish(self, x, y, already_moved)
+            # Les vues de ce chronon ne servent plus : elles sont gardées pour le suivant
+            pools = self.view_pool
+            for entity in entities:
+                pools[entity.SPECIES].append(entity)
 
     def run_simulation(self, root: Any, button: Any, info_label: Any) -> None:
         """Lance la simulation en boucle avec un délai de 500ms entre chaque tour.
+        En mode turbo (``turbo``), chaque passage joue autant de chronons que possible
+        pendant une partie de l'image (ou ``steps_per_tick`` chronons), redessine une seule
+        fois, puis rend la main à Tkinter : le bouton d'arrêt reste réactif et la vitesse
+        ne dépend plus que de la machine.
         
         Args:
             root (Any): Fenêtre principale
             button (Any): Bouton de contrôle
             info_label (Any): Label d'information
         """
-        if simulation_running:
-            if not self.simulate_step(info_label):
+        if self.running:
+            start = time.perf_counter()
+            running = self.run_turbo(info_label) if self.turbo else self.simulate_step(info_label)
+            if not running:
                 # Si la simulation est terminée
                 button.config(text="Lancer")
                 return
-            root.after(500, self.run_simulation, root, button, info_label)
+            delay = STEP_DELAY_MS
+            if self.turbo:
+                # Le reste de l'image est laissé à Tkinter (au moins 1 ms pour traiter les événements)
+                delay = max(1, int(1000 / TURBO_FPS - (time.perf_counter() - start) * 1000))
+            root.after(delay, self.run_simulation, root, button, info_label)
+
+    def run_turbo(self, info_label: Any = None) -> bool:
+        """Joue une tranche de chronons sans les dessiner, puis redessine l'état atteint.
+        La tranche dure TURBO_BUSY_RATIO d'une image, ou ``steps_per_tick`` chronons si
+        ce nombre est fixé. Les cellules modifiées pendant toute la tranche sont redessinées
+        d'un coup.
+
+        Args:
+            info_label (Any, optional): Label pour afficher les informations. Defaults to None.
+
+        Returns:
+            bool: True si la simulation continue, False si elle est terminée
+        """
+        deadline = time.perf_counter() + TURBO_BUSY_RATIO / TURBO_FPS
+        steps = 0
+        running = True
+        while running:
+            running = self.simulate_step(info_label, redraw=False)
+            steps += 1
+            if self.steps_per_tick is not None:
+                if steps >= self.steps_per_tick:
+                    break
+            elif time.perf_counter() >= deadline:
+                break
+        self.draw()
+        if info_label is not None:
+            self.update_info(info_label)
+        return running
 
     def toggle_simulation(self, root: Any, button: Any, info_label: Any) -> None:
         """Active ou désactive la simulation.
@@ -277,11 +637,13 @@ class Grid:
             button (Any): Bouton de contrôle
             info_label (Any): Label d'information
         """
-        global simulation_running
-        simulation_running = not simulation_running
-        button.config(text="Arrêter" if simulation_running else "Lancer")
-        if simulation_running:
+        self.running = not self.running
+        button.config(text="Arrêter" if self.running else "Lancer")
+        if self.running:
             self.run_simulation(root, button, info_label)
+        elif self.history is not None:
+            # À l'arrêt, les lignes d'historique en attente sont écrites
+            self.history.flush()
 
     def get_toroidal_coords(self, x: int, y: int) -> Tuple[int, int]:
         """Convertit des coordonnées en coordonnées toroidales (grille circulaire).
@@ -296,6 +658,39 @@ class Grid:
         # Gestion des coordonnées toroidales (la grille est un tore)
         return x % self.point_x, y % self.point_y
 
+    @property
+    def neighbors(self) -> array:
+        """Table à plat des voisins de chaque cellule : les ``neighbor_count`` cases à partir de
+        ``cell * neighbor_count`` donnent les indices à plat des voisins de ``cell``. Construite
+        une fois pour la grille et gardée par elle (voir interface/neighborhood.py)."""
+        if self._neighbors is None:
+            self._neighbors = neighbor_index(self.point_x, self.point_y, self.neighborhood)
+        return self._neighbors
+
+    def neighbor_cells(self, cell: int, species: int) -> List[int]:
+        """Trouve les cellules voisines d'une cellule occupées par une espèce.
+
+        Args:
+            cell (int): Indice à plat de la cellule
+            species (int): Code de l'espèce recherchée (EMPTY pour les cellules vides)
+
+        Returns:
+            List[int]: Indices à plat des cellules voisines correspondantes, dans l'ordre du voisinage
+        """
+        occupant = self.store.species
+        table = self._neighbors
+        if table is None:
+            table = self.neighbors
+        count = self.neighbor_count
+        start = cell * count
+        found = []
+        # Parcours direct de la table, sans tranche intermédiaire par entité
+        for slot in range(start, start + count):
+            neighbor = table[slot]
+            if occupant[neighbor] == species:
+                found.append(neighbor)
+        return found
+
     def get_empty_neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
         """Trouve les cellules vides adjacentes à une position donnée.
         
@@ -306,21 +701,106 @@ class Grid:
         Returns:
             List[Tuple[int, int]]: Liste des coordonnées des cellules vides adjacentes
         """
-        # Directions possibles : haut, bas, gauche, droite
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        neighbors = []
-        # Vérifie chaque direction
-        for dx, dy in directions:
-            nx, ny = self.get_toroidal_coords(x + dx, y + dy)
-            if self.empty(nx, ny):
-                neighbors.append((nx, ny))
-        return neighbors
+        point_y = self.point_y
+        return [divmod(cell, point_y) for cell in self.neighbor_cells(x * point_y + y, EMPTY)]
 
     def reset_simulation(self) -> None:
         """Réinitialise la simulation en vidant la grille et en réinitialisant les compteurs."""
-        global turn_count, simulation_running
-        turn_count = 0
-        simulation_running = False
-        self.cells = [[None for _ in range(self.point_y)] for _ in range(self.point_x)]
-        self.populate_grid()
-        self.draw_grid_emojis()
+        self.turn_count = 0
+        self.running = False
+        self.clear_cells()
+        self.populate_grid(**self.population_parameters)
+        self.draw()
+        if self.recorder is not None:
+            self.recorder.record(self.turn_count, self.store.species)
+
+    def start_recording(self, path: str, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> TrajectoryRecorder:
+        """Commence l'enregistrement de la trajectoire (voir interface/recording.py) :
+        l'état courant, puis celui de chaque chronon joué, jusqu'à stop_recording.
+
+        Args:
+            path (str): Fichier d'enregistrement (remplacé s'il existe)
+            keyframe_interval (int, optional): Chronons entre deux images clés. Defaults to DEFAULT_KEYFRAME_INTERVAL.
+
+        Returns:
+            TrajectoryRecorder: Enregistreur branché sur la grille
+        """
+        self.stop_recording()
+        self.recorder = TrajectoryRecorder(path, self.point_x, self.point_y, keyframe_interval)
+        self.recorder.record(self.turn_count, self.store.species)
+        return self.recorder
+
+    def stop_recording(self) -> None:
+        """Termine l'enregistrement en cours, s'il y en a un."""
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def save(self, path: str, compress: bool = False) -> None:
+        """Enregistre un point de reprise de la simulation (voir interface/checkpoint.py).
+        Grid.load le relit à l'identique : la simulation reprise se poursuit exactement
+        comme l'aurait fait celle-ci.
+
+        Args:
+            path (str): Fichier du point de reprise
+            compress (bool, optional): Compresse les tableaux avec zlib. Defaults to False.
+        """
+        store = self.store
+        state = {
+            "engine": self.engine,
+            "schedule": self.schedule,
+            "neighborhood": self.neighborhood,
+            "seed": self.seed,
+            "turn_count": self.turn_count,
+            "population_parameters": self.population_parameters,
+            "reproduction_time": store.reproduction_time,
+            "energy_from_fish": store.energy_from_fish,
+            "events": store.events,
+            "next_ids": store.next_ids,
+            "rng": checkpoint.random_state_to_json(self.rng.getstate()),
+            "ocean_rng": None if self.ocean is None else self.ocean.rng.bit_generator.state,
+            "stream": None if self.stream is None else checkpoint.stream_state_to_json(self.stream.getstate()),
+            "batches": None if self.ocean is None else self.ocean.batches,
+            "tiles": self.ocean.tiles if isinstance(self.ocean, TiledOcean) else None,
+        }
+        checkpoint.write_checkpoint(path, store, state, compress=compress)
+
+    @classmethod
+    def load(cls, path: str, processes: Optional[int] = None, debug: bool = False) -> 'Grid':
+        """Crée une grille à partir d'un point de reprise écrit par Grid.save.
+        Les tableaux sont lus directement dans le stockage, sans créer d'objet Fish/Shark.
+
+        Args:
+            path (str): Fichier du point de reprise
+            processes (Optional[int], optional): Nombre de processus du moteur "tiled". Defaults to None.
+            debug (bool, optional): Vérification des compteurs après chaque chronon. Defaults to False.
+
+        Returns:
+            Grid: Grille dans l'état enregistré
+
+        Raises:
+            ValueError: Si le fichier n'est pas un point de reprise valide
+        """
+        with open(path, "rb") as f:
+            header = checkpoint.read_header(f)
+            grid = cls(header["point_x"], header["point_y"], engine=header["engine"], seed=header["seed"],
+                       debug=debug, processes=processes, schedule=header["schedule"],
+                       neighborhood=header.get("neighborhood", VON_NEUMANN))
+            store = grid.store
+            checkpoint.read_arrays(f, header, store)
+        grid.turn_count = header["turn_count"]
+        grid.population_parameters = header["population_parameters"]
+        store.reproduction_time = header["reproduction_time"]
+        store.energy_from_fish = header["energy_from_fish"]
+        store.events = header["events"]
+        store.next_ids = header["next_ids"]
+        grid.rng.setstate(checkpoint.random_state_from_json(header["rng"]))
+        if grid.stream is not None and header.get("stream") is not None:
+            grid.stream.setstate(checkpoint.stream_state_from_json(header["stream"]))
+        if grid.ocean is not None:
+            grid.ocean.rng.bit_generator.state = header["ocean_rng"]
+            grid.ocean.batches = header["batches"]
+        if isinstance(grid.ocean, TiledOcean):
+            # Même découpage qu'à l'enregistrement : la suite de la simulation en dépend
+            grid.ocean.bounds = tile_bounds(grid.point_x, header["tiles"])
+        return grid
@@ -1,160 +1,280 @@
 import tkinter as tk
 from tkinter import ttk
 from datetime import datetime
-import os
-import csv
+from typing import Any, Dict, List, Optional, Tuple
+from history import DEFAULT_HISTORY_FILE, HistoryIndex, SimulationHistory
 
-def refresh_history(tree: ttk.Treeview, history_file: str) -> None:
+# Nombre de lignes affichées à la fois dans le tableau
+PAGE_ROWS: int = 20
+
+# Nombre de tranches de la vue résumée
+SUMMARY_BUCKETS: int = 1000
+
+# Colonnes de la vue détaillée (une ligne par chronon) et largeurs
+ROW_COLUMNS: Dict[str, int] = {
+    'Date': 100,
+    'Heure': 80,
+    'Minute': 80,
+    'Chronons': 100,
+    'Poissons': 100,
+    'Requins': 100
+}
+
+# Colonnes de la vue résumée (une ligne par tranche) et largeurs
+SUMMARY_COLUMNS: Dict[str, int] = {
+    'Chronons': 140,
+    'Poissons min': 100,
+    'Poissons moy.': 100,
+    'Poissons max': 100,
+    'Requins min': 100,
+    'Requins moy.': 100,
+    'Requins max': 100
+}
+
+def format_row(row: Dict) -> Tuple:
     """
-    Rafraîchit l'affichage de l'historique avec les données les plus récentes.
-    Cette fonction lit le fichier CSV d'historique et met à jour l'affichage
-    en ajoutant des séparateurs entre les différentes simulations.
-    
+    Prépare une ligne de l'historique pour l'affichage.
+
     Args:
-        tree (ttk.Treeview): Le widget Treeview à mettre à jour
-        history_file (str): Chemin vers le fichier d'historique
+        row (Dict): Ligne lue dans le fichier d'historique
+
+    Returns:
+        Tuple: Valeurs des colonnes de la vue détaillée
+    """
+    # Formatage de la date et de l'heure
+    date_obj = datetime.fromisoformat(row['date'])
+    return (
+        date_obj.strftime('%Y-%m-%d'),
+        date_obj.strftime('%H'),
+        date_obj.strftime('%M'),
+        row['chronons'],
+        row['fish_count'],
+        row['shark_count']
+    )
+
+def format_bucket(bucket: Dict) -> Tuple:
+    """
+    Prépare une tranche de la vue résumée pour l'affichage.
+
+    Args:
+        bucket (Dict): Tranche calculée par HistoryIndex.decimate
+
+    Returns:
+        Tuple: Valeurs des colonnes de la vue résumée
+    """
+    fish_min, fish_mean, fish_max = bucket['fish']
+    shark_min, shark_mean, shark_max = bucket['sharks']
+    return (
+        '%d - %d' % bucket['chronons'],
+        fish_min, '%.1f' % fish_mean, fish_max,
+        shark_min, '%.1f' % shark_mean, shark_max
+    )
+
+class VirtualHistoryTable:
+    """
+    Tableau d'historique virtualisé.
+    Le Treeview ne contient que les lignes visibles (PAGE_ROWS) : elles sont
+    relues dans le fichier grâce à l'index des positions des lignes
+    (HistoryIndex) à chaque défilement. La barre de défilement est pilotée
+    par le tableau lui-même, d'après le nombre total de lignes indexées.
     """
-    # Effacer toutes les entrées existantes pour éviter les doublons
-    for item in tree.get_children():
-        tree.delete(item)
-    
-    # Lecture et affichage des données du fichier CSV
-    if os.path.exists(history_file):
+
+    def __init__(self, frame: Any, index: HistoryIndex, page_rows: int = PAGE_ROWS) -> None:
+        """
+        Crée le tableau et sa barre de défilement dans le cadre donné.
+
+        Args:
+            frame (Any): Cadre Tkinter où placer le tableau
+            index (HistoryIndex): Index du fichier d'historique
+            page_rows (int, optional): Nombre de lignes affichées. Defaults to PAGE_ROWS.
+        """
+        self.index: HistoryIndex = index  # Index du fichier d'historique
+        self.page_rows: int = page_rows  # Nombre de lignes visibles
+        self.first: int = 0  # Première ligne visible
+        self.follow: bool = True  # Le tableau suit la fin de l'historique
+        self.summary: bool = False  # Vue résumée (tranches) ou détaillée (chronons)
+        self.buckets: List[Dict] = []  # Tranches de la vue résumée
+
+        self.tree = ttk.Treeview(frame, show='headings', height=page_rows)
+        # Les lignes qui commencent une nouvelle simulation sont mises en évidence
+        self.tree.tag_configure('new_simulation', background='#d9d9d9')
+        self.scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.on_scroll)
+
+        # Placement des éléments dans le cadre
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Défilement à la molette (Windows/macOS, puis X11)
+        self.tree.bind('<MouseWheel>', lambda event: self.scroll_to(self.first - event.delta // 40))
+        self.tree.bind('<Button-4>', lambda event: self.scroll_to(self.first - 3))
+        self.tree.bind('<Button-5>', lambda event: self.scroll_to(self.first + 3))
+        self.configure_columns()
+
+    def total(self) -> int:
+        """Retourne le nombre de lignes du tableau virtuel."""
+        return len(self.buckets) if self.summary else len(self.index)
+
+    def configure_columns(self) -> None:
+        """Configure les colonnes de la vue courante."""
+        columns = SUMMARY_COLUMNS if self.summary else ROW_COLUMNS
+        self.tree.configure(columns=tuple(columns))
+        for col, width in columns.items():
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=width, anchor='center')
+
+    def refresh(self) -> None:
+        """Complète l'index avec les nouvelles lignes du fichier puis redessine les lignes visibles."""
         try:
-            with open(history_file, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                previous_chronons = None
-                for row in reader:
-                    # Conversion du nombre de chronons en entier
-                    try:
-                        current_chronons = int(row['chronons'])
-                    except Exception:
-                        current_chronons = None
-                    
-                    # Ajout d'un séparateur entre les simulations
-                    # (quand le nombre de chronons diminue, c'est une nouvelle simulation)
-                    if previous_chronons is None or (current_chronons is not None and current_chronons < previous_chronons):
-                        tree.insert('', 'end', values=('', '', '', '--- NOUVELLE SIMULATION ---', '', ''))
-                    previous_chronons = current_chronons
-                    
-                    # Formatage de la date et de l'heure
-                    date_obj = datetime.fromisoformat(row['date'])
-                    date = date_obj.strftime('%Y-%m-%d')
-                    time = date_obj.strftime('%H')
-                    minute = date_obj.strftime('%M')
-                    
-                    # Insertion des données dans le tableau
-                    tree.insert('', 'end', values=(
-                        date,
-                        time,
-                        minute,
-                        row['chronons'],
-                        row['fish_count'],
-                        row['shark_count']
-                    ))
+            if self.index.update():
+                # Fichier effacé ou réécrit : retour au début
+                self.first = 0
+                self.follow = True
         except Exception as e:
             print(f"Erreur lors de la lecture de l'historique : {e}")
+            return
+        if self.summary:
+            self.buckets = self.index.decimate(SUMMARY_BUCKETS)
+        if self.follow:
+            self.first = max(0, self.total() - self.page_rows)
+        self.render()
+
+    def render(self) -> None:
+        """Remplace le contenu du Treeview par les lignes visibles."""
+        self.tree.delete(*self.tree.get_children())
+        if self.summary:
+            for bucket in self.buckets[self.first:self.first + self.page_rows]:
+                self.tree.insert('', 'end', values=format_bucket(bucket))
+        else:
+            try:
+                rows = self.index.rows(self.first, self.page_rows)
+            except Exception as e:
+                print(f"Erreur lors de la lecture de l'historique : {e}")
+                rows = []
+            for row in rows:
+                try:
+                    tags = ('new_simulation',) if row['new_simulation'] else ()
+                    self.tree.insert('', 'end', values=format_row(row), tags=tags)
+                except Exception as e:
+                    print(f"Erreur lors de l'affichage d'une ligne de l'historique : {e}")
 
-def auto_refresh(tree: ttk.Treeview, history_file: str, history_window: tk.Toplevel) -> None:
+        # Position de la barre de défilement
+        total = self.total()
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + self.page_rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_to(self, first: int) -> None:
+        """
+        Fait défiler le tableau jusqu'à la ligne donnée.
+
+        Args:
+            first (int): Numéro de la première ligne à afficher
+        """
+        last_page = max(0, self.total() - self.page_rows)
+        self.first = min(max(0, first), last_page)
+        # Revenir en bas du tableau réactive le suivi des nouvelles lignes
+        self.follow = self.first == last_page
+        self.render()
+
+    def on_scroll(self, action: str, amount: str, unit: str = 'units') -> None:
+        """
+        Commande de la barre de défilement.
+
+        Args:
+            action (str): "moveto" (position en fraction) ou "scroll" (nombre d'unités ou de pages)
+            amount (str): Fraction ou nombre d'unités
+            unit (str, optional): "units" ou "pages". Defaults to 'units'.
+        """
+        if action == 'moveto':
+            self.scroll_to(int(float(amount) * self.total()))
+        elif action == 'scroll':
+            step = self.page_rows if unit == 'pages' else 1
+            self.scroll_to(self.first + int(amount) * step)
+
+    def toggle_summary(self) -> None:
+        """Passe de la vue détaillée à la vue résumée (et inversement)."""
+        self.summary = not self.summary
+        self.configure_columns()
+        self.first = 0
+        self.follow = True
+        self.refresh()
+
+def auto_refresh(table: VirtualHistoryTable, history_window: tk.Toplevel) -> None:
     """
     Rafraîchit automatiquement l'historique toutes les secondes.
     Cette fonction est appelée récursivement tant que la fenêtre est ouverte.
-    
+
     Args:
-        tree (ttk.Treeview): Le widget Treeview à mettre à jour
-        history_file (str): Chemin vers le fichier d'historique
+        table (VirtualHistoryTable): Le tableau à mettre à jour
         history_window (tk.Toplevel): La fenêtre de l'historique
     """
-    # Mise à jour de l'affichage
-    refresh_history(tree, history_file)
-    
+    # Mise à jour de l'affichage (seules les nouvelles lignes du fichier sont lues)
+    table.refresh()
+
     # Planification du prochain rafraîchissement si la fenêtre est toujours ouverte
     if history_window.winfo_exists():
-        history_window.after(1000, lambda: auto_refresh(tree, history_file, history_window))
+        history_window.after(1000, lambda: auto_refresh(table, history_window))
 
-def display_simulation_history():
+def display_simulation_history(history: Optional[SimulationHistory] = None):
     """
     Affiche l'historique des simulations dans une fenêtre Tkinter.
     Cette fonction crée une nouvelle fenêtre avec un tableau affichant :
     - La date et l'heure de chaque enregistrement
     - Le nombre de chronons (tours)
     - Le nombre de poissons et de requins
+    Seules les lignes visibles sont chargées, ce qui permet de parcourir des
+    historiques de plusieurs millions de chronons. Une vue résumée affiche le
+    minimum, la moyenne et le maximum des populations par tranche de chronons.
     L'affichage est automatiquement mis à jour toutes les secondes.
+
+    Args:
+        history (Optional[SimulationHistory], optional): Historique de la simulation en cours, dont le thread
+            d'écriture doit être attendu avant un effacement. Defaults to None (fichier à la racine du projet).
     """
     # Définition du chemin vers le fichier d'historique
-    history_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'simulation_history.csv')
-    
+    history_file = history.history_file if history is not None else DEFAULT_HISTORY_FILE
+
     # Création de la fenêtre d'historique
     history_window = tk.Toplevel()
     history_window.title("Historique des Simulations")
     history_window.geometry("1000x600")
-    
+
     # Création du cadre principal pour le tableau
     frame = ttk.Frame(history_window)
     frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-    
-    # Configuration du tableau
-    columns = ('Date', 'Heure', 'Minute', 'Chronons', 'Poissons', 'Requins')
-    tree = ttk.Treeview(frame, columns=columns, show='headings')
-    
-    # Définition des largeurs des colonnes
-    column_widths = {
-        'Date': 100,
-        'Heure': 80,
-        'Minute': 80,
-        'Chronons': 100,
-        'Poissons': 100,
-        'Requins': 100
-    }
-    
-    # Configuration des en-têtes et des colonnes
-    for col in columns:
-        tree.heading(col, text=col)
-        tree.column(col, width=column_widths[col], anchor='center')
-    
+
     # Configuration du style du tableau
     style = ttk.Style()
     style.configure("Treeview", rowheight=25)  # Hauteur des lignes
-    style.configure("Treeview.Separator", background="gray")  # Couleur des séparateurs
-    
-    # Ajout de la barre de défilement verticale
-    scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=tree.yview)
-    tree.configure(yscrollcommand=scrollbar.set)
-    
-    # Placement des éléments dans la fenêtre
-    tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-    
-    # Affichage initial des données
-    refresh_history(tree, history_file)
-    
-    # Démarrage du rafraîchissement automatique
-    auto_refresh(tree, history_file, history_window)
-    
+
+    # Création du tableau virtualisé
+    table = VirtualHistoryTable(frame, HistoryIndex(history_file))
+
+    # Affichage initial des données et démarrage du rafraîchissement automatique
+    auto_refresh(table, history_window)
+
     # Fonction pour effacer l'historique
     def clear_history():
         """
         Efface le contenu du fichier d'historique et du tableau.
-        Réinitialise le fichier CSV avec uniquement l'en-tête.
+        L'effacement passe par SimulationHistory, qui attend les lots du thread d'écriture.
         """
-        try:
-            # Réinitialisation du fichier CSV
-            with open(history_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['date', 'chronons', 'fish_count', 'shark_count'])
-            # Effacement du tableau
-            for item in tree.get_children():
-                tree.delete(item)
-        except Exception as e:
-            print(f"Erreur lors de l'effacement de l'historique : {e}")
-    
-    # Création du cadre pour le bouton d'effacement
+        (history or SimulationHistory(history_file)).clear()
+        # L'index est reconstruit depuis le début du fichier
+        table.refresh()
+
+    # Création du cadre pour les boutons
     button_frame = ttk.Frame(history_window)
     button_frame.pack(fill=tk.X, padx=10, pady=5)
-    
+
+    # Ajout du bouton de changement de vue
+    summary_button = ttk.Button(button_frame, text="Vue résumée / détaillée", command=table.toggle_summary)
+    summary_button.pack(side=tk.LEFT)
+
     # Ajout du bouton d'effacement
     clear_button = ttk.Button(button_frame, text="Effacer l'historique", command=clear_history)
     clear_button.pack(side=tk.RIGHT)
 
 if __name__ == "__main__":
-    display_simulation_history() 
\ No newline at end of file
+    display_simulation_history()
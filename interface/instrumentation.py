@@ -0,0 +1,141 @@
+"""
+Instrumentation du chronon de la simulation Wa-Tor.
+
+Chaque chronon est découpé en phases chronométrées séparément :
+- moteur objet : ``collect`` (liste des entités), ``shuffle`` (ordre de jeu), ``update`` (jeu des entités)
+- moteur NumPy : ``engine`` (chronon complet, résolu par lots)
+- ``checks`` : vérification des compteurs (mode debug)
+- interface (Grid.simulate_step) : ``render`` (dessin), ``info`` (label d'information),
+  ``history`` (enregistrement de l'historique), ``reset`` (remise à zéro après extinction)
+
+Le relevé d'un chronon contient aussi le nombre d'événements survenus
+(déplacements, repas, naissances, morts de faim), calculé à partir des
+compteurs cumulés du stockage (EntityStore.events). Il est transmis aux
+observateurs enregistrés et, si demandé, ajouté à un fichier JSON Lines.
+Sans observateur ni fichier, l'instrumentation est inactive et ne mesure rien.
+"""
+# Importation des modules nécessaires
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO
+from aquatic.store import EVENT_NAMES
+
+# Relevé d'un chronon : chronon, engine, phases (secondes par phase), total, événements, populations
+StepRecord = Dict[str, Any]
+
+
+class Instrumentation:
+    """Mesure des phases et des événements de chaque chronon, diffusée aux observateurs."""
+
+    def __init__(self) -> None:
+        """Initialise une instrumentation inactive (aucun observateur, aucun fichier)."""
+        self.observers: List[Callable[[StepRecord], None]] = []  # Fonctions appelées à chaque chronon
+        self.stream: Optional[TextIO] = None  # Fichier JSON Lines des relevés
+        self.record: Optional[StepRecord] = None  # Relevé du chronon en cours
+        self.events_start: List[int] = []  # Compteurs d'événements au début du chronon
+        self.start: float = 0.0  # Heure de début du chronon
+
+    @property
+    def active(self) -> bool:
+        """L'instrumentation mesure les chronons dès qu'un observateur ou un fichier est branché."""
+        return bool(self.observers) or self.stream is not None
+
+    def add_observer(self, observer: Callable[[StepRecord], None]) -> None:
+        """Ajoute un observateur, appelé avec le relevé de chaque chronon.
+
+        Args:
+            observer (Callable[[StepRecord], None]): Fonction recevant le relevé
+        """
+        self.observers.append(observer)
+
+    def remove_observer(self, observer: Callable[[StepRecord], None]) -> None:
+        """Retire un observateur.
+
+        Args:
+            observer (Callable[[StepRecord], None]): Observateur ajouté avec add_observer
+        """
+        self.observers.remove(observer)
+
+    def dump_to(self, path: Optional[str]) -> None:
+        """Écrit les relevés dans un fichier JSON Lines (un relevé par ligne), ou arrête l'écriture.
+
+        Args:
+            path (Optional[str]): Fichier de sortie, ou None pour arrêter l'écriture
+        """
+        self.close()
+        if path is not None:
+            self.stream = open(path, "w", encoding="utf-8")
+
+    def close(self) -> None:
+        """Ferme le fichier des relevés, s'il y en a un."""
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+    def begin(self, chronon: int, engine: str, events: List[int]) -> bool:
+        """Commence le relevé d'un chronon, sauf si l'instrumentation est inactive ou si un relevé
+        est déjà en cours (Grid.advance appelé depuis Grid.simulate_step).
+
+        Args:
+            chronon (int): Numéro du chronon
+            engine (str): Moteur de simulation
+            events (List[int]): Compteurs cumulés des événements du stockage
+
+        Returns:
+            bool: True si ce relevé a été commencé ici (l'appelant doit alors appeler end)
+        """
+        if self.record is not None or not self.active:
+            return False
+        self.record = {"chronon": chronon, "engine": engine, "phases": {}}
+        self.events_start = list(events)
+        self.start = time.perf_counter()
+        return True
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Chronomètre une phase du chronon en cours (ne fait rien sans relevé en cours).
+
+        Args:
+            name (str): Nom de la phase
+        """
+        if self.record is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            phases = self.record["phases"]
+            phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+    def abort(self) -> None:
+        """Abandonne le relevé en cours, sans le transmettre (chronon interrompu par une exception) :
+        le chronon suivant peut commencer le sien. Ne fait rien si aucun relevé n'est en cours."""
+        self.record = None
+
+    def end(self, events: List[int], fish_count: int, shark_count: int) -> Optional[StepRecord]:
+        """Termine le relevé du chronon en cours et le transmet aux observateurs.
+
+        Args:
+            events (List[int]): Compteurs cumulés des événements du stockage
+            fish_count (int): Nombre de poissons à la fin du chronon
+            shark_count (int): Nombre de requins à la fin du chronon
+
+        Returns:
+            Optional[StepRecord]: Relevé du chronon, ou None si aucun relevé n'était en cours
+        """
+        record = self.record
+        if record is None:
+            return None
+        self.record = None
+        record["total"] = time.perf_counter() - self.start
+        for name, before, after in zip(EVENT_NAMES, self.events_start, events):
+            record[name] = after - before
+        record["fish"] = fish_count
+        record["sharks"] = shark_count
+        for observer in self.observers:
+            observer(record)
+        if self.stream is not None:
+            self.stream.write(json.dumps(record) + "\n")
+        return record
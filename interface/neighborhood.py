@@ -0,0 +1,115 @@
+"""
+Voisinages des cellules de la grille Wa-Tor (grille torique).
+
+Deux voisinages sont disponibles :
+- ``"von_neumann"`` : les 4 cellules adjacentes (haut, bas, gauche, droite), règle d'origine
+- ``"moore"`` : les 8 cellules adjacentes, diagonales comprises
+
+Le moteur objet lit les voisins dans une table précalculée (``neighbor_index``) :
+un seul tableau à plat d'entiers de 4 octets, où les ``k`` voisins de la cellule
+``cell`` occupent les cases ``cell * k`` à ``cell * k + k - 1`` (4 octets par voisin,
+16 par cellule en von Neumann, soit 16 Mo pour 1000x1000). La table est construite
+une seule fois par grille et gardée par elle (le cache ne retient que la dernière
+table construite, pour ne pas garder en vie celles des grilles disparues) : une recherche de voisins ne fait plus ni modulo ni
+création de tuple de coordonnées. Les moteurs vectorisés ont leur propre table
+NumPy (interface/numpy_engine.py), dans le même ordre.
+"""
+# Importation des modules nécessaires
+# lru_cache : la dernière table construite, réutilisée par les grilles de même taille
+# array : table des voisins compacte (entiers de 4 octets)
+from array import array
+from functools import lru_cache
+from typing import Tuple
+
+# Voisinages disponibles
+VON_NEUMANN: str = "von_neumann"
+MOORE: str = "moore"
+NEIGHBORHOODS: Tuple[str, ...] = (VON_NEUMANN, MOORE)
+
+# Directions possibles : haut, bas, gauche, droite (ordre historique de Fish/Shark,
+# dont dépendent les tirages aléatoires), puis les diagonales pour le voisinage de Moore
+DIRECTIONS: Tuple[Tuple[int, int], ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+MOORE_DIRECTIONS: Tuple[Tuple[int, int], ...] = DIRECTIONS + ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+# Nombre de sous-réseaux de l'ordonnancement "sublattice" : la cellule (x, y) a la couleur
+# (x + 2 * y) % SUBLATTICES ; ses 4 voisins ont les 4 autres couleurs et deux cellules
+# de même couleur sont à distance 3 au moins (exact si la largeur et la hauteur de la
+# grille sont des multiples de SUBLATTICES, sinon seulement loin des bords du tore)
+SUBLATTICES: int = 5
+# Avec le voisinage de Moore, la couleur est (x % 3) + 3 * (y % 3) : deux cellules de même
+# couleur sont à 3 cases au moins dans chaque direction (exact pour des multiples de 3)
+MOORE_SUBLATTICES: int = 9
+
+# Nombre maximal de tables gardées en mémoire par le cache : une seule, celle de la dernière
+# taille demandée (une table 4000x4000 pèse des centaines de Mo ; chaque grille garde la sienne)
+CACHED_TABLES: int = 1
+
+
+def directions_of(neighborhood: str) -> Tuple[Tuple[int, int], ...]:
+    """Retourne les directions (dx, dy) d'un voisinage.
+
+    Args:
+        neighborhood (str): Voisinage ("von_neumann" ou "moore")
+
+    Returns:
+        Tuple[Tuple[int, int], ...]: Déplacements vers chaque voisin, dans l'ordre des tables
+
+    Raises:
+        ValueError: Si le voisinage n'existe pas
+    """
+    if neighborhood == VON_NEUMANN:
+        return DIRECTIONS
+    if neighborhood == MOORE:
+        return MOORE_DIRECTIONS
+    raise ValueError(f"Voisinage inconnu : {neighborhood!r} (choix possibles : {', '.join(NEIGHBORHOODS)})")
+
+
+def sublattice_count(neighborhood: str = VON_NEUMANN) -> int:
+    """Retourne le nombre de sous-réseaux de l'ordonnancement "sublattice" pour un voisinage."""
+    return MOORE_SUBLATTICES if neighborhood == MOORE else SUBLATTICES
+
+
+def sublattice_of(x, y, neighborhood: str = VON_NEUMANN):
+    """Retourne la couleur (sous-réseau) de la cellule (x, y).
+    Accepte aussi des tableaux NumPy de coordonnées.
+
+    Args:
+        x: Coordonnée x de la cellule
+        y: Coordonnée y de la cellule
+        neighborhood (str): Voisinage de la grille. Defaults to "von_neumann".
+
+    Returns:
+        Couleur de la cellule, entre 0 et sublattice_count(neighborhood) - 1
+    """
+    if neighborhood == MOORE:
+        return x % 3 + 3 * (y % 3)
+    return (x + 2 * y) % SUBLATTICES
+
+
+@lru_cache(maxsize=CACHED_TABLES)
+def neighbor_index(point_x: int, point_y: int, neighborhood: str = VON_NEUMANN) -> array:
+    """Construit (une fois par taille et par voisinage) la table à plat des voisins toroïdaux de chaque cellule.
+
+    Args:
+        point_x (int): Largeur de la grille
+        point_y (int): Hauteur de la grille
+        neighborhood (str): Voisinage ("von_neumann" ou "moore"). Defaults to "von_neumann".
+
+    Returns:
+        array: Tableau de ``point_x * point_y * k`` entiers (``k`` voisins par cellule) :
+        ``table[cell * k + j]`` est l'indice à plat du voisin de ``cell`` dans la direction
+        ``directions_of(neighborhood)[j]``
+    """
+    offsets = directions_of(neighborhood)
+    count = len(offsets)
+    table = array('i', [0]) * (point_x * point_y * count)
+    # Colonne par colonne et direction par direction : la colonne voisine, décalée de dy,
+    # est écrite d'un coup dans une case sur ``count`` (copie en C, sans boucle par cellule)
+    for x in range(point_x):
+        start = x * point_y * count
+        for j, (dx, dy) in enumerate(offsets):
+            first = (x + dx) % point_x * point_y
+            column = array('i', range(first, first + point_y))
+            shift = dy % point_y
+            table[start + j:start + point_y * count:count] = column[shift:] + column[:shift]
+    return table
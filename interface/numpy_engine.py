@@ -0,0 +1,404 @@
+"""
+Moteur de simulation vectorisé (NumPy) pour la grille Wa-Tor.
+
+Le moteur travaille directement sur les tableaux du stockage de la grille
+(aquatic/store.py), vus comme des tableaux NumPy à plat sans copie (une case
+par cellule, indice ``x * point_y + y``, comme ``cells[x][y]``) :
+- ``species`` : 0 = eau, 1 = poisson, 2 = requin
+- ``age`` : âge de l'entité présente dans la cellule
+- ``energy`` : énergie du requin présent dans la cellule
+- ``ids`` : identifiant de l'entité présente dans la cellule
+Il y ajoute le tableau ``moved`` : l'entité de la cellule a déjà joué pendant ce chronon.
+
+Un chronon est résolu par lots : les entités sont mélangées puis découpées en
+quelques lots ; dans chaque lot, les requins jouent (prédation, puis
+déplacement vers une case vide, vieillissement, famine, reproduction), puis
+les poissons (déplacement, reproduction). Quand plusieurs entités d'un même
+lot visent la même case, la première dans l'ordre mélangé l'obtient, les
+autres restent sur place.
+
+Avec l'ordonnancement ``"sublattice"`` (voir Grid), les lots sont les cinq
+sous-réseaux de couleur ``(x + 2 * y) % 5`` (neuf avec le voisinage de Moore,
+voir interface/neighborhood.py), joués dans un ordre tiré au hasard à chaque
+chronon. Si la largeur et la hauteur sont des multiples de 5 (de 3 avec le
+voisinage de Moore), deux cellules de même couleur n'ont aucun voisin commun
+et un lot est joué sans aucun conflit. Sinon, la coloration se raccorde mal
+au bord du tore et deux entités d'un même lot peuvent y viser la même case :
+les entités de chaque lot sont donc elles aussi mélangées, et la case revient
+à l'une d'elles tirée au hasard, comme avec ``"shuffle"``.
+"""
+# Importation des modules nécessaires
+# numpy : dépendance optionnelle, uniquement requise pour ce moteur
+from typing import Optional, Tuple
+from aquatic.store import EntityStore, EMPTY, FISH, SHARK, MOVES, MEALS, BIRTHS, STARVATIONS
+# DIRECTIONS, SUBLATTICES et sublattice_of restent importables depuis ce module
+from interface.neighborhood import (DIRECTIONS, SUBLATTICES, VON_NEUMANN, directions_of,
+                                    sublattice_count, sublattice_of)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    np = None
+
+# Règles identiques à celles du moteur objet (aquatic/shark.py)
+HUNGER_PENALTY: int = 5  # Pénalité quand le requin ne trouve pas de poisson
+BABY_SHARK_ENERGY: int = 5  # Énergie d'un requin à la naissance
+
+# Nombre de lots traités successivement à chaque chronon (voir VectorizedOcean.step)
+DEFAULT_BATCHES: int = 16
+
+
+def neighbor_table(point_x: int, point_y: int, first_x: int = 0, last_x: Optional[int] = None,
+                   neighborhood: str = VON_NEUMANN) -> "np.ndarray":
+    """Construit la table des voisins toroïdaux de chaque cellule des colonnes ``first_x`` à ``last_x``.
+
+    Args:
+        point_x (int): Largeur de la grille
+        point_y (int): Hauteur de la grille
+        first_x (int): Première colonne couverte par la table. Defaults to 0.
+        last_x (Optional[int]): Colonne suivant la dernière colonne couverte (point_x par défaut)
+        neighborhood (str): Voisinage ("von_neumann" ou "moore"). Defaults to "von_neumann".
+
+    Returns:
+        np.ndarray: Tableau (cellules couvertes, nombre de voisins) des indices (dans toute la grille)
+        des cellules voisines, dans l'ordre de directions_of(neighborhood)
+    """
+    if last_x is None:
+        last_x = point_x
+    # Indices des colonnes couvertes, bordées de leurs deux colonnes voisines (toroïdales)
+    rows = np.arange(first_x - 1, last_x + 1) % point_x
+    block = rows[:, None] * point_y + np.arange(point_y)
+    offsets = directions_of(neighborhood)
+    # Voisin (dx, dy) : colonnes décalées de dx, puis rotation de -dy le long de chaque colonne
+    columns = [np.roll(block[1 + dx:block.shape[0] - 1 + dx], -dy, axis=1) for dx, dy in offsets]
+    return np.stack(columns, axis=2).reshape(-1, len(offsets))
+
+
+class VectorizedOcean:
+    """Océan Wa-Tor vu à travers des tableaux NumPy.
+    Cette classe est utilisée par ``Grid`` lorsque le moteur ``"numpy"`` est choisi."""
+
+    def __init__(self, store: EntityStore, seed: Optional[int] = None, schedule: str = "shuffle",
+                 neighborhood: str = VON_NEUMANN) -> None:
+        """Initialise le moteur sur le stockage d'une grille.
+
+        Args:
+            store (EntityStore): Stockage des entités de la grille (partagé, sans copie)
+            seed (Optional[int]): Graine du générateur aléatoire. Defaults to None.
+            schedule (str): Ordonnancement des entités ("shuffle" ou "sublattice"). Defaults to "shuffle".
+            neighborhood (str): Voisinage ("von_neumann" ou "moore"). Defaults to "von_neumann".
+
+        Raises:
+            ImportError: Si NumPy n'est pas installé
+        """
+        if np is None:
+            raise ImportError("Le moteur 'numpy' nécessite le paquet numpy (pip install numpy)")
+        self.store: EntityStore = store
+        self.point_x: int = store.point_x
+        self.point_y: int = store.point_y
+        # Vues NumPy sur les tableaux du stockage : les écritures sont visibles par Grid.cells
+        self.species = np.frombuffer(store.species, dtype=np.uint8)
+        self.age = np.frombuffer(store.age, dtype=np.int32)
+        self.energy = np.frombuffer(store.energy, dtype=np.int32)
+        self.ids = np.frombuffer(store.ids, dtype=np.int64)
+        self.moved = np.zeros(self.point_x * self.point_y, dtype=bool)
+        self.neighborhood: str = neighborhood  # Voisinage des cellules
+        self.neighbors = neighbor_table(self.point_x, self.point_y, neighborhood=neighborhood)
+        self.rng = np.random.default_rng(seed)
+        self.batches: int = DEFAULT_BATCHES  # Nombre de lots par chronon
+        self.schedule: str = schedule  # Ordonnancement des entités
+
+    @property
+    def fish_reproduction_time(self) -> int:
+        """Temps nécessaire pour la reproduction des poissons (paramètre du stockage)."""
+        return self.store.reproduction_time[FISH]
+
+    @fish_reproduction_time.setter
+    def fish_reproduction_time(self, value: int) -> None:
+        self.store.reproduction_time[FISH] = value
+
+    @property
+    def shark_reproduction_time(self) -> int:
+        """Temps nécessaire pour la reproduction des requins (paramètre du stockage)."""
+        return self.store.reproduction_time[SHARK]
+
+    @shark_reproduction_time.setter
+    def shark_reproduction_time(self, value: int) -> None:
+        self.store.reproduction_time[SHARK] = value
+
+    def index(self, x: int, y: int) -> int:
+        """Retourne l'indice à plat de la cellule (x, y)."""
+        return x * self.point_y + y
+
+    def species_at(self, x: int, y: int) -> int:
+        """Retourne le code de l'espèce présente dans la cellule (x, y)."""
+        return int(self.species[self.index(x, y)])
+
+    def clear(self) -> None:
+        """Vide entièrement l'océan."""
+        self.store.clear_all()
+        self.moved[:] = False
+
+    def populate(self, fish_reproduction_time: int = 5, shark_reproduction_time: int = 5,
+                 shark_initial_energy: int = 30, fish_ratio: float = 0.7, shark_ratio: float = 0.1) -> None:
+        """Remplit l'océan, par défaut avec 10% de requins et 70% de poissons (comme Grid.populate_grid).
+
+        Args:
+            fish_reproduction_time (int): Temps nécessaire pour la reproduction des poissons
+            shark_reproduction_time (int): Temps nécessaire pour la reproduction des requins
+            shark_initial_energy (int): Énergie initiale des requins
+            fish_ratio (float): Proportion initiale de poissons. Defaults to 0.7.
+            shark_ratio (float): Proportion initiale de requins. Defaults to 0.1.
+        """
+        self.clear()
+        self.fish_reproduction_time = fish_reproduction_time
+        self.shark_reproduction_time = shark_reproduction_time
+        total_cells = self.point_x * self.point_y
+        num_sharks = int(total_cells * shark_ratio)
+        num_fish = int(total_cells * fish_ratio)
+        positions = self.rng.permutation(total_cells)
+        sharks = positions[:num_sharks]
+        fish = positions[num_sharks:num_sharks + num_fish]
+        self.species[sharks] = SHARK
+        self.energy[sharks] = shark_initial_energy
+        self.ids[sharks] = self.store.allocate_ids(SHARK, num_sharks) + np.arange(num_sharks)
+        self.species[fish] = FISH
+        self.ids[fish] = self.store.allocate_ids(FISH, num_fish) + np.arange(num_fish)
+        self.store.recount()
+        self.store.mark_all_dirty()
+
+    def close(self) -> None:
+        """Libère les ressources du moteur (aucune pour ce moteur, voir TiledOcean.close)."""
+
+    def count(self) -> Tuple[int, int]:
+        """Compte le nombre de poissons et de requins.
+
+        Returns:
+            Tuple[int, int]: Nombre de poissons et nombre de requins
+        """
+        return self.store.count(FISH), self.store.count(SHARK)
+
+    def step(self) -> None:
+        """Exécute un chronon complet.
+
+        Les entités sont mélangées puis découpées en ``batches`` lots successifs ;
+        dans chaque lot, les requins jouent avant les poissons. Plus il y a de lots,
+        plus l'ordre se rapproche de l'ordre aléatoire entité par entité du moteur objet.
+        """
+        self.moved[:] = False
+        before = self.species.copy() if self.store.track_changes else None
+        self.play(np.flatnonzero(self.species != EMPTY))
+        if before is not None:
+            # Les tableaux sont écrits directement : les cellules modifiées sont retrouvées par différence
+            self.store.dirty.update(np.flatnonzero(self.species != before).tolist())
+
+    def play(self, cells: "np.ndarray") -> None:
+        """Fait jouer, par lots, les entités des cellules données qui n'ont pas encore joué
+        pendant ce chronon : lots d'entités mélangées, ou sous-réseaux (d'entités mélangées) dans un ordre mélangé.
+
+        Args:
+            cells (np.ndarray): Cellules occupées dont les entités doivent jouer
+        """
+        entities = self.rng.permutation(cells)
+        if self.schedule == "sublattice":
+            # Le masque garde l'ordre mélangé : les conflits au bord d'un tore dont la taille n'est pas
+            # un multiple du nombre de couleurs ne favorisent pas les plus petits indices
+            xs, ys = np.divmod(entities, self.point_y)
+            colors = sublattice_of(xs, ys, self.neighborhood)
+            batches = [entities[colors == color]
+                       for color in self.rng.permutation(sublattice_count(self.neighborhood))]
+        else:
+            batches = np.array_split(entities, min(self.batches, max(1, entities.size)))
+        for batch in batches:
+            self._step_sharks(batch[(self.species[batch] == SHARK) & ~self.moved[batch]])
+            self._step_fish(batch[(self.species[batch] == FISH) & ~self.moved[batch]])
+
+    def neighbors_of(self, cells: "np.ndarray") -> "np.ndarray":
+        """Retourne les cellules voisines des cellules données.
+
+        Args:
+            cells (np.ndarray): Indices des cellules
+
+        Returns:
+            np.ndarray: Tableau (n, nombre de voisins) des indices des cellules voisines
+        """
+        return self.neighbors[cells]
+
+    def _pick(self, around: "np.ndarray", mask: "np.ndarray") -> "np.ndarray":
+        """Choisit au hasard, pour chaque entité, un voisin parmi ceux autorisés par le masque.
+
+        Args:
+            around (np.ndarray): Voisins (n, k) des cellules des entités (voir neighbors_of)
+            mask (np.ndarray): Masque (n, k) des voisins autorisés
+
+        Returns:
+            np.ndarray: Indice de la cellule choisie, ou -1 si aucun voisin n'est autorisé
+        """
+        keys = self.rng.random(mask.shape)
+        keys[~mask] = -1.0
+        choice = keys.argmax(axis=1)
+        target = around[np.arange(around.shape[0]), choice]
+        target[~mask.any(axis=1)] = -1
+        return target
+
+    @staticmethod
+    def _winners(targets: "np.ndarray") -> "np.ndarray":
+        """Résout les conflits : la première entité (ordre déjà mélangé) qui vise une case l'obtient.
+
+        Args:
+            targets (np.ndarray): Cellules visées, dans l'ordre de priorité
+
+        Returns:
+            np.ndarray: Masque booléen des entités gagnantes
+        """
+        winners = np.zeros(targets.shape, dtype=bool)
+        _, first = np.unique(targets, return_index=True)
+        winners[first] = True
+        return winners
+
+    def _move(self, src: "np.ndarray", dst: "np.ndarray") -> None:
+        """Déplace les entités des cellules ``src`` vers les cellules ``dst`` (sans conflit)."""
+        species = self.species[src]
+        age = self.age[src]
+        energy = self.energy[src]
+        ids = self.ids[src]
+        self.species[src] = EMPTY
+        self.age[src] = 0
+        self.energy[src] = 0
+        self.ids[src] = 0
+        self.species[dst] = species
+        self.age[dst] = age
+        self.energy[dst] = energy
+        self.ids[dst] = ids
+
+    def _wander(self, cells: "np.ndarray") -> "np.ndarray":
+        """Déplace chaque entité vers une case vide voisine, si possible.
+
+        Args:
+            cells (np.ndarray): Cellules des entités, dans l'ordre de priorité
+
+        Returns:
+            np.ndarray: Nouvelle position de chaque entité
+        """
+        positions = cells.copy()
+        if cells.size == 0:
+            return positions
+        around = self.neighbors_of(cells)
+        target = self._pick(around, self.species[around] == EMPTY)
+        movers = np.flatnonzero(target >= 0)
+        movers = movers[self._winners(target[movers])]
+        self._move(cells[movers], target[movers])
+        self.store.events[MOVES] += int(movers.size)
+        positions[movers] = target[movers]
+        return positions
+
+    def _give_birth(self, parents: "np.ndarray", species: int, energy: int) -> "np.ndarray":
+        """Place un nouveau-né dans une case vide voisine de chaque parent, si possible.
+
+        Args:
+            parents (np.ndarray): Cellules d'origine des parents, dans l'ordre de priorité
+            species (int): Espèce des nouveau-nés
+            energy (int): Énergie initiale des nouveau-nés
+
+        Returns:
+            np.ndarray: Masque des parents qui ont effectivement eu un petit
+        """
+        born = np.zeros(parents.shape, dtype=bool)
+        if parents.size == 0:
+            return born
+        around = self.neighbors_of(parents)
+        target = self._pick(around, self.species[around] == EMPTY)
+        candidates = np.flatnonzero(target >= 0)
+        candidates = candidates[self._winners(target[candidates])]
+        cribs = target[candidates]
+        self.species[cribs] = species
+        self.age[cribs] = 0
+        self.energy[cribs] = energy
+        self._name_newborns(cribs, species)
+        self.store.counts[species] += int(cribs.size)
+        self.store.events[BIRTHS] += int(cribs.size)
+        self.moved[cribs] = True
+        born[candidates] = True
+        return born
+
+    def _name_newborns(self, cribs: "np.ndarray", species: int) -> None:
+        """Attribue des identifiants consécutifs aux nouveau-nés (voir TileOcean._name_newborns).
+
+        Args:
+            cribs (np.ndarray): Cellules des nouveau-nés
+            species (int): Espèce des nouveau-nés
+        """
+        self.ids[cribs] = self.store.allocate_ids(species, cribs.size) + np.arange(cribs.size)
+
+    def _step_sharks(self, sharks: "np.ndarray") -> None:
+        """Fait jouer un lot de requins.
+
+        Args:
+            sharks (np.ndarray): Cellules des requins, dans l'ordre de priorité
+        """
+        if sharks.size == 0:
+            return
+        positions = sharks.copy()
+
+        # Prédation : chaque requin choisit un poisson voisin, un seul requin par poisson.
+        # Les requins qui ont perdu un conflit retentent leur chance sur les poissons restants,
+        # comme dans le moteur objet où chaque requin voit les repas de ceux qui l'ont précédé.
+        fed = np.zeros(sharks.shape, dtype=bool)
+        candidates = np.arange(sharks.size)
+        while candidates.size:
+            around = self.neighbors_of(sharks[candidates])
+            prey = self._pick(around, self.species[around] == FISH)
+            candidates = candidates[prey >= 0]
+            prey = prey[prey >= 0]
+            winners = self._winners(prey)
+            hunters = candidates[winners]
+            self._move(sharks[hunters], prey[winners])
+            positions[hunters] = prey[winners]
+            fed[hunters] = True
+            self.store.counts[FISH] -= int(hunters.size)
+            self.store.events[MEALS] += int(hunters.size)
+            self.store.events[MOVES] += int(hunters.size)
+            candidates = candidates[~winners]
+
+        # Les requins qui n'ont pas mangé cherchent une case vide
+        hungry = np.flatnonzero(~fed)
+        positions[hungry] = self._wander(sharks[hungry])
+
+        # Énergie et vieillissement
+        self.energy[positions] += np.where(fed, self.store.energy_from_fish, -HUNGER_PENALTY)
+        self.age[positions] += 1
+        self.energy[positions] -= 1
+        self.moved[positions] = True
+
+        # Famine
+        starving = self.energy[positions] <= 0
+        dead = positions[starving]
+        self.species[dead] = EMPTY
+        self.age[dead] = 0
+        self.energy[dead] = 0
+        self.ids[dead] = 0
+        self.store.counts[SHARK] -= int(dead.size)
+        self.store.events[STARVATIONS] += int(dead.size)
+
+        # Reproduction autour de l'ancienne position du parent
+        if self.shark_reproduction_time > 0:
+            ages = self.age[positions]
+            ready = ~starving & (ages % self.shark_reproduction_time == 0) & (ages != 0)
+            self._give_birth(sharks[ready], SHARK, BABY_SHARK_ENERGY)
+
+    def _step_fish(self, fish: "np.ndarray") -> None:
+        """Fait jouer un lot de poissons.
+
+        Args:
+            fish (np.ndarray): Cellules des poissons, dans l'ordre de priorité
+        """
+        if fish.size == 0:
+            return
+        self.age[fish] += 1
+        positions = self._wander(fish)
+        self.moved[positions] = True
+
+        # Reproduction autour de l'ancienne position du parent
+        ready = np.flatnonzero(self.age[positions] >= self.fish_reproduction_time)
+        born = self._give_birth(fish[ready], FISH, 0)
+        self.age[positions[ready[born]]] = 0
@@ -0,0 +1,116 @@
+"""
+Flux de nombres aléatoires tirés par blocs pour le moteur objet.
+
+Chaque poisson et chaque requin tire une ou deux directions par chronon et le
+chronon commence par mélanger toutes les entités : appeler ``random.choice`` et
+``random.shuffle`` coûte alors une part importante du temps par entité.
+``RandomStream`` tire d'un coup un bloc de mots de 32 bits (un seul appel à
+``getrandbits``), puis sert les choix dans ce bloc :
+
+- ``choice(seq)`` retourne ``seq[(mot * len(seq)) >> 32]`` (biais inférieur à
+  len(seq) / 2**32, négligeable pour les 4 ou 8 voisins d'une cellule)
+- ``shuffle(items)`` applique l'algorithme de Fisher-Yates avec les mots d'un
+  seul tirage (``take``) au lieu d'un appel au générateur par élément
+
+Le flux a son propre générateur, dont la graine est tirée du générateur de la
+grille : une simulation reste reproductible avec la même graine. Son état
+(``getstate``) est celui du générateur au début du bloc courant et la position
+dans ce bloc ; il est enregistré dans les points de reprise.
+"""
+# Importation des modules nécessaires
+# array : bloc de mots de 32 bits lu directement dans les octets de getrandbits
+import random
+import sys
+from array import array
+from typing import Any, MutableSequence, Sequence, Tuple
+
+# Nombre de mots tirés à chaque appel de getrandbits
+BLOCK_SIZE: int = 4096
+# Taille d'un mot en bits (type 'I' du module array : 4 octets sur toutes les plateformes courantes)
+WORD_BITS: int = 32
+
+
+class RandomStream:
+    """Générateur servant des choix et des permutations à partir de blocs tirés à l'avance."""
+
+    def __init__(self, seed: Any = None, block_size: int = BLOCK_SIZE) -> None:
+        """Initialise le flux et tire son premier bloc.
+
+        Args:
+            seed (Any, optional): Graine du générateur du flux. Defaults to None.
+            block_size (int, optional): Nombre de mots par bloc. Defaults to BLOCK_SIZE.
+        """
+        self.rng: random.Random = random.Random(seed)  # Générateur propre au flux
+        self.block_size: int = block_size  # Nombre de mots par bloc
+        self.block_state: Tuple = self.rng.getstate()  # État du générateur au début du bloc courant
+        self.words: array = array('I')  # Bloc courant
+        self.position: int = 0  # Prochain mot à servir
+        self.refill()
+
+    def refill(self) -> None:
+        """Tire un nouveau bloc de mots et revient à son début."""
+        self.block_state = self.rng.getstate()
+        bits = self.rng.getrandbits(WORD_BITS * self.block_size)
+        # Octets dans l'ordre de la machine : le mot i vaut toujours (bits >> 32 * i) & 0xFFFFFFFF
+        self.words = array('I', bits.to_bytes(WORD_BITS // 8 * self.block_size, sys.byteorder))
+        self.position = 0
+
+    def take(self, count: int) -> array:
+        """Retourne les ``count`` mots suivants du flux, en tirant de nouveaux blocs si besoin.
+
+        Args:
+            count (int): Nombre de mots
+
+        Returns:
+            array: Mots de 32 bits
+        """
+        words = self.words[self.position:self.position + count]
+        self.position += len(words)
+        while len(words) < count:
+            self.refill()
+            more = self.words[:count - len(words)]
+            self.position = len(more)
+            words.extend(more)
+        return words
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        """Retourne un élément de la séquence (non vide), tiré au hasard.
+
+        Args:
+            seq (Sequence[Any]): Séquence non vide (ex. cellules voisines)
+
+        Returns:
+            Any: Élément choisi
+        """
+        position = self.position
+        if position == self.block_size:
+            self.refill()
+            position = 0
+        self.position = position + 1
+        return seq[self.words[position] * len(seq) >> WORD_BITS]
+
+    def shuffle(self, items: MutableSequence[Any]) -> None:
+        """Mélange la liste sur place (Fisher-Yates, un mot du flux par échange).
+
+        Args:
+            items (MutableSequence[Any]): Liste à mélanger
+        """
+        words = self.take(max(0, len(items) - 1))
+        for i in range(len(items) - 1, 0, -1):
+            j = words[i - 1] * (i + 1) >> WORD_BITS
+            items[i], items[j] = items[j], items[i]
+
+    def getstate(self) -> Tuple[Tuple, int]:
+        """Retourne l'état du flux : état du générateur au début du bloc courant et position dans le bloc."""
+        return self.block_state, self.position
+
+    def setstate(self, state: Tuple[Tuple, int]) -> None:
+        """Restaure un état retourné par getstate : le bloc courant est tiré à nouveau.
+
+        Args:
+            state (Tuple[Tuple, int]): État du flux
+        """
+        block_state, position = state
+        self.rng.setstate(block_state)
+        self.refill()
+        self.position = position
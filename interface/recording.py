@@ -0,0 +1,436 @@
+"""
+Enregistrement et relecture de la trajectoire spatiale d'une simulation Wa-Tor.
+
+L'historique CSV ne garde que les populations ; un enregistrement garde l'espèce
+de chaque cellule à chaque chronon, sous une forme compacte :
+
+- une image clé (keyframe) : tout le tableau des espèces, au
+  début de l'enregistrement, tous les ``keyframe_interval`` chronons et après
+  chaque réinitialisation de la grille
+- entre deux images clés, un delta par chronon : la liste des seules cellules
+  modifiées depuis le chronon précédent (déplacements, naissances, repas, morts
+  de faim) avec leur nouvelle espèce ; son coût suit le nombre de cellules
+  modifiées et non la surface de l'océan. Quand plus de ``DELTA_MAX_CHANGED``
+  des cellules ont changé, la liste serait plus grosse qu'une image complète :
+  c'est une image clé qui est écrite (dans Wa-Tor presque toutes les entités
+  bougent à chaque chronon : les deltas sont surtout utiles quand une partie de
+  l'océan est figée, par exemple rempli de poissons après l'extinction des requins)
+
+Les codes d'espèce tiennent sur 2 bits : quatre cellules sont regroupées par
+octet avant la compression (zlib) d'une image clé, ce qui réduit d'un tiers sa
+taille. Regroupement et comparaison de deux images sont calculés d'un bloc sur
+des entiers Python, sans boucle sur les cellules. Un delta range l'écart entre
+deux cellules modifiées successives (petits entiers, très compressibles) puis
+les nouvelles espèces.
+
+Structure du fichier : un en-tête (``MAGIC``, version, dimensions) suivi des
+enregistrements, chacun précédé de sa nature, de son chronon, de son nombre de
+cellules et de sa taille. Le fichier s'écrit au fil de l'eau : s'il est
+tronqué par un arrêt brutal, seul le dernier enregistrement incomplet est
+ignoré à la relecture.
+
+``TrajectoryPlayer`` se place sur n'importe quel chronon en partant de l'image
+clé précédente : un déplacement en arrière ou un grand saut coûte au plus
+``keyframe_interval`` deltas. Le lecteur a les attributs ``point_x``,
+``point_y`` et ``store.species`` d'une grille : les rendus
+(interface/renderer.py) le dessinent comme une grille. L'âge et l'énergie des
+entités ne sont pas enregistrés (voir les points de reprise pour l'état complet).
+"""
+# Importation des modules nécessaires
+# re : recherche rapide (en C) des octets modifiés ; zlib : compression des enregistrements
+import os
+import re
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from aquatic.store import FISH, SHARK
+
+# Signature des fichiers d'enregistrement et version du format
+MAGIC: bytes = b"WATORREC"
+FORMAT_VERSION: int = 2
+# En-tête : signature, version, largeur, hauteur (entiers little-endian)
+HEADER: struct.Struct = struct.Struct("<8sIII")
+# Enregistrement : nature, chronon, nombre de cellules (toutes, ou modifiées), taille des données compressées
+RECORD: struct.Struct = struct.Struct("<cQII")
+KEYFRAME: bytes = b"K"  # Image clé : tout le tableau des espèces
+DELTA: bytes = b"D"  # Delta : cellules modifiées depuis le chronon précédent et leur nouvelle espèce
+DEFAULT_KEYFRAME_INTERVAL: int = 100  # Chronons entre deux images clés
+COMPRESSION_LEVEL: int = 1  # Niveau zlib : rapide, les écarts entre cellules se répètent beaucoup
+# Proportion de cellules modifiées au-delà de laquelle une image clé remplace le delta : une cellule
+# modifiée coûte 5 octets avant compression (écart et espèce), une image clé 1/4 d'octet par cellule
+DELTA_MAX_CHANGED: float = 0.05
+
+CELLS_PER_BYTE: int = 4  # Cellules regroupées dans un octet (2 bits par cellule)
+
+# Octet non nul (cellule modifiée dans le OU exclusif de deux images)
+CHANGED = re.compile(b"[^\x00]")
+
+
+def pack_species(species: bytes) -> bytes:
+    """Regroupe quatre cellules par octet (codes de 0 à 3, 2 bits chacun).
+
+    Args:
+        species (bytes): Un octet par cellule
+
+    Returns:
+        bytes: Un octet pour quatre cellules (la dernière complétée par des cellules vides)
+    """
+    padded = len(species) + -len(species) % CELLS_PER_BYTE
+    value = int.from_bytes(species, "little")
+    value |= (value >> 6) | (value >> 12) | (value >> 18)
+    return value.to_bytes(padded, "little")[::CELLS_PER_BYTE]
+
+
+def unpack_species(packed: bytes, cells: int) -> bytes:
+    """Sépare les cellules regroupées par pack_species.
+
+    Args:
+        packed (bytes): Un octet pour quatre cellules
+        cells (int): Nombre de cellules
+
+    Returns:
+        bytes: Un octet par cellule
+    """
+    spread = bytearray(len(packed) * CELLS_PER_BYTE)
+    spread[::CELLS_PER_BYTE] = packed
+    value = int.from_bytes(spread, "little")
+    value = (value | (value << 6) | (value << 12) | (value << 18)) & int.from_bytes(b"\x03" * len(spread), "little")
+    return value.to_bytes(len(spread) + 3, "little")[:cells]
+
+
+def xor_bytes(previous: bytes, current: bytes) -> bytes:
+    """Calcule le OU exclusif de deux images d'un bloc, sur des entiers Python.
+
+    Args:
+        previous (bytes): Tableau des espèces du chronon précédent
+        current (bytes): Tableau des espèces du chronon courant (même taille)
+
+    Returns:
+        bytes: Octet non nul pour chaque cellule modifiée, nul ailleurs
+    """
+    difference = int.from_bytes(previous, "little") ^ int.from_bytes(current, "little")
+    return difference.to_bytes(len(previous), "little")
+
+
+def encode_delta(cells: List[int], species: bytes) -> bytes:
+    """Compresse un delta : écarts entre cellules modifiées successives (entiers 32 bits little-endian),
+    puis nouvelle espèce de chaque cellule.
+
+    Args:
+        cells (List[int]): Cellules modifiées, dans l'ordre croissant
+        species (bytes): Nouvelle espèce de chaque cellule modifiée
+
+    Returns:
+        bytes: Données compressées du delta
+    """
+    gaps = array("I", [cell - previous for previous, cell in zip([0] + cells, cells)])
+    if sys.byteorder == "big":
+        gaps.byteswap()
+    return zlib.compress(gaps.tobytes() + species, COMPRESSION_LEVEL)
+
+
+def decode_delta(payload: bytes, count: int) -> Tuple[List[int], bytes]:
+    """Décompresse un delta écrit par encode_delta.
+
+    Args:
+        payload (bytes): Données compressées du delta
+        count (int): Nombre de cellules modifiées
+
+    Returns:
+        Tuple[List[int], bytes]: Cellules modifiées et nouvelle espèce de chacune
+    """
+    data = zlib.decompress(payload)
+    gaps = array("I")
+    gaps.frombytes(data[:gaps.itemsize * count])
+    if sys.byteorder == "big":
+        gaps.byteswap()
+    return list(accumulate(gaps)), data[gaps.itemsize * count:]
+
+
+def changed_cells(previous: bytes, current: bytes) -> List[int]:
+    """Retourne les indices des cellules dont l'espèce diffère entre deux images.
+
+    Args:
+        previous (bytes): Tableau des espèces du chronon précédent
+        current (bytes): Tableau des espèces du chronon courant (même taille)
+
+    Returns:
+        List[int]: Indices des cellules modifiées, dans l'ordre croissant
+    """
+    return [match.start() for match in CHANGED.finditer(xor_bytes(previous, current))]
+
+
+class TrajectoryRecorder:
+    """Écrit la trajectoire d'une grille, un enregistrement par chronon (voir Grid.start_recording)."""
+
+    def __init__(self, path: str, point_x: int, point_y: int,
+                 keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+        """Crée le fichier d'enregistrement (remplacé s'il existe).
+
+        Args:
+            path (str): Fichier d'enregistrement
+            point_x (int): Largeur de la grille
+            point_y (int): Hauteur de la grille
+            keyframe_interval (int, optional): Chronons entre deux images clés. Defaults to DEFAULT_KEYFRAME_INTERVAL.
+
+        Raises:
+            ValueError: Si l'intervalle entre images clés n'est pas positif
+        """
+        if keyframe_interval < 1:
+            raise ValueError(f"Intervalle entre images clés invalide : {keyframe_interval}")
+        self.path: str = path
+        self.point_x: int = point_x  # Largeur de la grille
+        self.point_y: int = point_y  # Hauteur de la grille
+        self.keyframe_interval: int = keyframe_interval
+        self.file: BinaryIO = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, FORMAT_VERSION, point_x, point_y))
+        self.previous: Optional[bytes] = None  # Espèces du dernier chronon enregistré
+        self.last_chronon: Optional[int] = None  # Dernier chronon enregistré
+        self.since_keyframe: int = 0  # Enregistrements depuis la dernière image clé
+        self.frames: int = 0  # Nombre total d'enregistrements
+
+    def record(self, chronon: int, species: Any) -> None:
+        """Enregistre l'état d'un chronon : un delta par rapport au chronon précédent,
+        ou une image clé (premier chronon, intervalle atteint, chronon non consécutif
+        comme après une réinitialisation de la grille, ou plus de DELTA_MAX_CHANGED
+        des cellules modifiées). Seule l'image choisie est compressée.
+
+        Args:
+            chronon (int): Numéro du chronon
+            species (Any): Tableau des espèces de la grille (store.species)
+        """
+        current = bytes(species)
+        cells = None
+        if (self.previous is not None and chronon == self.last_chronon + 1
+                and self.since_keyframe < self.keyframe_interval):
+            cells = changed_cells(self.previous, current)
+            if len(cells) > DELTA_MAX_CHANGED * len(current):
+                cells = None
+        if cells is not None:
+            self._write(DELTA, chronon, len(cells), encode_delta(cells, bytes(map(current.__getitem__, cells))))
+        else:
+            self._write(KEYFRAME, chronon, len(current), zlib.compress(pack_species(current), COMPRESSION_LEVEL))
+            self.since_keyframe = 0
+        self.since_keyframe += 1
+        self.frames += 1
+        self.previous = current
+        self.last_chronon = chronon
+
+    def _write(self, kind: bytes, chronon: int, count: int, payload: bytes) -> None:
+        """Écrit un enregistrement à la suite du fichier."""
+        self.file.write(RECORD.pack(kind, chronon, count, len(payload)))
+        self.file.write(payload)
+
+    def flush(self) -> None:
+        """Écrit sur le disque les enregistrements en attente."""
+        self.file.flush()
+
+    def close(self) -> None:
+        """Termine l'enregistrement et ferme le fichier."""
+        self.file.close()
+
+    def __enter__(self) -> 'TrajectoryRecorder':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class ReplayStore:
+    """Stockage minimal du lecteur : le tableau des espèces de l'image courante,
+    avec la même indexation que EntityStore."""
+
+    def __init__(self, point_x: int, point_y: int) -> None:
+        """Initialise un océan vide.
+
+        Args:
+            point_x (int): Largeur de la grille
+            point_y (int): Hauteur de la grille
+        """
+        self.point_x: int = point_x
+        self.point_y: int = point_y
+        self.species: bytearray = bytearray(point_x * point_y)  # Espèce présente dans chaque cellule
+
+    def index(self, x: int, y: int) -> int:
+        """Retourne l'indice à plat de la cellule (x, y)."""
+        return x * self.point_y + y
+
+    def scan(self, species: int) -> int:
+        """Compte les cellules occupées par une espèce."""
+        return self.species.count(species)
+
+
+class TrajectoryPlayer:
+    """Relecture d'un enregistrement, chronon par chronon ou par sauts.
+    S'utilise de préférence comme gestionnaire de contexte (``with open_recording(path) as player``)."""
+
+    def __init__(self, path: str) -> None:
+        """Ouvre un enregistrement et indexe ses images (sans les décompresser).
+
+        Args:
+            path (str): Fichier écrit par TrajectoryRecorder
+
+        Raises:
+            ValueError: Si le fichier n'est pas un enregistrement valide
+        """
+        self.path: str = path
+        self.file: BinaryIO = open(path, "rb")
+        try:
+            header = self.file.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise ValueError("Fichier trop court pour être un enregistrement")
+            magic, version, point_x, point_y = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError("Ce fichier n'est pas un enregistrement Wa-Tor")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"Version d'enregistrement non prise en charge : {version}")
+            self.point_x: int = point_x  # Largeur de la grille
+            self.point_y: int = point_y  # Hauteur de la grille
+            # Index des images : (nature, nombre de cellules modifiées, position et taille des données)
+            self.frames: List[Tuple[bytes, int, int, int]] = []
+            self.chronons: List[int] = []  # Chronon de chaque image
+            self.keyframes: List[int] = []  # Numéros des images clés
+            self._index()
+        except (ValueError, OSError):
+            self.file.close()
+            raise
+        # Première image de chaque chronon (un chronon revient après une réinitialisation)
+        self.first_frame: Dict[int, int] = {}
+        for frame, chronon in enumerate(self.chronons):
+            self.first_frame.setdefault(chronon, frame)
+        self.store: ReplayStore = ReplayStore(point_x, point_y)
+        self.position: int = -1  # Image actuellement dans store (-1 : aucune)
+
+    def _index(self) -> None:
+        """Parcourt les en-têtes des enregistrements, sans lire leurs données.
+
+        Raises:
+            ValueError: Si un enregistrement est invalide ou si le premier n'est pas une image clé
+        """
+        size = os.fstat(self.file.fileno()).st_size
+        position = HEADER.size
+        while position + RECORD.size <= size:
+            self.file.seek(position)
+            kind, chronon, count, length = RECORD.unpack(self.file.read(RECORD.size))
+            offset = position + RECORD.size
+            if offset + length > size:
+                break  # Dernier enregistrement incomplet (écriture interrompue)
+            if kind not in (KEYFRAME, DELTA):
+                raise ValueError(f"Enregistrement invalide à la position {position}")
+            if kind == KEYFRAME:
+                self.keyframes.append(len(self.frames))
+            elif not self.keyframes:
+                raise ValueError("L'enregistrement ne commence pas par une image clé")
+            self.frames.append((kind, count, offset, length))
+            self.chronons.append(chronon)
+            position = offset + length
+
+    def _payload(self, frame: int) -> bytes:
+        """Lit les données compressées d'une image."""
+        _, _, offset, length = self.frames[frame]
+        self.file.seek(offset)
+        return self.file.read(length)
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    @property
+    def turn_count(self) -> int:
+        """Chronon de l'image courante."""
+        return self.chronons[self.position]
+
+    def seek(self, frame: int) -> Optional[List[int]]:
+        """Place le lecteur sur une image : les deltas sont appliqués depuis l'image courante
+        si elle la précède (après la même image clé), sinon depuis l'image clé précédente.
+
+        Args:
+            frame (int): Numéro de l'image (0 pour la première, len(player) - 1 pour la dernière)
+
+        Returns:
+            Optional[List[int]]: Cellules modifiées depuis l'image précédemment affichée,
+            ou None si tout l'océan a été relu (à redessiner entièrement)
+
+        Raises:
+            IndexError: Si l'image n'existe pas
+        """
+        if not 0 <= frame < len(self.frames):
+            raise IndexError(f"Image {frame} hors de l'enregistrement ({len(self.frames)} images)")
+        species = self.store.species
+        keyframe = self.keyframes[bisect_right(self.keyframes, frame) - 1]
+        resume = keyframe <= self.position <= frame
+        if resume:
+            start = self.position + 1
+        else:
+            species[:] = unpack_species(zlib.decompress(self._payload(keyframe)), len(species))
+            start = keyframe + 1
+        # Chaque delta ne touche que ses cellules modifiées
+        changed = set()
+        for current in range(start, frame + 1):
+            cells, values = decode_delta(self._payload(current), self.frames[current][1])
+            for cell, value in zip(cells, values):
+                species[cell] = value
+            if resume:
+                changed.update(cells)
+        self.position = frame
+        return sorted(changed) if resume else None
+
+    def seek_chronon(self, chronon: int) -> Optional[List[int]]:
+        """Place le lecteur sur la première image d'un chronon.
+
+        Args:
+            chronon (int): Numéro du chronon
+
+        Returns:
+            Optional[List[int]]: Cellules modifiées (voir seek)
+
+        Raises:
+            ValueError: Si le chronon n'a pas été enregistré
+        """
+        if chronon not in self.first_frame:
+            raise ValueError(f"Chronon {chronon} absent de l'enregistrement")
+        return self.seek(self.first_frame[chronon])
+
+    def __iter__(self) -> Iterator[Tuple[int, bytearray]]:
+        """Parcourt toutes les images dans l'ordre : (chronon, tableau des espèces).
+        Le tableau est réutilisé d'une image à l'autre (le copier pour le conserver)."""
+        for frame in range(len(self.frames)):
+            self.seek(frame)
+            yield self.chronons[frame], self.store.species
+
+    def species_at(self, x: int, y: int) -> int:
+        """Retourne le code de l'espèce présente dans la cellule (x, y) de l'image courante."""
+        return self.store.species[self.store.index(x, y)]
+
+    def count_entities(self) -> Tuple[int, int]:
+        """Compte les poissons et les requins de l'image courante.
+
+        Returns:
+            Tuple[int, int]: Nombre de poissons et nombre de requins
+        """
+        return self.store.scan(FISH), self.store.scan(SHARK)
+
+    def close(self) -> None:
+        """Ferme le fichier d'enregistrement."""
+        self.file.close()
+
+    def __enter__(self) -> 'TrajectoryPlayer':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def open_recording(path: str) -> TrajectoryPlayer:
+    """Ouvre un enregistrement pour le rejouer.
+
+    Args:
+        path (str): Fichier écrit par TrajectoryRecorder (ou Grid.start_recording)
+
+    Returns:
+        TrajectoryPlayer: Lecteur de l'enregistrement
+    """
+    return TrajectoryPlayer(path)
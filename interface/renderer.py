@@ -0,0 +1,165 @@
+"""
+Moteurs de rendu de la grille Wa-Tor dans l'interface Tkinter.
+
+Deux rendus sont disponibles :
+- ``LabelRenderer`` : un label emoji par cellule (rendu d'origine, réservé aux petites grilles)
+- ``PixelRenderer`` : toute la grille est peinte dans une seule ``tk.PhotoImage``,
+  un pixel (ou un petit bloc) par cellule, à partir d'un tampon d'octets construit en une passe
+
+Chaque rendu reçoit les cellules modifiées depuis le dernier dessin
+(voir EntityStore.take_dirty) et ne met à jour que celles-ci ; la grille
+entière n'est repeinte qu'au premier dessin ou après une remise à zéro.
+
+tkinter n'est importé que par PixelRenderer, à sa création : ce module reste
+importable en mode headless.
+"""
+# Importation des modules nécessaires
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from aquatic.store import EMPTY, FISH, SHARK
+
+# Couleurs de chaque espèce (mêmes teintes que les emojis)
+SPECIES_COLORS: Dict[int, Tuple[int, int, int]] = {
+    EMPTY: (0x1E, 0x90, 0xFF),  # Eau (bleu océan)
+    FISH: (0x32, 0xCD, 0x32),  # Poisson (vert)
+    SHARK: (0xFF, 0x45, 0x00),  # Requin (rouge-orange)
+}
+
+# Emoji et couleur de chaque espèce pour le rendu par labels
+SPECIES_EMOJIS: Dict[int, Tuple[str, str]] = {
+    EMPTY: ("🌊", "#1E90FF"),
+    FISH: ("🐟", "#32CD32"),
+    SHARK: ("🦈", "#FF4500"),
+}
+
+
+def channel_tables(colors: Dict[int, Tuple[int, int, int]]) -> Tuple[bytes, bytes, bytes]:
+    """Construit les tables de traduction code d'espèce -> composante rouge, verte et bleue.
+
+    Args:
+        colors (Dict[int, Tuple[int, int, int]]): Couleur RGB de chaque code d'espèce
+
+    Returns:
+        Tuple[bytes, bytes, bytes]: Tables de 256 octets utilisables avec bytes.translate
+    """
+    return tuple(bytes(colors.get(code, (0, 0, 0))[channel] for code in range(256))
+                 for channel in range(3))
+
+
+# Couleurs au format Tk (#rrggbb) pour les mises à jour cellule par cellule
+SPECIES_HEX: Dict[int, str] = {code: "#%02x%02x%02x" % rgb for code, rgb in SPECIES_COLORS.items()}
+
+# Au-delà de cette proportion de cellules modifiées, PixelRenderer repeint toute l'image
+FULL_REPAINT_RATIO: float = 0.02
+
+# Tables de traduction précalculées pour la palette par défaut
+CHANNEL_TABLES: Tuple[bytes, bytes, bytes] = channel_tables(SPECIES_COLORS)
+
+
+def species_to_ppm(species: Any, point_x: int, point_y: int,
+                   tables: Tuple[bytes, bytes, bytes] = CHANNEL_TABLES) -> bytes:
+    """Convertit le tableau des espèces en image PPM binaire (P6), un pixel par cellule.
+    Toutes les opérations travaillent sur des tampons d'octets entiers (pas de boucle par cellule).
+
+    Args:
+        species (Any): Tableau des espèces à plat (indice x * point_y + y), ex. EntityStore.species
+        point_x (int): Largeur de la grille (largeur de l'image)
+        point_y (int): Hauteur de la grille (hauteur de l'image)
+        tables (Tuple[bytes, bytes, bytes]): Tables de traduction des couleurs
+
+    Returns:
+        bytes: Image PPM de point_x x point_y pixels
+    """
+    data = bytes(species)
+    # Le stockage est rangé par colonne (x), l'image par ligne (y) : la ligne y
+    # regroupe une cellule sur point_y à partir de l'indice y
+    rows = b"".join(data[y::point_y] for y in range(point_y))
+    rgb = bytearray(3 * len(rows))
+    rgb[0::3] = rows.translate(tables[0])
+    rgb[1::3] = rows.translate(tables[1])
+    rgb[2::3] = rows.translate(tables[2])
+    return b"P6 %d %d 255\n" % (point_x, point_y) + bytes(rgb)
+
+
+class LabelRenderer:
+    """Rendu d'origine : un label emoji par cellule."""
+
+    def __init__(self, labels: List[List[Any]]) -> None:
+        """Initialise le rendu avec la matrice des labels.
+
+        Args:
+            labels (List[List[Any]]): Labels des cellules, indexés [x][y]
+        """
+        self.labels: List[List[Any]] = labels
+
+    def draw(self, grid: Any, cells: Optional[Iterable[int]] = None) -> None:
+        """Met à jour le texte et la couleur des labels.
+
+        Args:
+            grid (Any): Grille de simulation à dessiner
+            cells (Optional[Iterable[int]]): Cellules modifiées à redessiner, ou None pour toute la grille
+        """
+        species = grid.store.species
+        if cells is None:
+            cells = range(grid.point_x * grid.point_y)
+        for cell in cells:
+            x, y = divmod(cell, grid.point_y)
+            text, color = SPECIES_EMOJIS[species[cell]]
+            self.labels[x][y].config(text=text, fg=color, bg="white")
+
+
+class PixelRenderer:
+    """Rendu de toute la grille dans une seule image, adapté aux grandes grilles."""
+
+    def __init__(self, canvas: Any, point_x: int, point_y: int, scale: int = 1) -> None:
+        """Crée l'image et la place dans le canvas.
+
+        Args:
+            canvas (Any): Canvas Tkinter où afficher l'image
+            point_x (int): Largeur de la grille
+            point_y (int): Hauteur de la grille
+            scale (int, optional): Taille d'une cellule en pixels. Defaults to 1.
+        """
+        import tkinter as tk
+
+        self.point_x: int = point_x
+        self.point_y: int = point_y
+        self.scale: int = max(1, scale)
+        # Image à un pixel par cellule, recopiée avec un zoom si nécessaire
+        self.base = tk.PhotoImage(master=canvas, width=point_x, height=point_y)
+        if self.scale == 1:
+            self.image = self.base
+        else:
+            self.image = tk.PhotoImage(master=canvas, width=point_x * self.scale, height=point_y * self.scale)
+        canvas.create_image(0, 0, image=self.image, anchor="nw")
+        canvas.configure(scrollregion=(0, 0, point_x * self.scale, point_y * self.scale))
+
+    def draw(self, grid: Any, cells: Optional[Iterable[int]] = None) -> None:
+        """Met à jour l'image à partir du tableau des espèces de la grille.
+        Peu de cellules modifiées : chacune est repeinte individuellement.
+        Beaucoup de cellules modifiées (ou cells à None) : toute l'image est reconstruite d'un bloc.
+
+        Args:
+            grid (Any): Grille de simulation à dessiner
+            cells (Optional[Iterable[int]]): Cellules modifiées à redessiner, ou None pour toute la grille
+        """
+        if cells is not None:
+            cells = list(cells)
+            if len(cells) <= FULL_REPAINT_RATIO * self.point_x * self.point_y:
+                self.draw_cells(grid, cells)
+                return
+        self.base.configure(data=species_to_ppm(grid.store.species, self.point_x, self.point_y), format="PPM")
+        if self.image is not self.base:
+            self.image.tk.call(self.image.name, "copy", self.base.name, "-zoom", self.scale, self.scale)
+
+    def draw_cells(self, grid: Any, cells: List[int]) -> None:
+        """Repeint uniquement les cellules indiquées, un bloc de scale x scale pixels chacune.
+
+        Args:
+            grid (Any): Grille de simulation à dessiner
+            cells (List[int]): Indices des cellules à repeindre
+        """
+        species = grid.store.species
+        scale = self.scale
+        for cell in cells:
+            x, y = divmod(cell, self.point_y)
+            self.image.put(SPECIES_HEX[species[cell]], to=(x * scale, y * scale, (x + 1) * scale, (y + 1) * scale))
@@ -0,0 +1,93 @@
+"""
+Fenêtre Tkinter de relecture d'un enregistrement de trajectoire (voir interface/recording.py).
+
+L'océan est dessiné avec PixelRenderer, comme la simulation en direct ; un curseur
+permet de se placer sur n'importe quelle image et le bouton "Lire" rejoue
+l'enregistrement. Seules les cellules modifiées depuis l'image affichée sont
+repeintes quand on avance, tout l'océan après un saut en arrière.
+"""
+# Importation des modules nécessaires
+import tkinter as tk
+from interface.recording import open_recording
+from interface.renderer import PixelRenderer
+
+# Configuration de la fenêtre (mêmes dimensions que main.py)
+WINDOW_WIDTH: int = 800  # Largeur de la fenêtre en pixels
+WINDOW_HEIGHT: int = 600  # Hauteur de la fenêtre en pixels
+MARGIN: int = 10  # Marge autour des éléments en pixels
+CONTROL_HEIGHT: int = 80  # Hauteur du panneau de contrôle (avec le curseur) en pixels
+FRAME_DELAY_MS: int = 50  # Délai entre deux images pendant la lecture
+
+
+def open_replay_window(path: str) -> None:
+    """Ouvre la fenêtre de relecture et attend sa fermeture.
+
+    Args:
+        path (str): Fichier d'enregistrement
+    """
+    player = open_recording(path)
+
+    # Création de la fenêtre principale
+    root = tk.Tk()
+    root.title(f"Simulation Wa-Tor (relecture de {path})")
+    root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
+    root.configure(bg='white')
+
+    # Panneau de contrôle : informations, bouton de lecture et curseur des images
+    control_frame = tk.Frame(root, bg='white')
+    control_frame.pack(side=tk.TOP, fill=tk.X, padx=MARGIN, pady=MARGIN)
+    info_label = tk.Label(control_frame, text="", font=("Arial", 12))
+    info_label.pack(side=tk.LEFT, padx=5)
+    play_button = tk.Button(control_frame, text="Lire")
+    play_button.pack(side=tk.RIGHT, padx=5)
+    slider = tk.Scale(root, from_=0, to=max(0, len(player) - 1), orient=tk.HORIZONTAL, showvalue=False)
+    slider.pack(side=tk.TOP, fill=tk.X, padx=MARGIN)
+
+    # Océan dessiné dans une seule image, un bloc de pixels par cellule
+    canvas = tk.Canvas(root, bg='white')
+    canvas.pack(side=tk.TOP, expand=True, fill=tk.BOTH, padx=MARGIN, pady=MARGIN)
+    available_width = WINDOW_WIDTH - 2 * MARGIN
+    available_height = WINDOW_HEIGHT - CONTROL_HEIGHT - 2 * MARGIN
+    scale = max(1, min(available_width // player.point_x, available_height // player.point_y))
+    renderer = PixelRenderer(canvas, player.point_x, player.point_y, scale)
+
+    state = {"playing": False}
+
+    def show(frame: int) -> None:
+        """Affiche une image de l'enregistrement."""
+        if frame == player.position:
+            return
+        renderer.draw(player, player.seek(frame))
+        fish_count, shark_count = player.count_entities()
+        info_label.config(text=f"Chronon : {player.turn_count} | Poissons : {fish_count} | "
+                               f"Requins : {shark_count} | Image {frame + 1}/{len(player)}")
+
+    def tick() -> None:
+        """Passe à l'image suivante pendant la lecture."""
+        if not state["playing"]:
+            return
+        if player.position + 1 >= len(player):
+            toggle()
+            return
+        slider.set(player.position + 1)
+        show(player.position + 1)
+        root.after(FRAME_DELAY_MS, tick)
+
+    def toggle() -> None:
+        """Lance ou arrête la lecture."""
+        state["playing"] = not state["playing"]
+        play_button.config(text="Pause" if state["playing"] else "Lire")
+        if state["playing"]:
+            tick()
+
+    def on_close() -> None:
+        state["playing"] = False
+        player.close()
+        root.destroy()
+
+    play_button.config(command=toggle)
+    slider.config(command=lambda value: show(int(value)))
+    root.protocol("WM_DELETE_WINDOW", on_close)
+    if len(player):
+        show(0)
+    root.mainloop()
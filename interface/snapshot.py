@@ -0,0 +1,191 @@
+"""
+Lecture en mémoire projetée (mmap) des points de reprise de la simulation Wa-Tor.
+
+Un point de reprise non compressé (voir interface/checkpoint.py) range chaque
+tableau du stockage, aligné, à une position connue du fichier : ``open_snapshot``
+projette le fichier en mémoire et expose ces tableaux en lecture seule, sans
+les copier ni créer d'objet Fish/Shark. Seules les pages réellement lues sont
+chargées par le système : un océan de 10^8 cellules s'ouvre instantanément,
+même s'il ne tient pas confortablement en mémoire.
+
+Les tableaux gardent la disposition de la grille (indice ``x * point_y + y``,
+comme ``cells[x][y]``). Un instantané a les attributs ``point_x``, ``point_y``
+et ``store`` d'une grille : les rendus (interface/renderer.py) et les outils
+d'analyse le lisent comme une grille. Les tableaux compressés, ou écrits sur
+une machine d'ordre des octets différent, sont décompressés en mémoire.
+"""
+# Importation des modules nécessaires
+# mmap : projection du fichier en mémoire, en lecture seule
+import mmap
+import sys
+from array import array
+from typing import Any, Dict, Tuple
+from aquatic.store import FISH, SHARK
+from interface import checkpoint
+from interface.numpy_engine import np
+
+# Types NumPy des tableaux du stockage
+NUMPY_TYPES: Dict[str, str] = {"B": "u1", "i": "i4", "q": "i8"}
+
+
+class MappedStore:
+    """Stockage en lecture seule d'un instantané : mêmes tableaux et même indexation
+    que EntityStore, mais aucune écriture possible."""
+
+    def __init__(self, point_x: int, point_y: int, arrays: Dict[str, Any]) -> None:
+        """Initialise le stockage sur les tableaux de l'instantané.
+
+        Args:
+            point_x (int): Largeur de la grille
+            point_y (int): Hauteur de la grille
+            arrays (Dict[str, Any]): Tableaux species, age, energy, ids (vues en lecture seule)
+        """
+        self.point_x: int = point_x
+        self.point_y: int = point_y
+        self.species: Any = arrays["species"]  # Espèce présente dans chaque cellule
+        self.age: Any = arrays["age"]  # Âge de l'entité de chaque cellule
+        self.energy: Any = arrays["energy"]  # Énergie du requin de chaque cellule
+        self.ids: Any = arrays["ids"]  # Identifiant de l'entité de chaque cellule
+
+    def index(self, x: int, y: int) -> int:
+        """Retourne l'indice à plat de la cellule (x, y)."""
+        return x * self.point_y + y
+
+    def scan(self, species: int) -> int:
+        """Compte les cellules occupées par une espèce, colonne par colonne (sans tout charger à la fois).
+
+        Args:
+            species (int): Code de l'espèce
+
+        Returns:
+            int: Nombre d'entités de cette espèce
+        """
+        step = max(1, checkpoint.CHUNK_BYTES // max(1, self.point_y)) * self.point_y
+        return sum(bytes(self.species[start:start + step]).count(species)
+                   for start in range(0, len(self.species), step))
+
+
+class Snapshot:
+    """Instantané d'un océan, lu en mémoire projetée.
+    S'utilise de préférence comme gestionnaire de contexte (``with open_snapshot(path) as snapshot``)."""
+
+    def __init__(self, path: str) -> None:
+        """Ouvre un point de reprise et projette ses tableaux en mémoire.
+
+        Args:
+            path (str): Fichier écrit par Grid.save
+
+        Raises:
+            ValueError: Si le fichier n'est pas un point de reprise valide
+        """
+        self.path: str = path
+        self.file = open(path, "rb")
+        try:
+            self.header: Dict[str, Any] = checkpoint.read_header(self.file)
+            self.mmap: mmap.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            self.file.close()
+            raise
+        self.point_x: int = self.header["point_x"]  # Largeur de la grille
+        self.point_y: int = self.header["point_y"]  # Hauteur de la grille
+        self.turn_count: int = self.header["turn_count"]  # Chronon de l'instantané
+        self.engine: str = self.header["engine"]  # Moteur de la simulation enregistrée
+        self.store: MappedStore = MappedStore(self.point_x, self.point_y,
+                                              {name: self._map(name) for name in checkpoint.ARRAYS})
+
+    def mapped(self, name: str) -> bool:
+        """Indique si un tableau est lu directement dans le fichier (sinon il a été chargé en mémoire).
+
+        Args:
+            name (str): Nom du tableau (species, age, energy ou ids)
+
+        Returns:
+            bool: True si le tableau est projeté en mémoire
+        """
+        entry = self.header["arrays"][name]
+        return not entry["compressed"] and (self.header["byteorder"] == sys.byteorder
+                                            or array(entry["typecode"]).itemsize == 1)
+
+    def _map(self, name: str) -> Any:
+        """Retourne la vue en lecture seule d'un tableau de l'instantané.
+
+        Args:
+            name (str): Nom du tableau
+
+        Returns:
+            Any: memoryview sur le fichier projeté, ou sur une copie en mémoire si le tableau
+            est compressé ou dans un autre ordre des octets
+        """
+        entry = self.header["arrays"][name]
+        if self.mapped(name):
+            raw = memoryview(self.mmap)[entry["offset"]:entry["offset"] + entry["nbytes"]]
+            return raw.cast(entry["typecode"])
+        data = array(entry["typecode"], bytes(array(entry["typecode"]).itemsize * entry["count"]))
+        checkpoint.read_array(self.file, entry, data, self.header["byteorder"])
+        return memoryview(data).toreadonly()
+
+    def grid_view(self, name: str) -> "np.ndarray":
+        """Retourne un tableau NumPy (point_x, point_y) en lecture seule : ``grid_view("species")[x][y]``
+        correspond à ``cells[x][y]``. Le fichier est projeté par NumPy, rien n'est copié.
+
+        Args:
+            name (str): Nom du tableau (species, age, energy ou ids)
+
+        Returns:
+            np.ndarray: Vue en lecture seule sur le tableau
+
+        Raises:
+            ImportError: Si NumPy n'est pas installé
+        """
+        if np is None:
+            raise ImportError("grid_view nécessite le paquet numpy (pip install numpy)")
+        entry = self.header["arrays"][name]
+        if not self.mapped(name):
+            view = np.frombuffer(getattr(self.store, name), dtype=NUMPY_TYPES[entry["typecode"]])
+            return view.reshape(self.point_x, self.point_y)
+        dtype = np.dtype(NUMPY_TYPES[entry["typecode"]])
+        if self.header["byteorder"] != sys.byteorder:
+            dtype = dtype.newbyteorder()
+        return np.memmap(self.path, dtype=dtype, mode="r", offset=entry["offset"],
+                         shape=(self.point_x, self.point_y))
+
+    def species_at(self, x: int, y: int) -> int:
+        """Retourne le code de l'espèce présente dans la cellule (x, y)."""
+        return self.store.species[self.store.index(x, y)]
+
+    def count_entities(self) -> Tuple[int, int]:
+        """Compte les poissons et les requins de l'instantané (parcours de tout le tableau des espèces).
+
+        Returns:
+            Tuple[int, int]: Nombre de poissons et nombre de requins
+        """
+        return self.store.scan(FISH), self.store.scan(SHARK)
+
+    def close(self) -> None:
+        """Libère les vues et ferme le fichier projeté.
+
+        Raises:
+            BufferError: Si une vue sur les tableaux (ex. memoryview extraite de store) est encore utilisée
+        """
+        for name in checkpoint.ARRAYS:
+            getattr(self.store, name).release()
+        self.mmap.close()
+        self.file.close()
+
+    def __enter__(self) -> 'Snapshot':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def open_snapshot(path: str) -> Snapshot:
+    """Ouvre un point de reprise en lecture seule, en mémoire projetée.
+
+    Args:
+        path (str): Fichier écrit par Grid.save
+
+    Returns:
+        Snapshot: Instantané de l'océan
+    """
+    return Snapshot(path)
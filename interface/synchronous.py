@@ -0,0 +1,137 @@
+"""
+Mise à jour synchrone du moteur objet (ordonnancement ``"synchronous"``).
+
+Avec les ordonnancements ``"shuffle"`` et ``"sublattice"``, les entités jouent
+l'une après l'autre sur une grille modifiée au fil du chronon : chaque entité
+voit les déplacements de celles qui l'ont précédée, et un ensemble des cases
+déjà jouées évite de faire jouer deux fois une entité qui s'est déplacée.
+
+Ici, chaque chronon lit l'état précédent (tampon de lecture, le stockage de la
+grille) et écrit le nouvel état dans un second stockage (tampon d'écriture) ;
+les deux sont échangés à la fin du chronon (``EntityStore.swap``). Toutes les
+décisions sont prises sur l'état précédent, en deux phases :
+
+1. Repas : chaque requin choisit un poisson voisin. Si plusieurs requins
+   visent le même poisson, le premier dans l'ordre de priorité le mange ; les
+   autres restent sans repas pour ce chronon (pénalité de faim).
+2. Cases vides : chaque entité encore en jeu (poisson non mangé, requin sans
+   repas) demande une case vide voisine pour se déplacer, puis, si elle est en
+   âge de se reproduire, une autre case vide voisine de sa position d'origine
+   pour son petit. Chaque case vide va au premier demandeur dans l'ordre de
+   priorité ; une entité qui n'obtient pas sa case reste sur place et un petit
+   qui n'obtient pas la sienne ne naît pas.
+
+L'ordre de priorité est une permutation aléatoire des entités, tirée à chaque
+chronon : le résultat ne dépend pas de l'ordre de parcours des cellules. Les
+règles (vieillissement, énergie, famine, âge de reproduction) sont celles du
+moteur objet (aquatic/fish.py, aquatic/shark.py). Un requin mort de faim ne
+demande aucune case.
+"""
+# Importation des modules nécessaires
+from typing import Dict, List, Tuple
+from aquatic.store import EntityStore, EMPTY, FISH, SHARK, MOVES, MEALS, BIRTHS, STARVATIONS
+from interface.neighborhood import directions_of, neighbor_index
+from interface.numpy_engine import BABY_SHARK_ENERGY, HUNGER_PENALTY
+from interface.random_stream import RandomStream
+
+
+class SynchronousUpdate:
+    """Chronon synchrone à double tampon pour le moteur objet.
+    Cette classe est utilisée par ``Grid`` lorsque l'ordonnancement ``"synchronous"`` est choisi."""
+
+    def __init__(self, store: EntityStore, stream: RandomStream, neighborhood: str) -> None:
+        """Initialise la mise à jour synchrone sur le stockage d'une grille.
+
+        Args:
+            store (EntityStore): Stockage des entités de la grille (tampon de lecture)
+            stream (RandomStream): Flux de tirages aléatoires de la grille
+            neighborhood (str): Voisinage des cellules
+        """
+        self.store: EntityStore = store
+        self.stream: RandomStream = stream
+        self.neighborhood: str = neighborhood
+        # Tampon d'écriture, vide entre deux chronons
+        self.back: EntityStore = EntityStore(store.point_x, store.point_y)
+        self.back.index_occupancy()
+        # Table à plat des voisins, gardée pour toute la simulation (la taille ne change pas)
+        self.neighbors = neighbor_index(store.point_x, store.point_y, neighborhood)
+        self.count: int = len(directions_of(neighborhood))
+
+    def step(self) -> None:
+        """Joue un chronon : lit le stockage de la grille, écrit dans le tampon, puis les échange."""
+        store, back, stream = self.store, self.back, self.stream
+        species, age, energy, ids = store.species, store.age, store.energy, store.ids
+        neighbors, count = self.neighbors, self.count
+        fish_reproduction_time = store.reproduction_time[FISH]
+        shark_reproduction_time = store.reproduction_time[SHARK]
+        events = store.events
+
+        # Ordre de priorité des entités pour ce chronon
+        order = store.occupied_cells()
+        stream.shuffle(order)
+
+        # Phase 1 : repas (poisson visé -> requin qui le mange)
+        meals: Dict[int, int] = {}
+        for cell in order:
+            if species[cell] == SHARK:
+                prey = [neighbors[slot] for slot in range(cell * count, cell * count + count)
+                        if species[neighbors[slot]] == FISH]
+                if prey:
+                    target = stream.choice(prey)
+                    if target not in meals:
+                        meals[target] = cell
+        fed = {shark: fish for fish, shark in meals.items()}
+        events[MEALS] += len(meals)
+        events[MOVES] += len(meals)
+
+        # Phase 2 : attribution des cases vides (déplacements et naissances)
+        claimed: Dict[int, int] = {}  # Case vide -> entité (cellule d'origine) qui l'obtient
+        placements: List[Tuple[int, int, int, int, int]] = []  # Cellule, espèce, âge, énergie, identifiant
+        cribs: List[Tuple[int, int, int]] = []  # Cellule, espèce et énergie de chaque nouveau-né
+        for cell in order:
+            kind = species[cell]
+            if kind == FISH:
+                if cell in meals:
+                    continue  # Mangé pendant la phase 1
+                new_age = age[cell] + 1
+                new_energy = 0
+                ready = new_age >= fish_reproduction_time
+            else:
+                new_age = age[cell] + 1
+                if cell in fed:
+                    new_energy = energy[cell] + store.energy_from_fish - 1
+                else:
+                    new_energy = energy[cell] - HUNGER_PENALTY - 1
+                if new_energy <= 0:
+                    events[STARVATIONS] += 1
+                    continue
+                ready = shark_reproduction_time > 0 and new_age % shark_reproduction_time == 0
+            empty = [neighbors[slot] for slot in range(cell * count, cell * count + count)
+                     if species[neighbors[slot]] == EMPTY]
+            position = fed.get(cell, cell)
+            if cell not in fed and empty:
+                target = stream.choice(empty)
+                empty.remove(target)
+                if target not in claimed:
+                    claimed[target] = cell
+                    position = target
+                    events[MOVES] += 1
+            if ready and empty:
+                crib = stream.choice(empty)
+                if crib not in claimed:
+                    claimed[crib] = cell
+                    cribs.append((crib, kind, BABY_SHARK_ENERGY if kind == SHARK else 0))
+                    if kind == FISH:
+                        new_age = 0
+            placements.append((position, kind, new_age, new_energy, ids[cell]))
+
+        # Écriture du nouvel état dans le tampon, puis échange des deux tampons
+        for position, kind, new_age, new_energy, identifier in placements:
+            back.place(position, kind, new_age, new_energy, identifier)
+        for crib, kind, new_energy in cribs:
+            back.place(crib, kind, 0, new_energy, store.allocate_ids(kind, 1))
+        events[BIRTHS] += len(cribs)
+        store.swap(back)
+        # L'ancien état est effacé : le tampon est vide pour le chronon suivant
+        for cell in list(back.occupied):
+            back.clear(cell)
@@ -0,0 +1,356 @@
+"""
+Moteur de simulation multi-processus (NumPy) pour les très grands océans Wa-Tor.
+
+Le tore est découpé en bandes de colonnes (``x`` de ``first_x`` à ``last_x``),
+ce qui fait de chaque bande une tranche contiguë des tableaux à plat (indice
+``x * point_y + y``). Les tableaux du stockage de la grille sont alloués en
+mémoire partagée (``multiprocessing.RawArray``, voir EntityStore.adopt) : un
+pool de processus les lit et les écrit sans copie, et chaque processus fait
+jouer les entités des bandes qu'on lui confie avec les règles du moteur
+``"numpy"`` (voir interface/numpy_engine.py). Le processus principal ne
+parcourt jamais tout l'océan pendant un chronon.
+
+Une entité se déplace (ou donne naissance) d'au plus une case, dans chaque
+direction et avec les deux voisinages (von Neumann ou Moore) : une bande ne
+lit et n'écrit que ses propres colonnes et la colonne de bordure de chacune de
+ses deux voisines (le halo). Le nombre de bandes est pair et chaque bande fait
+au moins deux colonnes de large, si bien que deux bandes de même parité n'ont
+jamais de cellule en commun, halos compris. Un chronon se joue donc en deux
+phases : toutes les bandes paires en parallèle, puis toutes les bandes impaires.
+
+Règle de passage d'une bande à l'autre : une entité qui entre dans la bande
+voisine (déplacement, repas ou naissance) appartient dès lors à cette bande,
+mais elle est marquée comme ayant déjà joué (tableau partagé ``moved``) et ne
+rejoue donc pas lors de la phase suivante. Chaque bande efface elle-même les
+marques de ses colonnes : une bande paire au début de la première phase, une
+bande impaire à la fin de la seconde (plus aucune bande ne l'écrit ensuite).
+
+Les nouveau-nés reçoivent d'abord l'identifiant provisoire NEWBORN_ID : les
+bandes d'une phase jouent en même temps et ne connaissent pas le nombre de
+naissances des autres. Chaque bande renvoie les cellules de ses nouveau-nés,
+et leurs identifiants définitifs sont attribués à la fin du chronon, bande
+après bande : les compteurs d'identifiants n'avancent que du nombre de
+naissances.
+
+Différences avec le moteur ``"numpy"`` : à chaque chronon, les entités des
+bandes paires jouent toutes avant celles des bandes impaires (l'ordre n'est
+mélangé qu'à l'intérieur d'une bande), et les identifiants des nouveau-nés
+suivent l'ordre des bandes et non l'ordre des naissances. Le résultat ne dépend ni du
+nombre de processus ni de l'ordre dans lequel ils terminent : une même graine
+et un même nombre de bandes (DEFAULT_TILES par défaut) donnent toujours la même
+simulation.
+"""
+# Importation des modules nécessaires
+# multiprocessing : pool de processus et tableaux en mémoire partagée
+# weakref : arrêt du pool quand le moteur est détruit
+import multiprocessing
+import os
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+from aquatic.store import EntityStore, EMPTY, FISH, SHARK, EVENT_NAMES
+from interface.neighborhood import VON_NEUMANN
+from interface.numpy_engine import VectorizedOcean, neighbor_table, np, DEFAULT_BATCHES
+
+# Largeur minimale d'une bande : au-delà du halo, deux bandes de même parité ne se touchent pas
+MIN_TILE_WIDTH: int = 2
+
+# Nombre de bandes par défaut (32 bandes par phase) : il ne dépend pas de la machine,
+# pour qu'une même graine donne la même simulation partout
+DEFAULT_TILES: int = 64
+
+# Travail d'une bande pour un chronon : indice de la bande, graine du chronon, temps de reproduction
+# (par espèce), énergie d'un repas, nombre de lots, ordonnancement
+TileTask = Tuple[int, int, List[int], int, int, str]
+
+# Résultat d'une bande : variation du nombre d'entités de chaque espèce, nombre d'événements,
+# cellules des nouveau-nés
+TileResult = Tuple[List[int], List[int], "np.ndarray"]
+
+# Identifiant provisoire d'un nouveau-né, remplacé à la fin du chronon (voir TiledOcean.step)
+NEWBORN_ID: int = -1
+
+# État d'un processus du pool : tableaux partagés, dimensions, bornes des bandes, bandes déjà construites
+_worker: Dict[str, Any] = {}
+
+
+def tile_bounds(point_x: int, tiles: int) -> List[Tuple[int, int]]:
+    """Découpe les colonnes de la grille en bandes de largeurs presque égales.
+
+    Args:
+        point_x (int): Largeur de la grille
+        tiles (int): Nombre de bandes (pair)
+
+    Returns:
+        List[Tuple[int, int]]: Première colonne et colonne suivant la dernière de chaque bande
+
+    Raises:
+        ValueError: Si le nombre de bandes est impair ou si une bande ferait moins de MIN_TILE_WIDTH colonnes
+    """
+    if tiles < 2 or tiles % 2:
+        raise ValueError(f"Le nombre de bandes doit être pair et au moins égal à 2 (reçu : {tiles})")
+    if point_x < tiles * MIN_TILE_WIDTH:
+        raise ValueError(f"Grille trop étroite ({point_x} colonnes) pour {tiles} bandes "
+                         f"d'au moins {MIN_TILE_WIDTH} colonnes")
+    edges = [point_x * tile // tiles for tile in range(tiles + 1)]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def default_tiles(point_x: int) -> int:
+    """Choisit le nombre de bandes : DEFAULT_TILES, dans la limite de la largeur de la grille.
+
+    Args:
+        point_x (int): Largeur de la grille
+
+    Returns:
+        int: Nombre pair de bandes
+    """
+    widest = point_x // MIN_TILE_WIDTH
+    return max(2, min(DEFAULT_TILES, widest - widest % 2))
+
+
+def shared_views(arrays: Tuple[Any, ...]) -> Tuple["np.ndarray", ...]:
+    """Retourne les vues NumPy (sans copie) sur les tableaux partagés de l'océan.
+
+    Args:
+        arrays (Tuple[Any, ...]): Tableaux partagés species, age, energy, ids, moved
+
+    Returns:
+        Tuple[np.ndarray, ...]: Vues species, age, energy, ids, moved
+    """
+    species, age, energy, ids, moved = arrays
+    return (np.frombuffer(species, dtype=np.uint8), np.frombuffer(age, dtype=np.int32),
+            np.frombuffer(energy, dtype=np.int32), np.frombuffer(ids, dtype=np.int64),
+            np.frombuffer(moved, dtype=bool))
+
+
+class TileOcean(VectorizedOcean):
+    """Bande de colonnes de l'océan, jouée avec les règles du moteur ``"numpy"``.
+    Les tableaux sont ceux de tout l'océan (mémoire partagée) ; seule la table
+    des voisins est limitée aux cellules de la bande."""
+
+    def __init__(self, arrays: Tuple[Any, ...], point_x: int, point_y: int, tile: int,
+                 first_x: int, last_x: int, neighborhood: str = VON_NEUMANN) -> None:
+        """Initialise une bande sur les tableaux partagés de l'océan.
+
+        Args:
+            arrays (Tuple[Any, ...]): Tableaux partagés species, age, energy, ids, moved
+            point_x (int): Largeur de la grille
+            point_y (int): Hauteur de la grille
+            tile (int): Indice de la bande
+            first_x (int): Première colonne de la bande
+            last_x (int): Colonne suivant la dernière colonne de la bande
+            neighborhood (str): Voisinage ("von_neumann" ou "moore"). Defaults to "von_neumann".
+        """
+        self.point_x: int = point_x
+        self.point_y: int = point_y
+        self.tile: int = tile
+        self.first: int = first_x * point_y  # Première cellule de la bande
+        self.last: int = last_x * point_y  # Cellule suivant la dernière cellule de la bande
+        self.species, self.age, self.energy, self.ids, self.moved = shared_views(arrays)
+        self.neighborhood: str = neighborhood
+        self.neighbors = neighbor_table(point_x, point_y, first_x, last_x, neighborhood)
+        # Compteurs de la bande pour un chronon (variations de population, événements, identifiants) ;
+        # le stockage n'a aucune cellule, seuls ses compteurs et ses paramètres servent
+        self.store: EntityStore = EntityStore(0, 0)
+        self.batches: int = DEFAULT_BATCHES
+        self.schedule: str = "shuffle"
+        self.cribs: List["np.ndarray"] = []  # Cellules des nouveau-nés du chronon
+
+    def neighbors_of(self, cells: "np.ndarray") -> "np.ndarray":
+        """Retourne les cellules voisines de cellules de la bande (voir VectorizedOcean.neighbors_of)."""
+        return self.neighbors[cells - self.first]
+
+    def _name_newborns(self, cribs: "np.ndarray", species: int) -> None:
+        """Donne aux nouveau-nés l'identifiant provisoire NEWBORN_ID et retient leurs cellules
+        (voir VectorizedOcean._name_newborns et TiledOcean.step).
+
+        Args:
+            cribs (np.ndarray): Cellules des nouveau-nés
+            species (int): Espèce des nouveau-nés
+        """
+        self.ids[cribs] = NEWBORN_ID
+        self.cribs.append(cribs)
+
+    def run(self, task: TileTask) -> TileResult:
+        """Fait jouer les entités de la bande qui n'ont pas encore joué pendant ce chronon.
+
+        Args:
+            task (TileTask): Travail de la bande pour ce chronon
+
+        Returns:
+            TileResult: Variation du nombre d'entités de chaque espèce (indexée par code d'espèce),
+            nombre d'événements de la bande et cellules de ses nouveau-nés
+        """
+        _, seed, reproduction_time, energy_from_fish, batches, schedule = task
+        store = self.store
+        store.counts = [0, 0, 0]
+        store.events = [0] * len(EVENT_NAMES)
+        store.reproduction_time = list(reproduction_time)
+        store.energy_from_fish = energy_from_fish
+        self.batches = batches
+        self.schedule = schedule
+        # Générateur propre à la bande et au chronon : le résultat ne dépend pas du processus qui la joue
+        self.rng = np.random.default_rng([seed, self.tile])
+        self.cribs = []
+        moved = self.moved[self.first:self.last]
+        if self.tile % 2 == 0:
+            # Première phase : marques du chronon précédent, y compris celles des bandes impaires (halo)
+            moved[:] = False
+        self.play(self.first + np.flatnonzero(self.species[self.first:self.last] != EMPTY))
+        if self.tile % 2 == 1:
+            # Fin de la seconde phase : plus aucune bande n'écrit dans celle-ci pendant ce chronon
+            moved[:] = False
+        cribs = np.concatenate(self.cribs) if self.cribs else np.empty(0, dtype=np.int64)
+        return store.counts, store.events, cribs
+
+
+def init_worker(arrays: Tuple[Any, ...], point_x: int, point_y: int, bounds: List[Tuple[int, int]],
+                neighborhood: str = VON_NEUMANN) -> None:
+    """Initialise un processus du pool : il garde les tableaux partagés de l'océan.
+
+    Args:
+        arrays (Tuple[Any, ...]): Tableaux partagés species, age, energy, ids, moved
+        point_x (int): Largeur de la grille
+        point_y (int): Hauteur de la grille
+        bounds (List[Tuple[int, int]]): Bornes des bandes (voir tile_bounds)
+        neighborhood (str): Voisinage des cellules. Defaults to "von_neumann".
+    """
+    _worker.update(arrays=arrays, point_x=point_x, point_y=point_y, bounds=bounds,
+                   neighborhood=neighborhood, tiles={})
+
+
+def step_tile(task: TileTask) -> TileResult:
+    """Joue une bande dans un processus du pool (la bande est construite à sa première utilisation).
+
+    Args:
+        task (TileTask): Travail de la bande pour ce chronon
+
+    Returns:
+        TileResult: Résultat de TileOcean.run
+    """
+    tile = task[0]
+    tiles = _worker["tiles"]
+    if tile not in tiles:
+        first_x, last_x = _worker["bounds"][tile]
+        tiles[tile] = TileOcean(_worker["arrays"], _worker["point_x"], _worker["point_y"], tile,
+                                first_x, last_x, _worker["neighborhood"])
+    return tiles[tile].run(task)
+
+
+class TiledOcean(VectorizedOcean):
+    """Océan Wa-Tor découpé en bandes jouées en parallèle par un pool de processus.
+    Cette classe est utilisée par ``Grid`` lorsque le moteur ``"tiled"`` est choisi.
+    Le remplissage et le comptage sont ceux du moteur ``"numpy"`` ; seul le chronon diffère."""
+
+    def __init__(self, store: EntityStore, seed: Optional[int] = None, processes: Optional[int] = None,
+                 tiles: Optional[int] = None, schedule: str = "shuffle", neighborhood: str = VON_NEUMANN) -> None:
+        """Initialise le moteur sur le stockage d'une grille.
+
+        Args:
+            store (EntityStore): Stockage des entités de la grille
+            seed (Optional[int]): Graine du générateur aléatoire. Defaults to None.
+            processes (Optional[int]): Nombre de processus ; None utilise tous les cœurs,
+                1 joue toutes les bandes dans le processus courant. Defaults to None.
+            tiles (Optional[int]): Nombre de bandes (pair) ; par défaut DEFAULT_TILES, moins si la grille
+                est trop étroite. Le nombre de processus ne change pas la simulation, le nombre de bandes si.
+                Defaults to None.
+            schedule (str): Ordonnancement des entités dans chaque bande ("shuffle" ou "sublattice").
+                Defaults to "shuffle".
+            neighborhood (str): Voisinage ("von_neumann" ou "moore"). Defaults to "von_neumann".
+
+        Raises:
+            ImportError: Si NumPy n'est pas installé
+            ValueError: Si le découpage en bandes est impossible (voir tile_bounds)
+        """
+        if np is None:
+            raise ImportError("Le moteur 'tiled' nécessite le paquet numpy (pip install numpy)")
+        self.store: EntityStore = store
+        self.point_x: int = store.point_x
+        self.point_y: int = store.point_y
+        self.processes: int = processes or os.cpu_count() or 1
+        self.bounds: List[Tuple[int, int]] = tile_bounds(
+            self.point_x, tiles if tiles is not None else default_tiles(self.point_x))
+        # Tableaux en mémoire partagée : ceux du stockage (son contenu y est recopié une fois pour toutes,
+        # Grid.cells et le rendu les lisent directement) et le tableau moved, joués par les processus du pool
+        size = self.point_x * self.point_y
+        self.arrays: Tuple[Any, ...] = tuple(multiprocessing.RawArray(code, size) for code in "Biiqb")
+        store.adopt(*(memoryview(shared).cast("B").cast(code) for shared, code in zip(self.arrays, "Biiq")))
+        self.species, self.age, self.energy, self.ids, self.moved = shared_views(self.arrays)
+        self.rng = np.random.default_rng(seed)
+        self.batches: int = DEFAULT_BATCHES
+        self.schedule: str = schedule
+        self.neighborhood: str = neighborhood
+        self.pool: Optional[Any] = None  # Créé au premier chronon
+        self.local_tiles: List[TileOcean] = []  # Bandes jouées dans ce processus (processes == 1)
+
+    @property
+    def tiles(self) -> int:
+        """Nombre de bandes."""
+        return len(self.bounds)
+
+    def close(self) -> None:
+        """Arrête le pool de processus, s'il a été créé (il est recréé au chronon suivant)."""
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool = None
+
+    def _run_tiles(self, tasks: List[TileTask]) -> List[TileResult]:
+        """Joue des bandes de même parité, en parallèle si plusieurs processus sont demandés.
+
+        Args:
+            tasks (List[TileTask]): Travail de chaque bande
+
+        Returns:
+            List[TileResult]: Résultat de chaque bande
+        """
+        if self.processes == 1:
+            if not self.local_tiles:
+                self.local_tiles = [TileOcean(self.arrays, self.point_x, self.point_y, tile, *bounds,
+                                              neighborhood=self.neighborhood)
+                                    for tile, bounds in enumerate(self.bounds)]
+            return [self.local_tiles[task[0]].run(task) for task in tasks]
+        if self.pool is None:
+            self.pool = multiprocessing.Pool(self.processes, initializer=init_worker,
+                                             initargs=(self.arrays, self.point_x, self.point_y, self.bounds,
+                                                       self.neighborhood))
+            weakref.finalize(self, self.pool.terminate)
+        return self.pool.map(step_tile, tasks, chunksize=1)
+
+    def step(self) -> None:
+        """Exécute un chronon complet : les bandes paires jouent en parallèle, puis les bandes impaires.
+
+        Les bandes écrivent directement dans les tableaux du stockage (mémoire partagée) ;
+        les compteurs du stockage sont mis à jour avec les variations renvoyées par chaque
+        bande, puis les nouveau-nés reçoivent leurs identifiants.
+        """
+        store = self.store
+        before = self.species.copy() if store.track_changes else None
+        seed = int(self.rng.integers(2 ** 63))
+        cribs = []
+        for parity in (0, 1):
+            tasks = [(tile, seed, list(store.reproduction_time), store.energy_from_fish, self.batches, self.schedule)
+                     for tile in range(parity, self.tiles, 2)]
+            for counts, events, born in self._run_tiles(tasks):
+                for code in (FISH, SHARK):
+                    store.counts[code] += counts[code]
+                for index, value in enumerate(events):
+                    store.events[index] += value
+                cribs.append(born)
+        self._identify_newborns(np.concatenate(cribs))
+        if before is not None:
+            # Les tableaux sont écrits directement : les cellules modifiées sont retrouvées par différence
+            store.dirty.update(np.flatnonzero(self.species != before).tolist())
+
+    def _identify_newborns(self, cribs: "np.ndarray") -> None:
+        """Remplace l'identifiant provisoire des nouveau-nés du chronon par des identifiants consécutifs,
+        dans l'ordre des bandes puis des naissances (le résultat ne dépend pas de l'ordre de fin des
+        processus). Une cellule ne reçoit qu'un nouveau-né par chronon : il n'en repart pas, et s'il
+        s'agit d'un poisson mangé, le requin qui l'a remplacé y reste. Ce poisson ne consomme aucun identifiant.
+
+        Args:
+            cribs (np.ndarray): Cellules des nouveau-nés renvoyées par les bandes, dans l'ordre des bandes
+        """
+        cribs = cribs[self.ids[cribs] == NEWBORN_ID]
+        for code in (FISH, SHARK):
+            born = cribs[self.species[cribs] == code]
+            self.ids[born] = self.store.allocate_ids(code, born.size) + np.arange(born.size)
@@ -1,15 +1,26 @@
 # Importation des modules nécessaires
 import tkinter as tk 
 import random  
-from typing import List, Any  # Typage statique
+from typing import List, Any, Optional  # Typage statique
 from interface.grid import Grid  # Classe de gestion de la grille
+from interface.renderer import PixelRenderer  # Rendu de la grille dans une seule image
 from aquatic.fish import Fish 
 from aquatic.shark import Shark  
 from interface.history_display import display_simulation_history  # Affichage de l'historique
+from history import SimulationHistory  # Historique CSV des simulations
 
 # Configuration de la grille
 width: int = 20  # Largeur de la grille en nombre de cellules
 height: int = 20  # Hauteur de la grille en nombre de cellules
+ENGINE: str = "objects"  # Moteur de simulation : "objects" ou "numpy" (grandes grilles)
+SEED: Optional[int] = None  # Graine aléatoire (None : simulation différente à chaque lancement)
+NEIGHBORHOOD: str = "von_neumann"  # Voisinage : "von_neumann" (4 voisins) ou "moore" (8, diagonales comprises)
+
+# Configuration du rendu
+RENDER_MODE: str = "auto"  # "labels" (un emoji par cellule), "pixels" (une image) ou "auto"
+EMOJI_MAX_CELLS: int = 60 * 60  # En mode "auto", au-delà de ce nombre de cellules on passe en "pixels"
+TURBO: bool = False  # Mode turbo au lancement : chronons sans délai, grille redessinée à cadence fixe
+STEPS_PER_TICK: Optional[int] = None  # Chronons par image en mode turbo (None : autant que le temps le permet)
 
 # Configuration de la fenêtre
 WINDOW_WIDTH = 800  # Largeur de la fenêtre en pixels
@@ -44,16 +55,50 @@ def calculate_cell_size(grid_width: int, grid_height: int) -> int:
     # Retourne la plus petite des deux dimensions, avec un minimum de 4 pixels
     return max(4, min(cell_width, cell_height))
 
+def use_pixel_renderer(grid_width: int, grid_height: int) -> bool:
+    """Indique si la grille doit être dessinée en pixels plutôt qu'avec un label par cellule.
+
+    Args:
+        grid_width (int): Largeur de la grille en nombre de cellules
+        grid_height (int): Hauteur de la grille en nombre de cellules
+
+    Returns:
+        bool: True pour le rendu en pixels
+    """
+    if RENDER_MODE == "auto":
+        return grid_width * grid_height > EMOJI_MAX_CELLS
+    return RENDER_MODE == "pixels"
+
+def calculate_pixel_scale(grid_width: int, grid_height: int) -> int:
+    """Calcule la taille d'une cellule en pixels pour le rendu en image.
+
+    Args:
+        grid_width (int): Largeur de la grille en nombre de cellules
+        grid_height (int): Hauteur de la grille en nombre de cellules
+
+    Returns:
+        int: Nombre de pixels par cellule (1 au minimum, la grille défile au-delà)
+    """
+    available_width = WINDOW_WIDTH - 2 * MARGIN - 20  # 20 pour la scrollbar
+    available_height = WINDOW_HEIGHT - CONTROL_HEIGHT - 2 * MARGIN - 20  # 20 pour la scrollbar
+    return max(1, min(available_width // grid_width, available_height // grid_height))
+
 # Initialisation de la grille avec les paramètres définis
-grid_instance: Grid = Grid(width, height)
+grid_instance: Grid = Grid(width, height, engine=ENGINE, seed=SEED, neighborhood=NEIGHBORHOOD)
 grid_instance.populate_grid(
     fish_reproduction_time=FISH_REPRODUCTION_TIME,
     shark_reproduction_time=SHARK_REPRODUCTION_TIME,
-    shark_initial_energy=SHARK_INITIAL_ENERGY
+    shark_initial_energy=SHARK_INITIAL_ENERGY,
+    shark_energy_from_fish=SHARK_ENERGY_FROM_FISH
 )
+# Historique CSV des populations, écrit par lots dans un thread dédié (interface graphique uniquement)
+grid_instance.history = SimulationHistory(background=True)
+grid_instance.turbo = TURBO
+grid_instance.steps_per_tick = STEPS_PER_TICK
 cell_labels: List[List[Any]] = []  # Liste des labels pour l'affichage des cellules
 
-def create_control_panel(root: tk.Tk, main_frame: tk.Frame) -> tuple[tk.Label, tk.Button, tk.Button, tk.Button]:
+def create_control_panel(root: tk.Tk, main_frame: tk.Frame) -> tuple[tk.Label, tk.Button, tk.Button, tk.Button,
+                                                                       tk.Checkbutton]:
     """Crée le panneau de contrôle avec les informations et les boutons.
     
     Args:
@@ -61,7 +106,7 @@ def create_control_panel(root: tk.Tk, main_frame: tk.Frame) -> tuple[tk.Label, t
         main_frame (tk.Frame): Cadre principal
         
     Returns:
-        tuple: Contient les widgets créés (label d'info, boutons)
+        tuple: Contient les widgets créés (label d'info, boutons, case du mode turbo)
     """
     # Création du cadre de contrôle
     control_frame = tk.Frame(main_frame, bg='white')
@@ -85,12 +130,18 @@ def create_control_panel(root: tk.Tk, main_frame: tk.Frame) -> tuple[tk.Label, t
     toggle_button.config(command=lambda: grid_instance.toggle_simulation(root, toggle_button, info_label))
     toggle_button.pack(side=tk.LEFT, padx=5)
 
+    # Case à cocher du mode turbo, prise en compte dès le passage suivant de la boucle de simulation
+    turbo_var = tk.BooleanVar(master=root, value=grid_instance.turbo)
+    turbo_button = tk.Checkbutton(button_frame, text="Turbo", variable=turbo_var, bg='white',
+                                  command=lambda: setattr(grid_instance, "turbo", turbo_var.get()))
+    turbo_button.pack(side=tk.LEFT, padx=5)
+
     # Bouton pour afficher l'historique
     history_button = tk.Button(button_frame, text="Historique",
-                             command=display_simulation_history)
+                             command=lambda: display_simulation_history(grid_instance.history))
     history_button.pack(side=tk.LEFT, padx=5)
 
-    return info_label, step_button, toggle_button, history_button
+    return info_label, step_button, toggle_button, history_button, turbo_button
 
 def create_grid_display(main_frame: tk.Frame) -> tuple[tk.Canvas, tk.Frame]:
     """Crée l'affichage de la grille avec scrollbars et ajuste la taille correctement.
@@ -167,23 +218,37 @@ def main() -> None:
     main_frame.pack(expand=True, fill=tk.BOTH)
 
     # Création du panneau de contrôle
-    info_label, _, _, _ = create_control_panel(root, main_frame)
+    info_label, _, _, _, _ = create_control_panel(root, main_frame)
 
     # Création de l'affichage de la grille
     canvas, grid_frame = create_grid_display(main_frame)
 
-    # Création des cellules
-    cell_labels = create_cells(grid_frame)
+    if use_pixel_renderer(width, height):
+        # Grande grille : une seule image, un pixel (ou un bloc) par cellule
+        grid_frame.destroy()
+        canvas.delete("all")
+        grid_instance.set_renderer(PixelRenderer(canvas, width, height, calculate_pixel_scale(width, height)))
+    else:
+        # Création des cellules
+        cell_labels = create_cells(grid_frame)
 
-    # Ajustement de la taille du canvas et du cadre de la grille
-    grid_frame.update_idletasks()
-    canvas.configure(scrollregion=canvas.bbox("all"))
+        # Ajustement de la taille du canvas et du cadre de la grille
+        grid_frame.update_idletasks()
+        canvas.configure(scrollregion=canvas.bbox("all"))
 
-    # Association des cellules à la grille et initialisation de l'affichage
-    grid_instance.set_cell_labels(cell_labels)
-    grid_instance.draw_grid_emojis()
+        # Association des cellules à la grille
+        grid_instance.set_cell_labels(cell_labels)
+
+    # Initialisation de l'affichage
+    grid_instance.draw()
     grid_instance.update_info(info_label)
 
+    # À la fermeture de la fenêtre, l'historique en attente est écrit avant de quitter
+    def on_close() -> None:
+        grid_instance.history.close()
+        root.destroy()
+    root.protocol("WM_DELETE_WINDOW", on_close)
+
     # Lancement de la boucle principale de l'interface
     root.mainloop()
 
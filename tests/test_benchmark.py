@@ -0,0 +1,49 @@
+import io
+import os
+import tempfile
+import unittest
+from interface.grid import Grid
+from wator import benchmark
+from wator.__main__ import build_parser
+
+class TestPopulateRatios(unittest.TestCase):
+    def test_custom_ratios(self):
+        grid = Grid(10, 10, seed=0)
+        grid.populate_grid(fish_ratio=0.4, shark_ratio=0.05)
+        self.assertEqual(grid.count_entities(), (40, 5))
+
+    def test_invalid_ratios(self):
+        with self.assertRaises(ValueError):
+            Grid(10, 10).populate_grid(fish_ratio=0.8, shark_ratio=0.3)
+
+class TestBenchmark(unittest.TestCase):
+    def test_run_case_reports_throughput_and_memory(self):
+        result = benchmark.run_case((10, 10), steps=3, memory_steps=1)
+        self.assertEqual(result["chronons"], 3)
+        self.assertGreater(result["chronons_per_second"], 0)
+        self.assertGreater(result["entities_per_second"], result["chronons_per_second"])
+        self.assertGreater(result["peak_memory_bytes"], 0)
+
+    def test_matrix_results_round_trip_through_json(self):
+        progress = io.StringIO()
+        results = benchmark.run_matrix(sizes=[8], densities=[(0.5, 0.1), (0.2, 0.2)], steps=2,
+                                       memory_steps=None, progress=progress)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(len(progress.getvalue().splitlines()), 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "bench.json")
+            benchmark.save_results(results, path)
+            self.assertEqual(benchmark.load_results(path), results)
+        output = io.StringIO()
+        benchmark.compare_results(results, results, output)
+        self.assertIn("x1.00", output.getvalue())
+
+    def test_cli_lists(self):
+        args = build_parser().parse_args(["bench", "--sizes", "20,50", "--densities", "0.7:0.1,0.4:0.05",
+                                          "--parameters", "3:5:30"])
+        self.assertEqual(args.sizes, [20, 50])
+        self.assertEqual(args.densities, [(0.7, 0.1), (0.4, 0.05)])
+        self.assertEqual(args.parameters, [(3, 5, 30)])
+
+if __name__ == '__main__':
+    unittest.main()
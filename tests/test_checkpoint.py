@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+from interface.grid import Grid
+from interface import numpy_engine
+from wator.headless import run_headless
+
+def trajectory(grid, steps=8):
+    states = []
+    for _ in range(steps):
+        grid.advance()
+        store = grid.store
+        states.append((grid.turn_count, bytes(store.species), bytes(store.age), bytes(store.energy),
+                       bytes(store.ids), tuple(store.events), grid.count_entities()))
+    return states
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "ocean.wck")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assert_round_trip(self, engine, compress=False, schedule="shuffle"):
+        grid = Grid(16, 12, engine=engine, seed=9, processes=1, schedule=schedule)
+        grid.populate_grid(3, 5, 10)
+        for _ in range(4):
+            grid.advance()
+        grid.save(self.path, compress=compress)
+        restored = Grid.load(self.path, processes=1)
+        self.assertEqual(restored.turn_count, 4)
+        self.assertEqual(restored.count_entities(), grid.count_entities())
+        self.assertEqual(restored.population_parameters, grid.population_parameters)
+        self.assertEqual(trajectory(restored), trajectory(grid))
+
+    def test_objects_round_trip(self):
+        self.assert_round_trip("objects")
+
+    def test_compressed_round_trip(self):
+        self.assert_round_trip("objects", compress=True, schedule="sublattice")
+
+    @unittest.skipIf(numpy_engine.np is None, "NumPy n'est pas installé")
+    def test_vectorized_round_trip(self):
+        self.assert_round_trip("numpy")
+        self.assert_round_trip("tiled", compress=True)
+
+    def test_no_temporary_file_left(self):
+        Grid(5, 5).save(self.path)
+        self.assertEqual(os.listdir(self.directory.name), ["ocean.wck"])
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"chronons,fish_count,shark_count\n" * 4)
+        with self.assertRaises(ValueError):
+            Grid.load(self.path)
+
+    def test_headless_run_resumes_from_checkpoint(self):
+        expected = run_headless(width=10, height=10, steps=20, seed=4)
+        first = run_headless(width=10, height=10, steps=12, seed=4, checkpoint=self.path, checkpoint_every=5)
+        resumed = run_headless(steps=20, checkpoint=self.path)
+        self.assertEqual(first + resumed[1:], expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import random
+import unittest
+from interface.grid import Grid
+from interface import numpy_engine
+
+def trajectory(engine, seed, steps=15):
+    grid = Grid(20, 20, engine=engine, seed=seed)
+    grid.populate_grid()
+    states = []
+    for _ in range(steps):
+        grid.advance()
+        states.append((bytes(grid.store.species), bytes(grid.store.age), bytes(grid.store.energy)))
+    return states
+
+class TestDeterministicSeeding(unittest.TestCase):
+    def test_same_seed_same_trajectory(self):
+        self.assertEqual(trajectory("objects", 7), trajectory("objects", 7))
+
+    def test_different_seeds_differ(self):
+        self.assertNotEqual(trajectory("objects", 7), trajectory("objects", 8))
+
+    def test_global_random_is_untouched(self):
+        random.seed(123)
+        expected = random.random()
+        random.seed(123)
+        trajectory("objects", 7, steps=3)
+        self.assertEqual(random.random(), expected)
+
+    @unittest.skipIf(numpy_engine.np is None, "NumPy n'est pas installé")
+    def test_numpy_engine_same_seed_same_trajectory(self):
+        self.assertEqual(trajectory("numpy", 7), trajectory("numpy", 7))
+
+if __name__ == '__main__':
+    unittest.main()
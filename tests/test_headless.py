@@ -0,0 +1,45 @@
+import contextlib
+import io
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from wator.__main__ import main
+from wator.headless import run_headless, write_series
+
+class TestHeadlessRunner(unittest.TestCase):
+    def test_series_starts_at_chronon_zero(self):
+        series = run_headless(width=10, height=10, steps=5, seed=1)
+        self.assertEqual(series[0], (0, 70, 10))
+        self.assertEqual([row[0] for row in series], list(range(len(series))))
+        self.assertLessEqual(len(series), 6)
+
+    def test_write_series_csv(self):
+        stream = io.StringIO()
+        write_series([(0, 3, 1), (1, 2, 1)], stream)
+        self.assertEqual(stream.getvalue().splitlines(), ['chronons,fish_count,shark_count', '0,3,1', '1,2,1'])
+
+    def test_run_does_not_import_tkinter(self):
+        code = ("import sys\n"
+                "from wator.__main__ import main\n"
+                "main(['run', '--width', '8', '--height', '8', '--steps', '3', '--seed', '4'])\n"
+                "assert 'tkinter' not in sys.modules\n")
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                cwd=Path(__file__).parent.parent)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertTrue(result.stdout.startswith('chronons,fish_count,shark_count'))
+
+    def test_synchronous_schedule_rejected_for_other_engines(self):
+        for argv in (['run', '--engine', 'numpy', '--schedule', 'synchronous'],
+                     ['run', '--engine', 'tiled', '--schedule', 'synchronous'],
+                     ['sweep', '--engine', 'numpy', '--schedule', 'shuffle,synchronous'],
+                     ['sweep', '--schedule', 'diagonal']):
+            stderr = io.StringIO()
+            with self.assertRaises(SystemExit) as raised, contextlib.redirect_stderr(stderr):
+                main(argv)
+            self.assertEqual(raised.exception.code, 2, argv)
+            self.assertIn("ordonnancement", stderr.getvalue())
+            self.assertNotIn("Traceback", stderr.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
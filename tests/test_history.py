@@ -0,0 +1,154 @@
+import csv
+import os
+import tempfile
+import unittest
+from history import SimulationHistory, HistoryTail, HistoryIndex
+from interface.grid import Grid
+
+class TestBufferedHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'history.csv')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def read_rows(self):
+        with open(self.path, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+
+    def test_rows_are_written_in_batches(self):
+        history = SimulationHistory(self.path, flush_rows=3, flush_interval=3600)
+        history.record(1, 10, 2)
+        history.record(2, 11, 2)
+        self.assertFalse(os.path.exists(self.path))
+        history.record(3, 12, 1)
+        self.assertEqual([row['chronons'] for row in self.read_rows()], ['1', '2', '3'])
+        self.assertEqual(history.pending, [])
+
+    def test_grids_have_no_history_unless_attached(self):
+        grid = Grid(6, 6, seed=1)
+        grid.populate_grid()
+        self.assertIsNone(grid.history)
+        grid.simulate_step(redraw=False)  # Rien n'est écrit, aucun thread n'est démarré
+        grid.history = SimulationHistory(self.path, flush_rows=1)
+        grid.simulate_step(redraw=False)
+        self.assertEqual([row['chronons'] for row in self.read_rows()], ['2'])
+
+    def test_close_flushes_pending_rows(self):
+        history = SimulationHistory(self.path, flush_rows=100, flush_interval=3600)
+        history.record(1, 10, 2)
+        history.close()
+        self.assertEqual(self.read_rows()[0]['fish_count'], '10')
+
+    def test_background_writer(self):
+        history = SimulationHistory(self.path, flush_rows=2, flush_interval=3600, background=True)
+        for chronon in range(1, 6):
+            history.record(chronon, 10, 2)
+        history.close()
+        self.assertEqual([row['chronons'] for row in self.read_rows()], ['1', '2', '3', '4', '5'])
+
+    def test_history_is_loaded_lazily(self):
+        SimulationHistory(self.path).add_simulation(7, 3, 4)
+        history = SimulationHistory(self.path)
+        self.assertIsNone(history._simulations)
+        history.record(8, 1, 1)
+        self.assertEqual([row['chronons'] for row in history.simulations], ['7', '8'])
+
+    def test_clear_waits_for_background_batches(self):
+        history = SimulationHistory(self.path, flush_rows=1, background=True)
+        for chronon in range(1, 50):
+            history.record(chronon, 10, 2)
+        history.clear()
+        history.record(1, 3, 3)
+        history.close()
+        self.assertEqual([row['chronons'] for row in self.read_rows()], ['1'])
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+
+class TestHistoryTail(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'history.csv')
+        self.tail = HistoryTail(self.path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, text, mode='a'):
+        with open(self.path, mode, encoding='utf-8') as f:
+            f.write(text)
+
+    def test_missing_file(self):
+        self.assertEqual(self.tail.poll(), (False, []))
+
+    def test_only_new_rows_are_read(self):
+        self.write('date,chronons,fish_count,shark_count\n2024-01-01T10:00:00,1,10,2\n')
+        _, rows = self.tail.poll()
+        self.assertEqual([(row['chronons'], row['new_simulation']) for row in rows], [('1', True)])
+        self.write('2024-01-01T10:00:01,2,11,2\n2024-01-01T10:00:02,1,5,5\n')
+        _, rows = self.tail.poll()
+        self.assertEqual([(row['chronons'], row['new_simulation']) for row in rows], [('2', False), ('1', True)])
+        self.assertEqual(self.tail.poll(), (False, []))
+
+    def test_partial_line_waits_for_next_poll(self):
+        self.write('date,chronons,fish_count,shark_count\n2024-01-01T10:00:00,1,1')
+        self.assertEqual(self.tail.poll(), (False, []))
+        self.write('0,2\n')
+        _, rows = self.tail.poll()
+        self.assertEqual(rows[0]['fish_count'], '10')
+
+    def test_truncation_restarts_from_the_beginning(self):
+        self.write('date,chronons,fish_count,shark_count\n2024-01-01T10:00:00,1,10,2\n')
+        self.tail.poll()
+        self.write('date,chronons,fish_count,shark_count\n', mode='w')
+        self.assertEqual(self.tail.poll(), (True, []))
+
+    def test_replaced_file_is_detected_even_if_longer(self):
+        history = SimulationHistory(self.path, flush_rows=1)
+        history.record(1, 10, 2)
+        self.tail.poll()
+        history.clear()
+        for chronon in range(1, 6):
+            history.record(chronon, 5, 5)
+        truncated, rows = self.tail.poll()
+        self.assertTrue(truncated)
+        self.assertEqual([row['chronons'] for row in rows], ['1', '2', '3', '4', '5'])
+
+class TestHistoryIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'history.csv')
+        history = SimulationHistory(self.path, flush_rows=1000)
+        for chronons, fish in [(1, 10), (2, 20), (3, 30), (1, 5), (2, 7)]:
+            history.record(chronons, fish, 1)
+        history.close()
+        self.index = HistoryIndex(self.path)
+        self.index.update()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_rows_are_read_by_offset(self):
+        self.assertEqual(len(self.index), 5)
+        rows = self.index.rows(2, 2)
+        self.assertEqual([(row['chronons'], row['fish_count'], row['new_simulation']) for row in rows],
+                         [('3', '30', False), ('1', '5', True)])
+        self.assertEqual([row['chronons'] for row in self.index.rows(4, 10)], ['2'])
+        self.assertEqual(self.index.rows(5, 10), [])
+
+    def test_update_appends_new_rows(self):
+        history = SimulationHistory(self.path)
+        history.record(3, 9, 0)
+        history.close()
+        self.assertFalse(self.index.update())
+        self.assertEqual(len(self.index), 6)
+        self.assertEqual(self.index.rows(5, 1)[0]['fish_count'], '9')
+
+    def test_decimated_view(self):
+        buckets = self.index.decimate(2)
+        self.assertEqual([(b['first'], b['last']) for b in buckets], [(0, 2), (3, 4)])
+        self.assertEqual(buckets[0]['fish'], (10, 20.0, 30))
+        self.assertEqual(buckets[1]['chronons'], (1, 2))
+
+if __name__ == '__main__':
+    unittest.main()
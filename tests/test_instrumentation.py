@@ -0,0 +1,89 @@
+import json
+import os
+import tempfile
+import unittest
+from history import SimulationHistory
+from interface.grid import Grid
+from interface import numpy_engine
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def check_events(self, engine):
+        # Sans reproduction, les repas et les morts de faim expliquent toute la variation des populations
+        grid = Grid(20, 20, engine=engine, seed=3)
+        grid.populate_grid(fish_reproduction_time=1000, shark_reproduction_time=0, shark_initial_energy=3,
+                           fish_ratio=0.3)
+        records = []
+        grid.instrumentation.add_observer(records.append)
+        for _ in range(5):
+            fish, sharks = grid.count_entities()
+            grid.advance()
+            record = records[-1]
+            self.assertEqual(record["births"], 0)
+            self.assertEqual(record["meals"], fish - record["fish"])
+            self.assertEqual(record["starvations"], sharks - record["sharks"])
+            self.assertGreaterEqual(record["moves"], record["meals"])
+        self.assertEqual(len(records), 5)
+        self.assertTrue(any(record["starvations"] for record in records))
+
+    def test_object_engine_events(self):
+        self.check_events("objects")
+        grid = Grid(5, 5, seed=0)
+        grid.populate_grid()
+        records = []
+        grid.instrumentation.add_observer(records.append)
+        grid.advance()
+        self.assertEqual(set(records[0]["phases"]), {"collect", "shuffle", "update"})
+
+    @unittest.skipIf(numpy_engine.np is None, "NumPy n'est pas installé")
+    def test_numpy_engine_events(self):
+        self.check_events("numpy")
+
+    def test_failed_chronon_does_not_stop_instrumentation(self):
+        grid = Grid(6, 6, seed=2)
+        grid.populate_grid()
+        records = []
+        grid.instrumentation.add_observer(records.append)
+        step_objects = grid.step_objects
+        def fail():
+            raise RuntimeError("chronon interrompu")
+        grid.step_objects = fail
+        with self.assertRaises(RuntimeError):
+            grid.advance()
+        with self.assertRaises(RuntimeError):
+            grid.simulate_step(redraw=False)
+        self.assertIsNone(grid.instrumentation.record)
+        grid.step_objects = step_objects
+        grid.advance()
+        self.assertEqual(len(records), 1)
+
+    def test_simulate_step_phases_and_dump(self):
+        grid = Grid(6, 6, seed=1)
+        grid.populate_grid()
+        grid.history = SimulationHistory(os.path.join(self.tmpdir.name, "history.csv"))
+        path = os.path.join(self.tmpdir.name, "steps.jsonl")
+        grid.instrumentation.dump_to(path)
+        grid.simulate_step()
+        grid.simulate_step()
+        grid.instrumentation.close()
+        grid.history.close()
+        with open(path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 2)
+        self.assertTrue({"update", "render", "history"} <= set(records[0]["phases"]))
+        self.assertGreaterEqual(records[0]["total"], sum(records[0]["phases"].values()))
+
+    def test_inactive_without_observer(self):
+        grid = Grid(5, 5, seed=0)
+        grid.populate_grid()
+        grid.advance()
+        self.assertFalse(grid.instrumentation.active)
+        self.assertIsNone(grid.instrumentation.record)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import threading
+import unittest
+from aquatic.fish import Fish
+from aquatic.store import FISH, SHARK
+from interface.grid import Grid
+from interface import numpy_engine
+
+def snapshot(grid):
+    store = grid.store
+    return grid.turn_count, bytes(store.species), bytes(store.age), bytes(store.energy), bytes(store.ids)
+
+def run_alone(engine, seed, steps):
+    grid = Grid(15, 15, engine=engine, seed=seed)
+    grid.populate_grid(3, 5, 10)
+    for _ in range(steps):
+        grid.advance()
+    return snapshot(grid)
+
+class TestGridIsolation(unittest.TestCase):
+    def test_turn_counts_are_per_grid(self):
+        first, second = Grid(10, 10, seed=1), Grid(10, 10, seed=2)
+        first.populate_grid(3, 5, 10)
+        second.populate_grid(3, 5, 10)
+        for _ in range(3):
+            first.advance()
+        second.advance()
+        self.assertEqual((first.turn_count, second.turn_count), (3, 1))
+
+    def test_ids_start_at_zero_in_each_grid(self):
+        first, second = Grid(5, 5), Grid(5, 5)
+        self.assertEqual(Fish(first, 0, 0).id, 0)
+        self.assertEqual(Fish(first, 0, 1).id, 1)
+        self.assertEqual(Fish(second, 0, 0).id, 0)
+        self.assertEqual(first.store.next_ids[FISH], 2)
+        self.assertEqual(second.store.next_ids[SHARK], 0)
+
+    def test_interleaved_grids_match_isolated_runs(self):
+        grids = [Grid(15, 15, seed=seed) for seed in (4, 5)]
+        for grid in grids:
+            grid.populate_grid(3, 5, 10)
+        for _ in range(10):
+            for grid in grids:
+                grid.advance()
+        self.assertEqual([snapshot(grid) for grid in grids],
+                         [run_alone("objects", seed, 10) for seed in (4, 5)])
+
+    def test_grids_in_threads_match_isolated_runs(self):
+        results = {}
+
+        def worker(seed):
+            results[seed] = run_alone("objects", seed, 10)
+
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in (4, 5, 6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, {seed: run_alone("objects", seed, 10) for seed in (4, 5, 6)})
+
+    @unittest.skipIf(numpy_engine.np is None, "NumPy n'est pas installé")
+    def test_numpy_grids_are_independent(self):
+        first, second = Grid(15, 15, engine="numpy", seed=4), Grid(15, 15, engine="numpy", seed=4)
+        first.populate_grid(3, 5, 10)
+        second.populate_grid(3, 5, 10)
+        for _ in range(10):
+            first.advance()
+            second.advance()
+        self.assertEqual(snapshot(first), snapshot(second))
+        self.assertEqual(snapshot(first), run_alone("numpy", 4, 10))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from aquatic.store import FISH, SHARK
+from interface.grid import Grid
+from interface import numpy_engine
+from interface.neighborhood import (MOORE, VON_NEUMANN, directions_of, neighbor_index,
+                                    sublattice_count, sublattice_of)
+
+class TestNeighborIndex(unittest.TestCase):
+    def test_matches_toroidal_coordinates(self):
+        for neighborhood in (VON_NEUMANN, MOORE):
+            table = neighbor_index(7, 5, neighborhood)
+            count = len(directions_of(neighborhood))
+            self.assertEqual(len(table), 35 * count)
+            for x in range(7):
+                for y in range(5):
+                    expected = [(x + dx) % 7 * 5 + (y + dy) % 5 for dx, dy in directions_of(neighborhood)]
+                    cell = x * 5 + y
+                    self.assertEqual(table[cell * count:cell * count + count].tolist(), expected)
+
+    def test_table_is_flat_and_compact(self):
+        table = neighbor_index(40, 30, MOORE)
+        self.assertEqual(table.typecode, 'i')
+        self.assertEqual(len(table) * table.itemsize, 40 * 30 * 8 * 4)
+
+    def test_table_is_built_once_per_size(self):
+        first, second = Grid(9, 4), Grid(9, 4)
+        self.assertIs(first.neighbors, second.neighbors)
+        self.assertIsNot(first.neighbors, Grid(9, 4, neighborhood=MOORE).neighbors)
+
+    def test_cache_keeps_a_single_table(self):
+        neighbor_index(6, 6)
+        neighbor_index(8, 8)
+        self.assertEqual(neighbor_index.cache_info().currsize, 1)
+
+    def test_unknown_neighborhood(self):
+        with self.assertRaises(ValueError):
+            Grid(5, 5, neighborhood="hexagonal")
+
+    def test_moore_sublattice_has_no_shared_neighbor(self):
+        self.assertEqual(sublattice_count(MOORE), 9)
+        cells = [(x, y) for x in range(9) for y in range(6)]
+        def around(x, y):
+            return {((x + dx) % 9, (y + dy) % 6) for dx, dy in directions_of(MOORE) + ((0, 0),)}
+        for a in cells:
+            for b in cells:
+                if a != b and sublattice_of(*a, MOORE) == sublattice_of(*b, MOORE):
+                    self.assertFalse(around(*a) & around(*b))
+
+    @unittest.skipIf(numpy_engine.np is None, "NumPy n'est pas installé")
+    def test_numpy_table_has_the_same_order(self):
+        for neighborhood in (VON_NEUMANN, MOORE):
+            table = numpy_engine.neighbor_table(7, 5, neighborhood=neighborhood)
+            self.assertEqual(table.ravel().tolist(), neighbor_index(7, 5, neighborhood).tolist())
+
+class TestMooreNeighborhood(unittest.TestCase):
+    def test_diagonals_are_neighbors(self):
+        for neighborhood, expected in ((VON_NEUMANN, []), (MOORE, [(1, 1), (1, 3), (3, 1), (3, 3)])):
+            grid = Grid(5, 5, neighborhood=neighborhood)
+            for x, y in ((1, 2), (3, 2), (2, 1), (2, 3)):
+                grid.store.place(grid.store.index(x, y), FISH, 0, 0, 0)
+            self.assertEqual(sorted(grid.get_empty_neighbors(2, 2)), expected)
+            self.assertEqual(len(grid.neighbor_cells(grid.store.index(2, 2), FISH)), 4)
+
+    def test_engines_run_with_moore(self):
+        engines = ["objects"] + (["numpy", "tiled"] if numpy_engine.np is not None else [])
+        for engine in engines:
+            for schedule in ("shuffle", "sublattice"):
+                grid = Grid(18, 12, engine=engine, seed=2, schedule=schedule, neighborhood=MOORE,
+                            debug=True, processes=1)
+                grid.populate_grid(3, 5, 10)
+                for _ in range(5):
+                    grid.advance()
+                self.assertGreater(sum(grid.count_entities()), 0)
+                self.assertEqual(grid.count_entities(), (grid.store.scan(FISH), grid.store.scan(SHARK)))
+
+    def test_moore_changes_the_simulation(self):
+        def run(neighborhood):
+            grid = Grid(12, 12, seed=6, neighborhood=neighborhood)
+            grid.populate_grid(3, 5, 10)
+            for _ in range(5):
+                grid.advance()
+            return bytes(grid.store.species)
+        self.assertNotEqual(run(MOORE), run(VON_NEUMANN))
+
+    def test_checkpoint_keeps_neighborhood(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ocean.wck")
+            Grid(6, 6, neighborhood=MOORE).save(path)
+            self.assertEqual(Grid.load(path).neighborhood, MOORE)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from interface.grid import Grid
+from interface import numpy_engine
+from aquatic.store import EntityStore, EMPTY, FISH, SHARK
+from interface.numpy_engine import VectorizedOcean
+
+@unittest.skipIf(numpy_engine.np is None, "NumPy n'est pas installé")
+class TestVectorizedOcean(unittest.TestCase):
+    def setUp(self):
+        self.ocean = VectorizedOcean(EntityStore(5, 5), seed=0)
+
+    def place(self, x, y, species, age=0, energy=0):
+        self.ocean.store.place(self.ocean.index(x, y), species, age, energy, 0)
+
+    def test_shark_eats_adjacent_fish(self):
+        self.place(2, 2, SHARK, energy=10)
+        self.place(2, 3, FISH)
+        self.ocean.step()
+        self.assertEqual(self.ocean.species_at(2, 3), SHARK)
+        self.assertEqual(self.ocean.species_at(2, 2), EMPTY)
+        self.assertEqual(self.ocean.energy[self.ocean.index(2, 3)], 10 + self.ocean.store.energy_from_fish - 1)
+        self.assertEqual(self.ocean.count(), (0, 1))
+
+    def test_shark_eats_across_toroidal_border(self):
+        self.place(0, 2, SHARK, energy=10)
+        self.place(4, 2, FISH)
+        self.ocean.step()
+        self.assertEqual(self.ocean.species_at(4, 2), SHARK)
+
+    def test_hungry_shark_starves(self):
+        self.place(2, 2, SHARK, energy=numpy_engine.HUNGER_PENALTY + 1)
+        self.ocean.step()
+        self.assertEqual(self.ocean.count(), (0, 0))
+
+    def test_two_sharks_cannot_eat_the_same_fish(self):
+        self.place(2, 1, SHARK, energy=10)
+        self.place(2, 3, SHARK, energy=10)
+        self.place(2, 2, FISH)
+        self.ocean.step()
+        self.assertEqual(self.ocean.count(), (0, 2))
+        energies = sorted(int(e) for e in self.ocean.energy[self.ocean.species == SHARK])
+        self.assertEqual(energies, [10 - numpy_engine.HUNGER_PENALTY - 1, 10 + self.ocean.store.energy_from_fish - 1])
+
+    def test_fish_reproduces_next_to_its_old_position(self):
+        self.ocean.fish_reproduction_time = 1
+        self.place(2, 2, FISH)
+        self.ocean.step()
+        self.assertEqual(self.ocean.count(), (2, 0))
+        self.assertTrue(all(self.ocean.age[self.ocean.species == FISH] == 0))
+
+    def test_populate_proportions(self):
+        ocean = VectorizedOcean(EntityStore(10, 10), seed=1)
+        ocean.populate()
+        self.assertEqual(ocean.count(), (70, 10))
+
+    def test_step_never_creates_entities_from_nothing(self):
+        ocean = VectorizedOcean(EntityStore(30, 30), seed=2)
+        ocean.populate(fish_reproduction_time=100, shark_reproduction_time=100)
+        fish, sharks = ocean.count()
+        ocean.step()
+        new_fish, new_sharks = ocean.count()
+        self.assertEqual(new_sharks, sharks)
+        self.assertLessEqual(new_fish, fish)
+
+@unittest.skipIf(numpy_engine.np is None, "NumPy n'est pas installé")
+class TestGridEngineSelection(unittest.TestCase):
+    def test_numpy_engine_counts(self):
+        grid = Grid(10, 10, engine="numpy", seed=3)
+        grid.populate_grid()
+        self.assertEqual(grid.count_entities(), (70, 10))
+
+class TestUnknownEngine(unittest.TestCase):
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            Grid(5, 5, engine="gpu")
+
+if __name__ == '__main__':
+    unittest.main()
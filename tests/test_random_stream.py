@@ -0,0 +1,49 @@
+import unittest
+from collections import Counter
+from interface.grid import Grid
+from interface.random_stream import RandomStream
+
+class TestRandomStream(unittest.TestCase):
+    def test_same_seed_same_draws(self):
+        first, second = RandomStream(3, block_size=8), RandomStream(3, block_size=8)
+        self.assertEqual([first.choice("abcd") for _ in range(50)], [second.choice("abcd") for _ in range(50)])
+        self.assertNotEqual(list(RandomStream(4).take(20)), list(RandomStream(3).take(20)))
+
+    def test_choice_covers_every_neighbor(self):
+        stream = RandomStream(1)
+        counts = Counter(stream.choice((10, 11, 12)) for _ in range(3000))
+        self.assertEqual(set(counts), {10, 11, 12})
+        self.assertTrue(all(800 < count < 1200 for count in counts.values()))
+
+    def test_shuffle_is_a_permutation(self):
+        stream = RandomStream(2, block_size=16)  # Plusieurs blocs par mélange
+        items = list(range(100))
+        stream.shuffle(items)
+        self.assertEqual(sorted(items), list(range(100)))
+        self.assertNotEqual(items, list(range(100)))
+        empty = []
+        stream.shuffle(empty)
+        self.assertEqual(empty, [])
+
+    def test_state_round_trip(self):
+        stream = RandomStream(5, block_size=8)
+        stream.take(13)
+        state = stream.getstate()
+        expected = [stream.choice(range(1000)) for _ in range(20)]
+        stream.setstate(state)
+        self.assertEqual([stream.choice(range(1000)) for _ in range(20)], expected)
+        other = RandomStream(9, block_size=8)
+        other.setstate(state)
+        self.assertEqual([other.choice(range(1000)) for _ in range(20)], expected)
+
+    def test_objects_engine_draws_from_stream(self):
+        grid = Grid(10, 10, seed=1)
+        grid.populate_grid()
+        before = grid.stream.getstate()
+        rng_state = grid.rng.getstate()
+        grid.advance()
+        self.assertNotEqual(grid.stream.getstate(), before)
+        self.assertEqual(grid.rng.getstate(), rng_state)  # Le générateur de la grille n'est pas sollicité
+
+if __name__ == '__main__':
+    unittest.main()
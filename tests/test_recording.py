@@ -0,0 +1,140 @@
+import os
+import random
+import tempfile
+import unittest
+from interface.grid import Grid
+from interface import numpy_engine
+from interface.recording import (DELTA, KEYFRAME, TrajectoryRecorder, changed_cells, decode_delta, encode_delta,
+                                 open_recording, pack_species, unpack_species)
+from wator.headless import run_headless
+
+class TestChangedCells(unittest.TestCase):
+    def test_finds_every_difference(self):
+        previous = bytes([0, 1, 2, 0, 0, 1, 0, 2])
+        current = bytes([0, 2, 2, 1, 0, 0, 0, 2])
+        self.assertEqual(changed_cells(previous, current), [1, 3, 5])
+        self.assertEqual(changed_cells(current, current), [])
+
+    def test_packing_round_trip(self):
+        rng = random.Random(0)
+        for size in (1, 3, 4, 9, 1000):
+            species = bytes(rng.randrange(4) for _ in range(size))
+            self.assertEqual(len(pack_species(species)), (size + 3) // 4)
+            self.assertEqual(unpack_species(pack_species(species), size), species)
+
+    def test_delta_round_trip(self):
+        cells = [0, 7, 8, 70000]
+        self.assertEqual(decode_delta(encode_delta(cells, bytes([1, 2, 0, 2])), 4), (cells, bytes([1, 2, 0, 2])))
+        self.assertEqual(decode_delta(encode_delta([], b""), 0), ([], b""))
+
+class TestRecording(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "ocean.wrec")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record(self, engine="objects", steps=25, keyframe_interval=10):
+        grid = Grid(16, 12, engine=engine, seed=5)
+        grid.populate_grid(3, 5, 10)
+        grid.start_recording(self.path, keyframe_interval)
+        frames = [bytes(grid.store.species)]
+        for _ in range(steps):
+            grid.advance()
+            frames.append(bytes(grid.store.species))
+        grid.stop_recording()
+        return frames
+
+    def record_static_ocean(self, steps=25, keyframe_interval=10):
+        # Océan figé dont quelques cellules changent à chaque chronon : les deltas sont plus petits
+        rng = random.Random(1)
+        species = bytearray(rng.choice((0, 0, 1, 2)) for _ in range(40 * 30))
+        frames = []
+        with TrajectoryRecorder(self.path, 40, 30, keyframe_interval) as recorder:
+            for chronon in range(steps + 1):
+                frames.append(bytes(species))
+                recorder.record(chronon, species)
+                for cell in rng.sample(range(len(species)), 3):
+                    species[cell] = rng.randrange(3)
+        return frames
+
+    def test_replays_every_chronon(self):
+        frames = self.record()
+        with open_recording(self.path) as player:
+            self.assertEqual(len(player), 26)
+            self.assertEqual(player.chronons, list(range(26)))
+            self.assertEqual([bytes(species) for _, species in player], frames)
+
+    def test_keyframes_at_interval(self):
+        self.record_static_ocean()
+        with open_recording(self.path) as player:
+            self.assertEqual(player.keyframes, [0, 10, 20])
+            self.assertEqual([kind for kind, _, _, _ in player.frames].count(DELTA), 23)
+            self.assertEqual([player.frames[i][0] for i in player.keyframes], [KEYFRAME] * 3)
+            # Un delta ne contient que les cellules modifiées (au plus 3 par chronon)
+            self.assertTrue(all(count <= 3 for kind, count, _, _ in player.frames if kind == DELTA))
+
+    def test_keyframe_when_smaller_than_delta(self):
+        # Dans un océan agité, presque toutes les entités bougent : chaque image est une image clé
+        self.record()
+        with open_recording(self.path) as player:
+            self.assertGreater(len(player.keyframes), 20)
+
+    def test_seek_in_any_order(self):
+        for record in (self.record, self.record_static_ocean):
+            self.assert_seeks(record())
+
+    def assert_seeks(self, frames):
+        with open_recording(self.path) as player:
+            for frame in (17, 3, 25, 24, 0, 12, 13):
+                player.seek(frame)
+                self.assertEqual(bytes(player.store.species), frames[frame])
+            with self.assertRaises(IndexError):
+                player.seek(26)
+
+    def test_seek_forward_returns_changed_cells(self):
+        frames = self.record_static_ocean()
+        with open_recording(self.path) as player:
+            self.assertIsNone(player.seek(4))
+            changed = player.seek(7)
+            self.assertEqual(changed, sorted(set(changed_cells(frames[4], frames[5]))
+                                             | set(changed_cells(frames[5], frames[6]))
+                                             | set(changed_cells(frames[6], frames[7]))))
+            self.assertEqual(player.seek(7), [])
+            self.assertIsNone(player.seek(2))
+            self.assertIsNone(player.seek(12))
+
+    def test_truncated_recording_keeps_complete_frames(self):
+        frames = self.record(steps=5)
+        size = os.path.getsize(self.path)
+        with open(self.path, "r+b") as f:
+            f.truncate(size - 3)
+        with open_recording(self.path) as player:
+            self.assertEqual(len(player), 5)
+            player.seek(4)
+            self.assertEqual(bytes(player.store.species), frames[4])
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"chronons,fish_count,shark_count\n")
+        with self.assertRaises(ValueError):
+            open_recording(self.path)
+
+    def test_headless_recording(self):
+        series = run_headless(width=10, height=10, steps=15, seed=4, record=self.path, keyframe_interval=4)
+        with open_recording(self.path) as player:
+            self.assertEqual(len(player), len(series))
+            for chronon, fish_count, shark_count in series:
+                player.seek_chronon(chronon)
+                self.assertEqual(player.count_entities(), (fish_count, shark_count))
+
+    @unittest.skipIf(numpy_engine.np is None, "NumPy n'est pas installé")
+    def test_numpy_engine_recording(self):
+        frames = self.record(engine="numpy", steps=12, keyframe_interval=5)
+        with open_recording(self.path) as player:
+            player.seek(11)
+            self.assertEqual(bytes(player.store.species), frames[11])
+
+if __name__ == '__main__':
+    unittest.main()
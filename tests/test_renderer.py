@@ -0,0 +1,53 @@
+import unittest
+from interface.grid import Grid
+from interface.renderer import LabelRenderer, species_to_ppm, SPECIES_COLORS
+from aquatic.fish import Fish
+from aquatic.shark import Shark
+from aquatic.store import EMPTY, FISH, SHARK
+
+class FakeLabel:
+    def __init__(self):
+        self.options = {}
+
+    def config(self, **options):
+        self.options.update(options)
+
+class TestPixelBuffer(unittest.TestCase):
+    def test_ppm_is_row_major_by_y(self):
+        grid = Grid(3, 2)
+        Fish(grid, 1, 0)
+        Shark(grid, 2, 1, shark_reproduction_time=3)
+        ppm = species_to_ppm(grid.store.species, 3, 2)
+        header, pixels = ppm.split(b"\n", 1)
+        self.assertEqual(header, b"P6 3 2 255")
+        self.assertEqual(len(pixels), 3 * 2 * 3)
+        expected = [EMPTY, FISH, EMPTY,   # ligne y = 0
+                    EMPTY, EMPTY, SHARK]  # ligne y = 1
+        self.assertEqual(pixels, b"".join(bytes(SPECIES_COLORS[code]) for code in expected))
+
+class TestLabelRenderer(unittest.TestCase):
+    def test_labels_follow_species(self):
+        grid = Grid(2, 2)
+        labels = [[FakeLabel() for _ in range(2)] for _ in range(2)]
+        grid.set_cell_labels(labels)
+        Shark(grid, 0, 1, shark_reproduction_time=3)
+        grid.draw()
+        self.assertEqual(labels[0][1].options["text"], "🦈")
+        self.assertEqual(labels[1][1].options["text"], "🌊")
+
+    def test_only_changed_labels_are_redrawn(self):
+        grid = Grid(3, 3)
+        labels = [[FakeLabel() for _ in range(3)] for _ in range(3)]
+        grid.set_cell_labels(labels)
+        grid.draw()
+        for column in labels:
+            for label in column:
+                label.options.clear()
+        Fish(grid, 1, 2)
+        grid.draw()
+        redrawn = [(x, y) for x in range(3) for y in range(3) if labels[x][y].options]
+        self.assertEqual(redrawn, [(1, 2)])
+        self.assertEqual(labels[1][2].options["text"], "🐟")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+from aquatic.store import SHARK
+from interface.grid import Grid
+from interface import numpy_engine
+from interface.renderer import species_to_ppm
+from interface.snapshot import open_snapshot
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "ocean.wck")
+        self.grid = Grid(12, 9, seed=2)
+        self.grid.populate_grid(3, 5, 10)
+        for _ in range(3):
+            self.grid.advance()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assert_matches_grid(self, snapshot):
+        store = self.grid.store
+        for name in ("species", "age", "energy", "ids"):
+            self.assertEqual(list(getattr(snapshot.store, name)), list(getattr(store, name)))
+        self.assertEqual(snapshot.turn_count, 3)
+        self.assertEqual(snapshot.count_entities(), self.grid.count_entities())
+        self.assertEqual(snapshot.species_at(4, 7), store.species[store.index(4, 7)])
+
+    def test_uncompressed_snapshot_is_mapped(self):
+        self.grid.save(self.path)
+        with open_snapshot(self.path) as snapshot:
+            self.assertTrue(snapshot.mapped("ids"))
+            self.assert_matches_grid(snapshot)
+
+    def test_compressed_snapshot_is_loaded(self):
+        self.grid.save(self.path, compress=True)
+        with open_snapshot(self.path) as snapshot:
+            self.assertFalse(snapshot.mapped("species"))
+            self.assert_matches_grid(snapshot)
+
+    def test_views_are_read_only(self):
+        self.grid.save(self.path)
+        with open_snapshot(self.path) as snapshot:
+            with self.assertRaises(TypeError):
+                snapshot.store.species[0] = 1
+
+    def test_renderer_reads_snapshot_like_a_grid(self):
+        self.grid.save(self.path)
+        with open_snapshot(self.path) as snapshot:
+            self.assertEqual(species_to_ppm(snapshot.store.species, snapshot.point_x, snapshot.point_y),
+                             species_to_ppm(self.grid.store.species, 12, 9))
+
+    @unittest.skipIf(numpy_engine.np is None, "NumPy n'est pas installé")
+    def test_grid_view_follows_cell_layout(self):
+        self.grid.save(self.path)
+        with open_snapshot(self.path) as snapshot:
+            energy = snapshot.grid_view("energy")
+            self.assertEqual(energy.shape, (12, 9))
+            self.assertFalse(energy.flags.writeable)
+            for x in range(12):
+                for y in range(9):
+                    entity = self.grid.cells[x][y]
+                    expected = entity.shark_energy if entity is not None and entity.SPECIES == SHARK else None
+                    if expected is not None:
+                        self.assertEqual(energy[x][y], expected)
+            del energy
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+import unittest
+from interface.grid import Grid
+from aquatic.fish import Fish
+from aquatic.shark import Shark
+from aquatic.store import EntityStore, BIRTHS, EMPTY, FISH, SHARK
+
+class TestEntityStore(unittest.TestCase):
+    def test_place_move_clear(self):
+        store = EntityStore(3, 4)
+        src, dst = store.index(1, 2), store.index(2, 3)
+        store.place(src, SHARK, 7, 12, 42)
+        store.move(src, dst)
+        self.assertEqual((store.species[dst], store.age[dst], store.energy[dst], store.ids[dst]), (SHARK, 7, 12, 42))
+        self.assertEqual((store.species[src], store.age[src], store.energy[src], store.ids[src]), (EMPTY, 0, 0, 0))
+        store.clear(dst)
+        self.assertEqual(store.count(SHARK), 0)
+
+    def test_memory_per_cell(self):
+        self.assertEqual(EntityStore(10, 10).nbytes(), 100 * (1 + 4 + 4 + 8))
+
+    def test_dirty_cells(self):
+        store = EntityStore(3, 3)
+        store.track_changes = True
+        self.assertIsNone(store.take_dirty())  # Premier dessin : toute la grille
+        store.place(0, FISH, 0, 0, 1)
+        store.move(0, 4)
+        store.clear(8)  # Cellule déjà vide : rien à redessiner
+        self.assertEqual(store.take_dirty(), {0, 4})
+        self.assertEqual(store.take_dirty(), set())
+        store.clear_all()
+        self.assertIsNone(store.take_dirty())
+
+    def test_occupied_cells(self):
+        store = EntityStore(3, 3)
+        store.place(2, FISH, 0, 0, 1)
+        store.index_occupancy()  # Construit à partir des entités déjà placées
+        store.place(7, SHARK, 0, 5, 2)
+        store.move(2, 0)
+        store.place(4, FISH, 0, 0, 3)
+        store.clear(7)
+        store.clear(8)  # Cellule déjà vide
+        self.assertEqual(store.occupied_cells(), [0, 4])
+        store.species[5] = SHARK  # Écriture directe (moteur vectorisé, point de reprise)
+        store.recount()
+        self.assertEqual(store.occupied_cells(), [0, 4, 5])
+        store.clear_all()
+        self.assertEqual(store.occupied_cells(), [])
+
+class TestEntityViews(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid(5, 5)
+
+    def test_constructor_places_entity(self):
+        shark = Shark(self.grid, 1, 1, shark_energy=20, shark_reproduction_time=4)
+        view = self.grid.cells[1][1]
+        self.assertIsInstance(view, Shark)
+        self.assertEqual((view.id, view.shark_energy, view.shark_reproduction_time), (shark.id, 20, 4))
+        self.assertIsNone(self.grid.cells[0][0])
+
+    def test_fish_is_not_a_shark_cell(self):
+        Fish(self.grid, 2, 2)
+        self.assertNotIsInstance(self.grid.cells[2][2], Shark)
+        self.assertEqual(self.grid.count_entities(), (1, 0))
+
+    def test_move_keeps_state(self):
+        fish = Fish(self.grid, 0, 2)
+        fish.age = 3
+        self.grid.move_entity(fish, 0, 2, -1, 2, set())
+        self.assertEqual(fish.position(), (4, 2))
+        self.assertEqual(self.grid.cells[4][2].age, 3)
+        self.assertIsNone(self.grid.cells[0][2])
+
+    def test_eaten_fish_is_dead(self):
+        fish = Fish(self.grid, 2, 3)
+        shark = Shark(self.grid, 2, 2, shark_energy=10)
+        shark.eat(fish)
+        self.assertFalse(fish.alive)
+        self.assertEqual(shark.shark_energy, 10 + shark.energy_from_fish)
+
+    def test_assigning_cells_matrix(self):
+        Fish(self.grid, 1, 1)
+        self.grid.cells = [[None for _ in range(5)] for _ in range(5)]
+        self.assertEqual(self.grid.count_entities(), (0, 0))
+
+    def test_dead_view_does_not_see_newcomer(self):
+        fish = Fish(self.grid, 3, 3)
+        fish.die()
+        Fish(self.grid, 3, 3)
+        self.assertFalse(fish.alive)
+        self.assertEqual(self.grid.store.species[self.grid.store.index(3, 3)], FISH)
+
+    def test_views_have_no_dict(self):
+        for view in (Fish(self.grid, 0, 0), Shark(self.grid, 1, 1)):
+            self.assertFalse(hasattr(view, "__dict__"))
+            with self.assertRaises(AttributeError):
+                view.color = "blue"
+
+    def test_birth_writes_store_only(self):
+        shark = Shark(self.grid, 2, 2, shark_energy=10, shark_reproduction_time=3)
+        shark.reproduce_entity(self.grid, 2, 2)
+        self.assertEqual(self.grid.count_entities(), (0, 2))
+        newborn = next(self.grid.cells[x][y] for x, y in ((1, 2), (3, 2), (2, 1), (2, 3))
+                       if self.grid.cells[x][y] is not None)
+        self.assertEqual((newborn.age, newborn.shark_energy, newborn.id), (0, 5, shark.id + 1))
+        self.assertEqual(self.grid.store.events[BIRTHS], 1)
+
+    def test_views_are_recycled_between_chronons(self):
+        grid = Grid(8, 8, seed=1)
+        grid.populate_grid(fish_reproduction_time=3, shark_reproduction_time=4)
+        population = sum(grid.count_entities())
+        grid.advance()
+        # Une vue par entité jouée, rangée dans la réserve de son espèce
+        self.assertEqual(sum(len(pool) for pool in grid.view_pool), population)
+        pooled = {id(view) for pool in grid.view_pool for view in pool}
+        grid.advance()
+        self.assertTrue(pooled & {id(view) for pool in grid.view_pool for view in pool})
+        for species in (FISH, SHARK):
+            self.assertTrue(all(view.SPECIES == species for view in grid.view_pool[species]))
+
+class TestPopulationCounters(unittest.TestCase):
+    def test_counters_follow_births_and_deaths(self):
+        grid = Grid(5, 5)
+        fish = Fish(grid, 2, 3)
+        shark = Shark(grid, 2, 2, shark_energy=10, shark_reproduction_time=3)
+        self.assertEqual((grid.fish_count, grid.shark_count), (1, 1))
+        shark.eat(fish)
+        grid.move_entity(shark, 2, 2, 2, 3, set())
+        self.assertEqual((grid.fish_count, grid.shark_count), (0, 1))
+        shark.reproduce_entity(grid, 2, 3)
+        self.assertEqual(grid.count_entities(), (0, 2))
+        shark.die()
+        self.assertEqual(grid.count_entities(), (0, 1))
+        grid.check_counts()
+
+    def test_debug_mode_matches_full_scan(self):
+        grid = Grid(12, 12, debug=True)
+        grid.populate_grid(fish_reproduction_time=2, shark_reproduction_time=3)
+        for _ in range(10):
+            grid.advance()
+
+    def test_grid_occupancy_follows_the_simulation(self):
+        grid = Grid(12, 12, seed=3)
+        grid.populate_grid(fish_reproduction_time=2, shark_reproduction_time=3)
+        for _ in range(10):
+            grid.advance()
+            self.assertEqual(grid.store.occupied, grid.store.scan_occupied())
+        grid.reset_simulation()
+        self.assertEqual(grid.store.occupied, grid.store.scan_occupied())
+
+    def test_check_counts_detects_stale_occupancy(self):
+        grid = Grid(4, 4)
+        Fish(grid, 0, 0)
+        grid.store.occupied.add(5)
+        with self.assertRaises(RuntimeError):
+            grid.check_counts()
+
+    def test_constructors_keep_species_parameters(self):
+        grid = Grid(6, 6, seed=0)
+        grid.populate_grid(fish_reproduction_time=3, shark_reproduction_time=5)
+        grid.clear_cells()
+        Shark(grid, 1, 1)
+        Fish(grid, 2, 2)
+        self.assertEqual(grid.store.reproduction_time[FISH], 3)
+        self.assertEqual(grid.store.reproduction_time[SHARK], 5)
+        # Une valeur explicite remplace le paramètre de toute l'espèce
+        Shark(grid, 3, 3, shark_reproduction_time=4)
+        self.assertEqual(grid.cells[1][1].shark_reproduction_time, 4)
+
+    def test_check_counts_detects_drift(self):
+        grid = Grid(4, 4)
+        Fish(grid, 0, 0)
+        grid.store.counts[FISH] += 1
+        with self.assertRaises(RuntimeError):
+            grid.check_counts()
+
+if __name__ == '__main__':
+    unittest.main()
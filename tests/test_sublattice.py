@@ -0,0 +1,89 @@
+import unittest
+from interface.grid import Grid
+from interface import numpy_engine
+from aquatic.store import FISH, MOVES
+from interface.numpy_engine import DIRECTIONS, SUBLATTICES, sublattice_of
+
+def trajectory(engine, schedule, seed=3, steps=10):
+    grid = Grid(20, 15, engine=engine, seed=seed, schedule=schedule, debug=True)
+    grid.populate_grid(3, 5, 10)
+    states = []
+    for _ in range(steps):
+        grid.advance()
+        states.append(bytes(grid.store.species))
+    if grid.ocean is not None:
+        grid.ocean.close()
+    return states
+
+class TestSublatticeColoring(unittest.TestCase):
+    def test_neighbors_have_the_other_colors(self):
+        for x in range(10):
+            for y in range(10):
+                colors = {sublattice_of((x + dx) % 10, (y + dy) % 10) for dx, dy in DIRECTIONS}
+                self.assertEqual(colors | {sublattice_of(x, y)}, set(range(SUBLATTICES)))
+
+    def test_same_color_cells_share_no_neighbor(self):
+        def around(x, y):
+            return {((x + dx) % 10, (y + dy) % 10) for dx, dy in DIRECTIONS + ((0, 0),)}
+        cells = [(x, y) for x in range(10) for y in range(10)]
+        for a in cells:
+            for b in cells:
+                if a != b and sublattice_of(*a) == sublattice_of(*b):
+                    self.assertFalse(around(*a) & around(*b))
+
+class TestSublatticeSchedule(unittest.TestCase):
+    def test_unknown_schedule(self):
+        with self.assertRaises(ValueError):
+            Grid(5, 5, schedule="random")
+
+    def test_objects_engine_is_reproducible(self):
+        self.assertEqual(trajectory("objects", "sublattice"), trajectory("objects", "sublattice"))
+
+    def test_schedule_changes_the_simulation(self):
+        self.assertNotEqual(trajectory("objects", "sublattice"), trajectory("objects", "shuffle"))
+
+    def test_each_entity_plays_once(self):
+        grid = Grid(10, 10, seed=0, schedule="sublattice")
+        grid.populate_grid(100, 5, 50, fish_ratio=0.3, shark_ratio=0.0)
+        grid.advance()
+        ages = {grid.store.age[cell] for cell in range(100) if grid.store.species[cell]}
+        self.assertEqual(ages, {1})
+
+    @unittest.skipIf(numpy_engine.np is None, "NumPy n'est pas installé")
+    def test_vectorized_engines_are_reproducible(self):
+        for engine in ("numpy", "tiled"):
+            self.assertEqual(trajectory(engine, "sublattice"), trajectory(engine, "sublattice"))
+
+    @unittest.skipIf(numpy_engine.np is None, "NumPy n'est pas installé")
+    def test_numpy_sublattice_has_no_conflicts(self):
+        # Poissons isolés sur une ligne sur deux : chacun a une case vide voisine et doit bouger
+        grid = Grid(10, 10, engine="numpy", seed=0, schedule="sublattice")
+        grid.populate_grid(100, 5, 50, fish_ratio=0.0, shark_ratio=0.0)
+        for x in range(0, 10, 2):
+            for y in range(0, 10, 2):
+                grid.store.place(grid.store.index(x, y), FISH, 0, 0, 0)
+        moves = grid.store.events[MOVES]
+        grid.advance()
+        self.assertEqual(grid.store.events[MOVES] - moves, 25)
+
+    def test_edge_conflicts_have_random_winners(self):
+        # Largeur 7 : (0, 0) et (5, 0) ont la même couleur et la même seule case vide voisine (6, 0)
+        engines = ("objects", "numpy") if numpy_engine.np is not None else ("objects",)
+        for engine in engines:
+            winners = set()
+            for seed in range(30):
+                grid = Grid(7, 5, engine=engine, seed=seed, schedule="sublattice")
+                grid.populate_grid(100, 5, 50, fish_ratio=0.0, shark_ratio=0.0)
+                for cell in range(35):
+                    if cell != grid.store.index(6, 0):
+                        grid.store.place(cell, FISH, 0, 0, 10 + cell)
+                grid.store.ids[grid.store.index(0, 0)] = 1
+                grid.store.ids[grid.store.index(5, 0)] = 2
+                grid.advance()
+                winners.add(grid.store.ids[grid.store.index(6, 0)])
+                if grid.ocean is not None:
+                    grid.ocean.close()
+            self.assertTrue({1, 2} <= winners, (engine, winners))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import math
+import unittest
+from interface.grid import Grid
+from wator import sweep
+
+class TestSweep(unittest.TestCase):
+    def test_expand_grid(self):
+        tasks = sweep.expand_grid({"fish_reproduction_time": [2, 3], "shark_energy_from_fish": [5, 10, 15]},
+                                  repeats=2, seed=10)
+        self.assertEqual(len(tasks), 12)
+        self.assertEqual({task["seed"] for task in tasks}, {10, 11})
+        self.assertEqual(tasks[0]["width"], sweep.PARAMETERS["width"])
+        with self.assertRaises(ValueError):
+            sweep.expand_grid({"speed": [1]})
+
+    def test_oscillation_period(self):
+        values = [int(100 + 50 * math.sin(2 * math.pi * t / 20)) for t in range(200)]
+        self.assertEqual(sweep.oscillation_period(values), 20)
+        self.assertIsNone(sweep.oscillation_period([5] * 50))
+        self.assertIsNone(sweep.oscillation_period(list(range(50))))
+
+    def test_summary(self):
+        summary = sweep.summarize([(0, 4, 2), (1, 2, 2), (2, 0, 1), (3, 0, 0)])
+        self.assertEqual((summary["fish_extinction"], summary["shark_extinction"]), (2, 3))
+        self.assertEqual(summary["mean_fish"], 1.5)
+
+    def test_pool_matches_in_process_run(self):
+        tasks = sweep.expand_grid({"width": [8], "height": [8], "steps": [10],
+                                   "shark_energy_from_fish": [3, 15]}, repeats=2)
+        self.assertEqual(sweep.run_sweep(tasks, processes=2), sweep.run_sweep(tasks, processes=1))
+
+class TestEnergyFromFish(unittest.TestCase):
+    def test_parameter_is_wired_and_kept_after_reset(self):
+        grid = Grid(6, 6, seed=0)
+        grid.populate_grid(shark_energy_from_fish=4)
+        self.assertEqual(grid.store.energy_from_fish, 4)
+        grid.populate_grid(**grid.population_parameters)
+        self.assertEqual(grid.store.energy_from_fish, 4)
+
+if __name__ == '__main__':
+    unittest.main()
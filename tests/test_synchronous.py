@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+from aquatic.fish import Fish
+from aquatic.shark import Shark
+from aquatic.store import EntityStore, FISH, SHARK, MEALS, MOVES
+from interface.grid import Grid
+
+class TestSwap(unittest.TestCase):
+    def test_swap_exchanges_cells_and_marks_changes(self):
+        front, back = EntityStore(3, 3), EntityStore(3, 3)
+        front.index_occupancy()
+        back.index_occupancy()
+        front.track_changes = True
+        front.take_dirty()
+        front.place(0, FISH, 1, 0, 1)
+        front.place(4, SHARK, 2, 9, 2)
+        front.take_dirty()
+        back.place(0, FISH, 2, 0, 1)  # Même espèce : rien à redessiner
+        back.place(5, SHARK, 3, 8, 2)
+        front.swap(back)
+        self.assertEqual((front.age[0], front.energy[5], front.ids[5]), (2, 8, 2))
+        self.assertEqual(front.occupied_cells(), [0, 5])
+        self.assertEqual((front.count(FISH), front.count(SHARK)), (1, 1))
+        self.assertEqual(front.take_dirty(), {4, 5})
+        self.assertEqual(back.occupied_cells(), [0, 4])
+
+class TestSynchronousUpdate(unittest.TestCase):
+    def test_vacated_cells_are_not_reused_in_the_same_chronon(self):
+        grid = Grid(4, 4, seed=1, schedule="synchronous", debug=True)
+        grid.store.reproduction_time[FISH] = 100
+        for x in range(4):
+            for y in range(4):
+                if (x, y) != (2, 2):
+                    grid.store.place(grid.store.index(x, y), FISH, 0, 0, x * 4 + y)
+        grid.advance()
+        # Une seule case vide dans l'état précédent : un seul déplacement possible
+        self.assertEqual(grid.store.events[MOVES], 1)
+        self.assertEqual(grid.count_entities(), (15, 0))
+
+    def test_one_shark_per_fish(self):
+        grid = Grid(5, 5, seed=3, schedule="synchronous", debug=True)
+        Fish(grid, 2, 2)
+        first = Shark(grid, 1, 2, shark_energy=20)
+        second = Shark(grid, 3, 2, shark_energy=20)
+        grid.store.energy_from_fish = 4
+        ids = {first.id, second.id}
+        grid.advance()
+        self.assertEqual(grid.count_entities(), (0, 2))
+        self.assertEqual(grid.store.events[MEALS], 1)
+        # Le gagnant est sur la case du poisson, le perdant a payé la pénalité de faim
+        winner = grid.cells[2][2]
+        self.assertIn(winner.id, ids)
+        self.assertEqual(winner.shark_energy, 20 + 4 - 1)
+        loser_energy = [grid.store.energy[cell] for cell in grid.store.occupied_cells() if cell != 12]
+        self.assertEqual(loser_energy, [20 - 5 - 1])
+
+    def test_births_get_unique_cells_and_ids(self):
+        grid = Grid(10, 10, seed=4, schedule="synchronous", debug=True)
+        grid.populate_grid(fish_reproduction_time=1, shark_reproduction_time=2, shark_initial_energy=20)
+        for _ in range(8):
+            grid.advance()
+            store = grid.store
+            for species in (FISH, SHARK):
+                ids = [store.ids[cell] for cell in store.occupied_cells() if store.species[cell] == species]
+                self.assertEqual(len(ids), len(set(ids)))
+
+    def test_same_seed_same_trajectory(self):
+        def run():
+            grid = Grid(12, 12, seed=8, schedule="synchronous")
+            grid.populate_grid(3, 5, 10)
+            for _ in range(10):
+                grid.advance()
+            return bytes(grid.store.species), bytes(grid.store.energy), tuple(grid.store.events)
+        self.assertEqual(run(), run())
+
+    def test_checkpoint_resume(self):
+        grid = Grid(12, 12, seed=5, schedule="synchronous")
+        grid.populate_grid(3, 5, 10)
+        for _ in range(4):
+            grid.advance()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ocean.wck")
+            grid.save(path)
+            resumed = Grid.load(path)
+        for _ in range(4):
+            grid.advance()
+            resumed.advance()
+        self.assertEqual(resumed.schedule, "synchronous")
+        self.assertEqual(bytes(resumed.store.species), bytes(grid.store.species))
+        self.assertEqual(bytes(resumed.store.ids), bytes(grid.store.ids))
+
+    def test_objects_engine_only(self):
+        for engine in ("numpy", "tiled"):
+            with self.assertRaises(ValueError):
+                Grid(10, 10, engine=engine, schedule="synchronous")
+
+if __name__ == '__main__':
+    unittest.main()
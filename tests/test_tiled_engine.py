@@ -0,0 +1,99 @@
+import unittest
+from interface.grid import Grid
+from interface import numpy_engine
+from aquatic.store import EntityStore, EMPTY, FISH, SHARK, BIRTHS
+from interface.tiled_engine import TiledOcean, tile_bounds, default_tiles
+
+def final_state(processes, steps=8):
+    grid = Grid(24, 10, engine="tiled", seed=5, processes=processes, debug=True)
+    grid.populate_grid(3, 5, 10)
+    try:
+        for _ in range(steps):
+            grid.advance()
+    finally:
+        grid.ocean.close()
+    store = grid.store
+    return grid.count_entities(), bytes(store.species), bytes(store.age), bytes(store.energy), bytes(store.ids)
+
+class TestTileBounds(unittest.TestCase):
+    def test_strips_cover_every_column(self):
+        self.assertEqual(tile_bounds(10, 4), [(0, 2), (2, 5), (5, 7), (7, 10)])
+
+    def test_odd_or_too_many_tiles_are_rejected(self):
+        with self.assertRaises(ValueError):
+            tile_bounds(10, 3)
+        with self.assertRaises(ValueError):
+            tile_bounds(7, 4)
+
+    def test_default_tiles_is_even_and_fits(self):
+        self.assertEqual(default_tiles(1000), 64)
+        self.assertEqual(default_tiles(10), 4)
+        self.assertEqual(default_tiles(3), 2)
+
+@unittest.skipIf(numpy_engine.np is None, "NumPy n'est pas installé")
+class TestTiledOcean(unittest.TestCase):
+    def setUp(self):
+        self.ocean = TiledOcean(EntityStore(8, 5), seed=0, processes=1, tiles=2)
+
+    def place(self, x, y, species, age=0, energy=0):
+        self.ocean.store.place(self.ocean.index(x, y), species, age, energy, 0)
+
+    def test_shark_eats_fish_in_neighbouring_tile(self):
+        self.place(3, 2, SHARK, energy=10)
+        self.place(4, 2, FISH)
+        self.ocean.step()
+        self.assertEqual(self.ocean.species_at(4, 2), SHARK)
+        self.assertEqual(self.ocean.species_at(3, 2), EMPTY)
+        self.assertEqual(self.ocean.count(), (0, 1))
+
+    def test_entity_crossing_a_border_plays_once(self):
+        crossed = 0
+        for seed in range(20):
+            # Grille d'une seule ligne : le poisson de la colonne 3 va en 2 ou passe dans la bande impaire
+            ocean = TiledOcean(EntityStore(8, 1), seed=seed, processes=1, tiles=2)
+            ocean.store.place(ocean.index(3, 0), FISH, 0, 0, 0)
+            ocean.step()
+            if ocean.species_at(4, 0) == FISH:
+                crossed += 1
+                self.assertEqual(ocean.age[ocean.index(4, 0)], 1)  # Il n'a pas rejoué dans la bande impaire
+        self.assertGreater(crossed, 0)
+
+    def test_same_result_with_any_number_of_processes(self):
+        self.assertEqual(final_state(1), final_state(2))
+
+    def test_living_ids_stay_unique(self):
+        grid = Grid(12, 12, engine="tiled", seed=1, processes=1)
+        grid.populate_grid(2, 3, 10)
+        for _ in range(6):
+            grid.advance()
+        for species in (FISH, SHARK):
+            ids = grid.ocean.ids[grid.ocean.species == species]
+            self.assertEqual(len(set(ids.tolist())), ids.size)
+
+    def test_store_arrays_are_the_shared_memory(self):
+        grid = Grid(12, 12, engine="tiled", seed=2, processes=1)
+        grid.populate_grid(3, 5, 10)
+        grid.advance()
+        ocean = grid.ocean
+        for name, dtype in (("species", "uint8"), ("age", "int32"), ("energy", "int32"), ("ids", "int64")):
+            view = numpy_engine.np.frombuffer(getattr(grid.store, name), dtype=dtype)
+            self.assertTrue(numpy_engine.np.shares_memory(view, getattr(ocean, name)), name)
+
+    def test_ids_advance_by_births_only(self):
+        grid = Grid(12, 12, engine="tiled", seed=1, processes=1)
+        grid.populate_grid(2, 3, 10)
+        for _ in range(6):
+            next_ids = list(grid.store.next_ids)
+            births = grid.store.events[BIRTHS]
+            grid.advance()
+            self.assertGreaterEqual(grid.ocean.ids.min(), 0)
+            newborns = 0
+            for species in (FISH, SHARK):
+                ids = grid.ocean.ids[grid.ocean.species == species]
+                fresh = int((ids >= next_ids[species]).sum())
+                self.assertEqual(grid.store.next_ids[species] - next_ids[species], fresh)
+                newborns += fresh
+            self.assertLessEqual(newborns, grid.store.events[BIRTHS] - births)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+from history import SimulationHistory
+from interface.grid import Grid, STEP_DELAY_MS, TURBO_FPS
+
+class FakeWidget:
+    def __init__(self):
+        self.options = {}
+
+    def config(self, **options):
+        self.options.update(options)
+
+class FakeRoot:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback, *args):
+        self.scheduled.append((delay, callback, args))
+
+    def run_next(self):
+        delay, callback, args = self.scheduled.pop(0)
+        callback(*args)
+        return delay
+
+class TestTurboMode(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.grid = Grid(10, 10, seed=2)
+        self.grid.populate_grid(3, 5, 10)
+        self.grid.history = SimulationHistory(os.path.join(self.tmpdir.name, "history.csv"))
+        self.root, self.button, self.label = FakeRoot(), FakeWidget(), FakeWidget()
+
+    def tearDown(self):
+        self.grid.history.close()
+        self.tmpdir.cleanup()
+
+    def start(self):
+        self.grid.toggle_simulation(self.root, self.button, self.label)
+
+    def test_normal_mode_plays_one_chronon_per_tick(self):
+        self.start()
+        self.assertEqual(self.grid.turn_count, 1)
+        self.assertEqual(self.root.scheduled[0][0], STEP_DELAY_MS)
+
+    def test_fixed_steps_per_tick(self):
+        self.grid.turbo = True
+        self.grid.steps_per_tick = 7
+        self.start()
+        self.assertEqual(self.grid.turn_count, 7)
+        self.assertTrue(1 <= self.root.scheduled[0][0] <= 1000 // TURBO_FPS)
+        self.root.run_next()
+        self.assertEqual(self.grid.turn_count, 14)
+        self.assertIn("Tour : 14", self.label.options["text"])
+
+    def test_time_sliced_ticks(self):
+        # Sans requins, la population ne s'éteint pas pendant la tranche
+        self.grid.clear_cells()
+        self.grid.populate_grid(3, 5, 10, shark_ratio=0.0)
+        self.grid.turbo = True
+        self.start()
+        self.assertGreaterEqual(self.grid.turn_count, 1)
+        self.assertEqual(len(self.root.scheduled), 1)
+
+    def test_stop_between_ticks(self):
+        self.grid.turbo = True
+        self.grid.steps_per_tick = 3
+        self.start()
+        self.grid.toggle_simulation(self.root, self.button, self.label)
+        self.root.run_next()
+        self.assertEqual(self.grid.turn_count, 3)
+        self.assertEqual(self.root.scheduled, [])
+        self.assertEqual(self.button.options["text"], "Lancer")
+
+    def test_extinction_stops_turbo(self):
+        self.grid.turbo = True
+        self.grid.steps_per_tick = 50
+        self.grid.store.clear_all()
+        self.start()
+        self.assertFalse(self.grid.running)
+        self.assertEqual(self.root.scheduled, [])
+        self.assertEqual(self.button.options["text"], "Lancer")
+        self.assertGreater(sum(self.grid.count_entities()), 0)  # Grille remplie à nouveau
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,4 @@
+"""
+Package wator contenant les points d'entrée en ligne de commande de la simulation Wa-Tor.
+Aucun module de ce package n'importe tkinter : ils peuvent tourner sur une machine sans affichage.
+"""
@@ -0,0 +1,235 @@
+"""
+Point d'entrée en ligne de commande : ``python -m wator <commande> [options]``.
+
+Commandes disponibles :
+- ``run`` : exécute une simulation sans interface graphique et écrit la série des populations
+- ``bench`` : mesure les performances sur une matrice de tailles et de paramètres
+- ``sweep`` : balaye une grille de paramètres sur tous les cœurs et résume chaque simulation
+- ``inspect`` : décrit un point de reprise (lu en mémoire projetée) et peut en exporter l'image
+- ``replay`` : rejoue un enregistrement de trajectoire dans une fenêtre, ou en exporte une image
+"""
+import argparse
+import sys
+from typing import Callable, List, Optional
+from interface.grid import ENGINES, SCHEDULES, FISH_RATIO, SHARK_RATIO
+from interface.neighborhood import NEIGHBORHOODS, VON_NEUMANN
+from interface.recording import DEFAULT_KEYFRAME_INTERVAL, open_recording
+from interface.renderer import species_to_ppm
+from interface.snapshot import open_snapshot
+from wator import benchmark, headless, sweep
+
+
+def list_of(convert: Callable, arity: int = 1) -> Callable[[str], list]:
+    """Construit un convertisseur argparse pour une liste de valeurs séparées par des virgules,
+    chaque valeur pouvant regrouper plusieurs nombres séparés par ":" (ex. "0.7:0.1,0.4:0.05").
+
+    Args:
+        convert (Callable): Conversion de chaque nombre (int ou float)
+        arity (int): Nombre de nombres attendus par valeur ; 1 donne une liste de nombres,
+            plus donne une liste de tuples. Defaults to 1.
+
+    Returns:
+        Callable[[str], list]: Convertisseur utilisable comme ``type`` d'un argument
+    """
+    def parse(text: str) -> list:
+        values = []
+        for item in text.split(","):
+            numbers = tuple(convert(part) for part in item.split(":"))
+            if len(numbers) != arity:
+                raise argparse.ArgumentTypeError(f"{item!r} : {arity} valeur(s) attendue(s) séparées par ':'")
+            values.append(numbers[0] if arity == 1 else numbers)
+        return values
+    return parse
+
+
+def check_schedules(parser: argparse.ArgumentParser, engine: str, schedules: List[str]) -> None:
+    """Refuse, pendant l'analyse des arguments, les ordonnancements inconnus ou incompatibles avec le moteur
+    (l'ordonnancement "synchronous" n'existe que pour le moteur objet).
+
+    Args:
+        parser (argparse.ArgumentParser): Analyseur qui signale l'erreur (message d'usage, code de retour 2)
+        engine (str): Moteur de simulation demandé
+        schedules (List[str]): Ordonnancements demandés
+    """
+    for schedule in schedules:
+        if schedule not in SCHEDULES:
+            parser.error(f"ordonnancement inconnu : {schedule!r} (choix possibles : {', '.join(SCHEDULES)})")
+        if schedule == "synchronous" and engine != "objects":
+            parser.error(f"l'ordonnancement 'synchronous' n'est disponible qu'avec le moteur 'objects' "
+                         f"(moteur demandé : {engine!r})")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Construit l'analyseur des arguments de la ligne de commande.
+
+    Returns:
+        argparse.ArgumentParser: Analyseur configuré avec toutes les commandes
+    """
+    parser = argparse.ArgumentParser(prog="wator", description="Simulation Wa-Tor en ligne de commande")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Exécute une simulation sans interface graphique")
+    run.add_argument("--width", type=int, default=headless.DEFAULT_WIDTH, help="Largeur de la grille")
+    run.add_argument("--height", type=int, default=headless.DEFAULT_HEIGHT, help="Hauteur de la grille")
+    run.add_argument("--steps", type=int, default=100, help="Nombre maximal de chronons")
+    run.add_argument("--seed", type=int, default=None, help="Graine aléatoire")
+    run.add_argument("--engine", choices=ENGINES, default="objects", help="Moteur de simulation")
+    run.add_argument("--schedule", choices=SCHEDULES, default="shuffle",
+                     help="Ordonnancement des entités (ordre aléatoire global ou sous-réseaux)")
+    run.add_argument("--neighborhood", choices=NEIGHBORHOODS, default=VON_NEUMANN,
+                     help="Voisinage des cellules (4 voisins, ou 8 avec les diagonales)")
+    run.add_argument("--fish-reproduction-time", type=int, default=headless.DEFAULT_FISH_REPRODUCTION_TIME)
+    run.add_argument("--shark-reproduction-time", type=int, default=headless.DEFAULT_SHARK_REPRODUCTION_TIME)
+    run.add_argument("--shark-initial-energy", type=int, default=headless.DEFAULT_SHARK_INITIAL_ENERGY)
+    run.add_argument("--shark-energy-from-fish", type=int, default=headless.DEFAULT_SHARK_ENERGY_FROM_FISH)
+    run.add_argument("--fish-ratio", type=float, default=FISH_RATIO, help="Proportion initiale de poissons")
+    run.add_argument("--shark-ratio", type=float, default=SHARK_RATIO, help="Proportion initiale de requins")
+    run.add_argument("--output", default=None, help="Fichier CSV de sortie (sortie standard par défaut)")
+    run.add_argument("--instrument", default=None,
+                     help="Fichier JSON Lines des relevés de chaque chronon (durée des phases, événements)")
+    run.add_argument("--checkpoint", default=None,
+                     help="Point de reprise : la simulation y reprend s'il existe, et il est réécrit régulièrement")
+    run.add_argument("--checkpoint-every", type=int, default=headless.DEFAULT_CHECKPOINT_EVERY,
+                     help="Chronons entre deux points de reprise")
+    run.add_argument("--compress", action="store_true", help="Compresse les points de reprise (zlib)")
+    run.add_argument("--processes", type=int, default=None,
+                     help="Nombre de processus du moteur tiled (tous les cœurs par défaut)")
+    run.add_argument("--record", default=None,
+                     help="Fichier où enregistrer la trajectoire (espèce de chaque cellule à chaque chronon)")
+    run.add_argument("--keyframe-interval", type=int, default=DEFAULT_KEYFRAME_INTERVAL,
+                     help="Chronons entre deux images clés de l'enregistrement")
+
+    bench = commands.add_parser("bench", help="Mesure les performances de la simulation")
+    bench.add_argument("--sizes", type=list_of(int), default=list(benchmark.DEFAULT_SIZES),
+                       help="Côtés des grilles carrées, ex. 20,100,500")
+    bench.add_argument("--densities", type=list_of(float, 2), default=list(benchmark.DEFAULT_DENSITIES),
+                       help="Proportions initiales poissons:requins, ex. 0.7:0.1,0.4:0.05")
+    bench.add_argument("--parameters", type=list_of(int, 3), default=list(benchmark.DEFAULT_PARAMETERS),
+                       help="Reproduction poissons:reproduction requins:énergie initiale, ex. 3:5:30")
+    bench.add_argument("--engines", nargs="+", choices=ENGINES, default=["objects"], help="Moteurs à mesurer")
+    bench.add_argument("--steps", type=int, default=benchmark.DEFAULT_STEPS, help="Chronons mesurés par cas")
+    bench.add_argument("--max-seconds", type=float, default=benchmark.DEFAULT_MAX_SECONDS,
+                       help="Durée maximale de la mesure d'un cas")
+    bench.add_argument("--seed", type=int, default=0, help="Graine aléatoire")
+    bench.add_argument("--no-memory", action="store_true", help="Ne pas mesurer le pic de mémoire")
+    bench.add_argument("--output", default=None, help="Fichier JSON des résultats")
+    bench.add_argument("--compare", default=None, help="Fichier JSON de référence à comparer")
+
+    scan = commands.add_parser("sweep", help="Balaye une grille de paramètres (une simulation par combinaison)")
+    for name, default in sweep.PARAMETERS.items():
+        option = "--" + name.replace("_", "-")
+        if name == "engine":
+            scan.add_argument(option, choices=ENGINES, default=default, help="Moteur de simulation")
+        elif name == "schedule":
+            scan.add_argument(option, type=list_of(str), default=[default],
+                              help=f"Ordonnancements séparés par des virgules ({', '.join(SCHEDULES)})")
+        elif name == "neighborhood":
+            scan.add_argument(option, type=list_of(str), default=[default],
+                              help=f"Voisinages séparés par des virgules ({', '.join(NEIGHBORHOODS)})")
+        elif name == "steps":
+            scan.add_argument(option, type=int, default=default, help="Nombre maximal de chronons par simulation")
+        else:
+            convert = float if isinstance(default, float) else int
+            scan.add_argument(option, type=list_of(convert), default=[default],
+                              help=f"Valeurs séparées par des virgules (défaut : {default})")
+    scan.add_argument("--repeats", type=int, default=1, help="Simulations par combinaison (graines successives)")
+    scan.add_argument("--seed", type=int, default=0, help="Graine de la première répétition")
+    scan.add_argument("--processes", type=int, default=None, help="Nombre de processus (tous les cœurs par défaut)")
+    scan.add_argument("--output", default=None, help="Fichier CSV des résultats (sortie standard par défaut)")
+
+    inspect = commands.add_parser("inspect", help="Décrit un point de reprise sans le charger en mémoire")
+    inspect.add_argument("checkpoint", help="Fichier écrit par Grid.save ou run --checkpoint")
+    inspect.add_argument("--ppm", default=None, help="Image PPM de l'océan (un pixel par cellule)")
+
+    replay = commands.add_parser("replay", help="Rejoue un enregistrement de trajectoire")
+    replay.add_argument("recording", help="Fichier écrit par run --record ou Grid.start_recording")
+    replay.add_argument("--chronon", type=int, default=None,
+                        help="Chronon exporté avec --ppm (le dernier par défaut)")
+    replay.add_argument("--ppm", default=None,
+                        help="Exporte l'image PPM d'un chronon au lieu d'ouvrir la fenêtre de relecture")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Exécute la commande demandée.
+
+    Args:
+        argv (Optional[List[str]]): Arguments de la ligne de commande (sys.argv[1:] par défaut)
+
+    Returns:
+        int: Code de retour du programme
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command in ("run", "sweep"):
+        check_schedules(parser, args.engine, [args.schedule] if args.command == "run" else args.schedule)
+    if args.command == "run":
+        series = headless.run_headless(width=args.width, height=args.height, steps=args.steps,
+                                       seed=args.seed, engine=args.engine,
+                                       fish_reproduction_time=args.fish_reproduction_time,
+                                       shark_reproduction_time=args.shark_reproduction_time,
+                                       shark_initial_energy=args.shark_initial_energy,
+                                       shark_energy_from_fish=args.shark_energy_from_fish,
+                                       fish_ratio=args.fish_ratio, shark_ratio=args.shark_ratio,
+                                       instrument=args.instrument, processes=args.processes,
+                                       schedule=args.schedule, checkpoint=args.checkpoint,
+                                       checkpoint_every=args.checkpoint_every, compress=args.compress,
+                                       record=args.record, keyframe_interval=args.keyframe_interval,
+                                       neighborhood=args.neighborhood)
+        headless.save_series(series, args.output)
+        if args.output is not None:
+            chronons, fish_count, shark_count = series[-1]
+            print(f"{chronons} chronons simulés : {fish_count} poissons, {shark_count} requins -> {args.output}")
+    elif args.command == "bench":
+        results = benchmark.run_matrix(args.sizes, args.densities, args.parameters, args.engines,
+                                       progress=sys.stdout, steps=args.steps, seed=args.seed,
+                                       max_seconds=args.max_seconds,
+                                       memory_steps=None if args.no_memory else benchmark.DEFAULT_MEMORY_STEPS)
+        if args.output is not None:
+            benchmark.save_results(results, args.output)
+            print(f"{len(results)} résultats -> {args.output}")
+        if args.compare is not None:
+            benchmark.compare_results(benchmark.load_results(args.compare), results)
+    elif args.command == "sweep":
+        grid = {name: getattr(args, name) for name in sweep.PARAMETERS}
+        grid["engine"] = [args.engine]
+        grid["steps"] = [args.steps]
+        tasks = sweep.expand_grid(grid, repeats=args.repeats, seed=args.seed)
+        results = sweep.run_sweep(tasks, processes=args.processes, progress=sys.stderr)
+        if args.output is None:
+            sweep.write_results(results, sys.stdout)
+        else:
+            with open(args.output, "w", newline="", encoding="utf-8") as f:
+                sweep.write_results(results, f)
+            print(f"{len(results)} simulations -> {args.output}")
+    elif args.command == "inspect":
+        with open_snapshot(args.checkpoint) as snapshot:
+            fish_count, shark_count = snapshot.count_entities()
+            print(f"{snapshot.point_x}x{snapshot.point_y} ({snapshot.engine}), chronon {snapshot.turn_count} : "
+                  f"{fish_count} poissons, {shark_count} requins")
+            if args.ppm is not None:
+                with open(args.ppm, "wb") as f:
+                    f.write(species_to_ppm(snapshot.store.species, snapshot.point_x, snapshot.point_y))
+                print(f"Image -> {args.ppm}")
+    elif args.command == "replay":
+        if args.ppm is None:
+            # Import tardif : tkinter n'est nécessaire que pour la fenêtre de relecture
+            from interface.replay_view import open_replay_window
+            open_replay_window(args.recording)
+            return 0
+        with open_recording(args.recording) as player:
+            if args.chronon is None:
+                player.seek(len(player) - 1)
+            else:
+                player.seek_chronon(args.chronon)
+            fish_count, shark_count = player.count_entities()
+            print(f"{player.point_x}x{player.point_y}, {len(player)} images, chronon {player.turn_count} : "
+                  f"{fish_count} poissons, {shark_count} requins")
+            with open(args.ppm, "wb") as f:
+                f.write(species_to_ppm(player.store.species, player.point_x, player.point_y))
+            print(f"Image -> {args.ppm}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
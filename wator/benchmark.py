@@ -0,0 +1,243 @@
+"""
+Mesure des performances de la simulation Wa-Tor sans interface graphique.
+
+Chaque cas de la matrice (taille de grille, proportions initiales, paramètres
+de reproduction et d'énergie, moteur) est simulé avec Grid.advance. On mesure :
+- le nombre de chronons par seconde
+- le nombre d'entités mises à jour par seconde (entités vivantes au début de chaque chronon)
+- le pic de mémoire allouée (tracemalloc), mesuré dans une seconde passe plus courte
+  car tracemalloc ralentit fortement la simulation
+
+Les résultats sont enregistrés en JSON pour comparer deux versions du code
+(``python -m wator bench --compare ancien.json``).
+"""
+# Importation des modules nécessaires
+# tracemalloc : pour mesurer le pic de mémoire allouée par Python (et par NumPy)
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple
+from interface.grid import Grid, FISH_RATIO, SHARK_RATIO
+from interface import numpy_engine
+from wator.headless import (DEFAULT_FISH_REPRODUCTION_TIME, DEFAULT_SHARK_REPRODUCTION_TIME,
+                            DEFAULT_SHARK_INITIAL_ENERGY)
+
+# Matrice par défaut : côtés des grilles carrées, proportions (poissons, requins),
+# paramètres (reproduction des poissons, reproduction des requins, énergie initiale des requins)
+DEFAULT_SIZES: Tuple[int, ...] = (20, 50, 100, 200, 500, 1000, 2000)
+DEFAULT_DENSITIES: Tuple[Tuple[float, float], ...] = ((FISH_RATIO, SHARK_RATIO), (0.4, 0.05), (0.2, 0.2))
+DEFAULT_PARAMETERS: Tuple[Tuple[int, int, int], ...] = (
+    (DEFAULT_FISH_REPRODUCTION_TIME, DEFAULT_SHARK_REPRODUCTION_TIME, DEFAULT_SHARK_INITIAL_ENERGY),
+)
+DEFAULT_STEPS: int = 20  # Nombre maximal de chronons chronométrés par cas
+DEFAULT_MAX_SECONDS: float = 30.0  # Durée maximale de la mesure d'un cas
+DEFAULT_MEMORY_STEPS: int = 2  # Chronons simulés pendant la mesure de la mémoire
+
+# Version du format du fichier de résultats
+RESULTS_FORMAT: int = 1
+
+
+def run_case(size: Tuple[int, int], engine: str = "objects", steps: int = DEFAULT_STEPS,
+             fish_ratio: float = FISH_RATIO, shark_ratio: float = SHARK_RATIO,
+             fish_reproduction_time: int = DEFAULT_FISH_REPRODUCTION_TIME,
+             shark_reproduction_time: int = DEFAULT_SHARK_REPRODUCTION_TIME,
+             shark_initial_energy: int = DEFAULT_SHARK_INITIAL_ENERGY, seed: int = 0,
+             max_seconds: float = DEFAULT_MAX_SECONDS,
+             memory_steps: Optional[int] = DEFAULT_MEMORY_STEPS) -> Dict[str, Any]:
+    """Mesure les performances d'un cas de la matrice.
+
+    Args:
+        size (Tuple[int, int]): Largeur et hauteur de la grille
+        engine (str): Moteur de simulation ("objects" ou "numpy"). Defaults to "objects".
+        steps (int): Nombre maximal de chronons chronométrés
+        fish_ratio (float): Proportion initiale de poissons
+        shark_ratio (float): Proportion initiale de requins
+        fish_reproduction_time (int): Temps nécessaire pour la reproduction des poissons
+        shark_reproduction_time (int): Temps nécessaire pour la reproduction des requins
+        shark_initial_energy (int): Énergie initiale des requins
+        seed (int): Graine aléatoire (la même pour tous les cas, pour comparer deux versions). Defaults to 0.
+        max_seconds (float): La mesure s'arrête après ce délai, même si tous les chronons n'ont pas été simulés
+        memory_steps (Optional[int]): Chronons simulés sous tracemalloc, ou None pour ne pas mesurer la mémoire
+
+    Returns:
+        Dict[str, Any]: Paramètres du cas et mesures (chronons, secondes, chronons_per_second,
+        entities_per_second, setup_seconds, peak_memory_bytes)
+    """
+    width, height = size
+    parameters = dict(fish_reproduction_time=fish_reproduction_time,
+                      shark_reproduction_time=shark_reproduction_time,
+                      shark_initial_energy=shark_initial_energy,
+                      fish_ratio=fish_ratio, shark_ratio=shark_ratio)
+
+    # Passe chronométrée (sans tracemalloc)
+    start = time.perf_counter()
+    grid = Grid(width, height, engine=engine, seed=seed)
+    grid.populate_grid(**parameters)
+    setup_seconds = time.perf_counter() - start
+
+    chronons = 0
+    entities = 0
+    elapsed = 0.0
+    population = sum(grid.count_entities())
+    while chronons < steps and population > 0 and elapsed < max_seconds:
+        entities += population
+        start = time.perf_counter()
+        population = sum(grid.advance())
+        elapsed += time.perf_counter() - start
+        chronons += 1
+    fish_count, shark_count = grid.count_entities()
+    del grid
+
+    result: Dict[str, Any] = {
+        "width": width, "height": height, "engine": engine, "seed": seed, **parameters,
+        "chronons": chronons,
+        "seconds": elapsed,
+        "chronons_per_second": chronons / elapsed if elapsed else None,
+        "entities_per_second": entities / elapsed if elapsed else None,
+        "setup_seconds": setup_seconds,
+        "final_fish": fish_count,
+        "final_sharks": shark_count,
+        "peak_memory_bytes": None,
+    }
+
+    # Passe mémoire : création, remplissage et quelques chronons sous tracemalloc
+    if memory_steps is not None:
+        tracemalloc.start()
+        try:
+            grid = Grid(width, height, engine=engine, seed=seed)
+            grid.populate_grid(**parameters)
+            for _ in range(memory_steps):
+                grid.advance()
+            result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_matrix(sizes: Sequence[int] = DEFAULT_SIZES,
+               densities: Sequence[Tuple[float, float]] = DEFAULT_DENSITIES,
+               parameters: Sequence[Tuple[int, int, int]] = DEFAULT_PARAMETERS,
+               engines: Sequence[str] = ("objects",), progress: Optional[TextIO] = None,
+               **options: Any) -> List[Dict[str, Any]]:
+    """Mesure tous les cas de la matrice (grilles carrées).
+
+    Args:
+        sizes (Sequence[int]): Côtés des grilles
+        densities (Sequence[Tuple[float, float]]): Proportions initiales (poissons, requins)
+        parameters (Sequence[Tuple[int, int, int]]): Temps de reproduction des poissons et des requins,
+            énergie initiale des requins
+        engines (Sequence[str]): Moteurs à mesurer. Defaults to ("objects",).
+        progress (Optional[TextIO]): Flux où afficher chaque résultat au fil de l'eau. Defaults to None.
+        **options (Any): Options transmises à run_case (steps, seed, max_seconds, memory_steps)
+
+    Returns:
+        List[Dict[str, Any]]: Résultat de chaque cas
+    """
+    results = []
+    for engine in engines:
+        for side in sizes:
+            for fish_ratio, shark_ratio in densities:
+                for fish_time, shark_time, energy in parameters:
+                    result = run_case((side, side), engine=engine, fish_ratio=fish_ratio,
+                                      shark_ratio=shark_ratio, fish_reproduction_time=fish_time,
+                                      shark_reproduction_time=shark_time, shark_initial_energy=energy,
+                                      **options)
+                    results.append(result)
+                    if progress is not None:
+                        progress.write(format_result(result) + "\n")
+                        progress.flush()
+    return results
+
+
+def case_key(result: Dict[str, Any]) -> Tuple:
+    """Retourne ce qui identifie un cas de la matrice (pour comparer deux fichiers de résultats).
+
+    Args:
+        result (Dict[str, Any]): Résultat d'un cas
+
+    Returns:
+        Tuple: Paramètres du cas
+    """
+    return tuple(result[name] for name in ("engine", "width", "height", "fish_ratio", "shark_ratio",
+                                           "fish_reproduction_time", "shark_reproduction_time",
+                                           "shark_initial_energy", "seed"))
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    """Met en forme un résultat sur une ligne.
+
+    Args:
+        result (Dict[str, Any]): Résultat d'un cas
+
+    Returns:
+        str: Ligne lisible décrivant le cas et ses mesures
+    """
+    memory = result["peak_memory_bytes"]
+    return ("{engine:7} {width:>5}x{height:<5} f={fish_ratio:.2f} s={shark_ratio:.2f} "
+            "repro={fish_reproduction_time}/{shark_reproduction_time} energie={shark_initial_energy:<3} "
+            "{chronons:>4} chronons  {cps:>10} chronons/s  {eps:>12} entites/s  memoire {memory}").format(
+        cps="-" if result["chronons_per_second"] is None else "%.2f" % result["chronons_per_second"],
+        eps="-" if result["entities_per_second"] is None else "%.0f" % result["entities_per_second"],
+        memory="-" if memory is None else "%.1f Mo" % (memory / 1e6),
+        **result)
+
+
+def environment() -> Dict[str, Any]:
+    """Décrit la machine et les versions utilisées, enregistrées avec les résultats.
+
+    Returns:
+        Dict[str, Any]: Version de Python, de NumPy (None s'il est absent), plateforme et date
+    """
+    return {
+        "python": platform.python_version(),
+        "numpy": None if numpy_engine.np is None else numpy_engine.np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "date": datetime.now().isoformat(),
+    }
+
+
+def save_results(results: List[Dict[str, Any]], path: str) -> None:
+    """Enregistre les résultats (et l'environnement de mesure) dans un fichier JSON.
+
+    Args:
+        results (List[Dict[str, Any]]): Résultats renvoyés par run_matrix
+        path (str): Fichier de sortie
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"format": RESULTS_FORMAT, "environment": environment(), "results": results}, f, indent=2)
+
+
+def load_results(path: str) -> List[Dict[str, Any]]:
+    """Charge les résultats d'un fichier JSON écrit par save_results.
+
+    Args:
+        path (str): Fichier de résultats
+
+    Returns:
+        List[Dict[str, Any]]: Résultats enregistrés
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare_results(baseline: List[Dict[str, Any]], results: List[Dict[str, Any]],
+                    stream: TextIO = sys.stdout) -> None:
+    """Affiche l'accélération de chaque cas par rapport à des résultats de référence.
+
+    Args:
+        baseline (List[Dict[str, Any]]): Résultats de référence (ancienne version)
+        results (List[Dict[str, Any]]): Nouveaux résultats
+        stream (TextIO): Flux de sortie. Defaults to sys.stdout.
+    """
+    reference = {case_key(result): result for result in baseline}
+    for result in results:
+        old = reference.get(case_key(result))
+        if old is None or not old["chronons_per_second"] or not result["chronons_per_second"]:
+            continue
+        speedup = result["chronons_per_second"] / old["chronons_per_second"]
+        stream.write("{engine:7} {width:>5}x{height:<5} f={fish_ratio:.2f} s={shark_ratio:.2f} : x{speedup:.2f}\n"
+                     .format(speedup=speedup, **result))
@@ -0,0 +1,130 @@
+"""
+Exécution de la simulation Wa-Tor sans interface graphique (mode headless).
+La grille est avancée avec Grid.advance : pas de dessin, pas de label,
+pas d'écriture dans simulation_history.csv à chaque chronon.
+"""
+# Importation des modules nécessaires
+# csv : pour l'écriture de la série des populations
+import csv
+import os
+import sys
+from typing import List, Optional, TextIO, Tuple
+from interface.grid import Grid, FISH_RATIO, SHARK_RATIO
+from interface.neighborhood import VON_NEUMANN
+from interface.recording import DEFAULT_KEYFRAME_INTERVAL
+
+# Paramètres par défaut (mêmes valeurs que dans main.py)
+DEFAULT_WIDTH: int = 20
+DEFAULT_HEIGHT: int = 20
+DEFAULT_FISH_REPRODUCTION_TIME: int = 3
+DEFAULT_SHARK_REPRODUCTION_TIME: int = 5
+DEFAULT_SHARK_INITIAL_ENERGY: int = 30
+DEFAULT_SHARK_ENERGY_FROM_FISH: int = 15
+DEFAULT_CHECKPOINT_EVERY: int = 100  # Chronons entre deux points de reprise
+
+# Une ligne de la série : (chronon, nombre de poissons, nombre de requins)
+PopulationRow = Tuple[int, int, int]
+
+
+def run_headless(width: int = DEFAULT_WIDTH, height: int = DEFAULT_HEIGHT, steps: int = 100,
+                 seed: Optional[int] = None, engine: str = "objects",
+                 fish_reproduction_time: int = DEFAULT_FISH_REPRODUCTION_TIME,
+                 shark_reproduction_time: int = DEFAULT_SHARK_REPRODUCTION_TIME,
+                 shark_initial_energy: int = DEFAULT_SHARK_INITIAL_ENERGY,
+                 shark_energy_from_fish: int = DEFAULT_SHARK_ENERGY_FROM_FISH,
+                 fish_ratio: float = FISH_RATIO, shark_ratio: float = SHARK_RATIO,
+                 instrument: Optional[str] = None, processes: Optional[int] = None,
+                 schedule: str = "shuffle", checkpoint: Optional[str] = None,
+                 checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY, compress: bool = False,
+                 record: Optional[str] = None,
+                 keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+                 neighborhood: str = VON_NEUMANN) -> List[PopulationRow]:
+    """Exécute une simulation complète sans interface graphique.
+
+    Args:
+        width (int): Largeur de la grille
+        height (int): Hauteur de la grille
+        steps (int): Nombre maximal de chronons à simuler
+        seed (Optional[int]): Graine aléatoire ; une même graine donne la même série. Defaults to None.
+        engine (str): Moteur de simulation ("objects", "numpy" ou "tiled"). Defaults to "objects".
+        fish_reproduction_time (int): Temps nécessaire pour la reproduction des poissons
+        shark_reproduction_time (int): Temps nécessaire pour la reproduction des requins
+        shark_initial_energy (int): Énergie initiale des requins
+        shark_energy_from_fish (int): Énergie gagnée par un requin en mangeant un poisson
+        fish_ratio (float): Proportion initiale de poissons
+        shark_ratio (float): Proportion initiale de requins
+        instrument (Optional[str]): Fichier JSON Lines où écrire le relevé (durée des phases,
+            événements) de chaque chronon. Defaults to None.
+        processes (Optional[int]): Nombre de processus du moteur "tiled" (tous les cœurs par défaut)
+        schedule (str): Ordonnancement des entités ("shuffle", "sublattice" ou "synchronous"). Defaults to "shuffle".
+        checkpoint (Optional[str]): Fichier de point de reprise (voir Grid.save). S'il existe, la
+            simulation y reprend (les paramètres de la grille sont alors ceux du point de reprise) ;
+            il est réécrit tous les ``checkpoint_every`` chronons et à la fin. Defaults to None.
+        checkpoint_every (int): Chronons entre deux points de reprise. Defaults to DEFAULT_CHECKPOINT_EVERY.
+        compress (bool): Compresse les points de reprise. Defaults to False.
+        record (Optional[str]): Fichier où enregistrer la trajectoire (voir interface/recording.py),
+            du chronon de départ au dernier chronon simulé. Defaults to None.
+        keyframe_interval (int): Chronons entre deux images clés de l'enregistrement.
+            Defaults to DEFAULT_KEYFRAME_INTERVAL.
+        neighborhood (str): Voisinage des cellules ("von_neumann" ou "moore"). Defaults to "von_neumann".
+
+    Returns:
+        List[PopulationRow]: Série des populations, du chronon de départ (0, ou celui du point de
+        reprise) jusqu'au chronon ``steps``. La simulation s'arrête plus tôt si plus aucune entité
+        n'est vivante.
+    """
+    if checkpoint is not None and os.path.exists(checkpoint):
+        grid = Grid.load(checkpoint, processes=processes)
+    else:
+        grid = Grid(width, height, engine=engine, seed=seed, processes=processes, schedule=schedule,
+                    neighborhood=neighborhood)
+        grid.populate_grid(fish_reproduction_time=fish_reproduction_time,
+                           shark_reproduction_time=shark_reproduction_time,
+                           shark_initial_energy=shark_initial_energy,
+                           shark_energy_from_fish=shark_energy_from_fish,
+                           fish_ratio=fish_ratio, shark_ratio=shark_ratio)
+    fish_count, shark_count = grid.count_entities()
+    series: List[PopulationRow] = [(grid.turn_count, fish_count, shark_count)]
+    grid.instrumentation.dump_to(instrument)
+    if record is not None:
+        grid.start_recording(record, keyframe_interval)
+    try:
+        while grid.turn_count < steps and (fish_count or shark_count):
+            fish_count, shark_count = grid.advance()
+            series.append((grid.turn_count, fish_count, shark_count))
+            if checkpoint is not None and grid.turn_count % checkpoint_every == 0:
+                grid.save(checkpoint, compress=compress)
+        if checkpoint is not None:
+            grid.save(checkpoint, compress=compress)
+    finally:
+        grid.instrumentation.close()
+        grid.stop_recording()
+        if grid.ocean is not None:
+            grid.ocean.close()
+    return series
+
+
+def write_series(series: List[PopulationRow], stream: TextIO) -> None:
+    """Écrit la série des populations au format CSV.
+
+    Args:
+        series (List[PopulationRow]): Série renvoyée par run_headless
+        stream (TextIO): Flux de sortie (fichier ou sys.stdout)
+    """
+    writer = csv.writer(stream)
+    writer.writerow(['chronons', 'fish_count', 'shark_count'])
+    writer.writerows(series)
+
+
+def save_series(series: List[PopulationRow], path: Optional[str]) -> None:
+    """Écrit la série dans un fichier CSV, ou sur la sortie standard si aucun chemin n'est donné.
+
+    Args:
+        series (List[PopulationRow]): Série renvoyée par run_headless
+        path (Optional[str]): Chemin du fichier CSV, ou None pour la sortie standard
+    """
+    if path is None:
+        write_series(series, sys.stdout)
+        return
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        write_series(series, f)
@@ -0,0 +1,226 @@
+"""
+Balayage de paramètres de la simulation Wa-Tor sur plusieurs processus.
+
+Chaque combinaison de la grille de paramètres (produit cartésien des valeurs
+données pour chaque paramètre) est simulée ``repeats`` fois, avec les graines
+``seed``, ``seed + 1``, ... : toutes les combinaisons partagent les mêmes
+graines, ce qui rend leurs résultats directement comparables. Les
+simulations sont indépendantes et réparties sur un pool de processus (un par
+cœur par défaut). Chaque simulation est résumée par :
+- le chronon d'extinction des poissons, des requins (None si l'espèce survit)
+- la période des oscillations des populations, estimée par autocorrélation
+  (calculée par FFT si NumPy est installé)
+- les populations moyennes
+"""
+# Importation des modules nécessaires
+# concurrent.futures : pool de processus (les simulations n'ont aucun état partagé)
+import csv
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, TextIO
+from interface.grid import FISH_RATIO, SHARK_RATIO
+from interface.neighborhood import VON_NEUMANN
+from interface.numpy_engine import np
+from wator.headless import (PopulationRow, run_headless, DEFAULT_WIDTH, DEFAULT_HEIGHT,
+                            DEFAULT_FISH_REPRODUCTION_TIME, DEFAULT_SHARK_REPRODUCTION_TIME,
+                            DEFAULT_SHARK_INITIAL_ENERGY, DEFAULT_SHARK_ENERGY_FROM_FISH)
+
+# Paramètres d'une simulation et valeur par défaut (mêmes noms que les arguments de run_headless)
+PARAMETERS: Dict[str, Any] = {
+    "width": DEFAULT_WIDTH,
+    "height": DEFAULT_HEIGHT,
+    "steps": 500,
+    "engine": "objects",
+    "schedule": "shuffle",
+    "neighborhood": VON_NEUMANN,
+    "fish_reproduction_time": DEFAULT_FISH_REPRODUCTION_TIME,
+    "shark_reproduction_time": DEFAULT_SHARK_REPRODUCTION_TIME,
+    "shark_initial_energy": DEFAULT_SHARK_INITIAL_ENERGY,
+    "shark_energy_from_fish": DEFAULT_SHARK_ENERGY_FROM_FISH,
+    "fish_ratio": FISH_RATIO,
+    "shark_ratio": SHARK_RATIO,
+}
+
+# Colonnes du résumé d'une simulation
+SUMMARY_COLUMNS: List[str] = ["chronons", "fish_extinction", "shark_extinction", "fish_period", "shark_period",
+                              "mean_fish", "mean_sharks"]
+
+# Corrélation minimale pour qu'un pic d'autocorrélation soit retenu comme période
+MIN_PERIOD_CORRELATION: float = 0.2
+
+
+def expand_grid(grid: Dict[str, Sequence[Any]], repeats: int = 1, seed: int = 0) -> List[Dict[str, Any]]:
+    """Construit la liste des simulations d'un balayage.
+
+    Args:
+        grid (Dict[str, Sequence[Any]]): Valeurs à essayer pour chaque paramètre (voir PARAMETERS) ;
+            les paramètres absents gardent leur valeur par défaut
+        repeats (int): Nombre de simulations par combinaison. Defaults to 1.
+        seed (int): Graine de la première répétition. Defaults to 0.
+
+    Returns:
+        List[Dict[str, Any]]: Paramètres complets de chaque simulation (avec sa graine)
+
+    Raises:
+        ValueError: Si un paramètre est inconnu
+    """
+    unknown = set(grid) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"Paramètres inconnus : {', '.join(sorted(unknown))}")
+    names = list(grid)
+    tasks = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        for repeat in range(repeats):
+            task = dict(PARAMETERS)
+            task.update(zip(names, values))
+            task["seed"] = seed + repeat
+            tasks.append(task)
+    return tasks
+
+
+def extinction_time(values: Sequence[int]) -> Optional[int]:
+    """Retourne le premier chronon où la population est nulle.
+
+    Args:
+        values (Sequence[int]): Population à chaque chronon (à partir du chronon 0)
+
+    Returns:
+        Optional[int]: Chronon d'extinction, ou None si la population survit
+    """
+    for chronon, value in enumerate(values):
+        if value == 0:
+            return chronon
+    return None
+
+
+def oscillation_period(values: Sequence[int], min_correlation: float = MIN_PERIOD_CORRELATION) -> Optional[int]:
+    """Estime la période des oscillations d'une population par autocorrélation.
+    La période est le premier maximum local de l'autocorrélation après son premier
+    passage sous zéro (une demi-oscillation), s'il dépasse ``min_correlation``.
+
+    Args:
+        values (Sequence[int]): Population à chaque chronon
+        min_correlation (float): Corrélation minimale du pic retenu. Defaults to MIN_PERIOD_CORRELATION.
+
+    Returns:
+        Optional[int]: Période en chronons, ou None si la série n'oscille pas nettement
+    """
+    count = len(values)
+    if count < 4:
+        return None
+    mean = sum(values) / count
+    centered = [value - mean for value in values]
+    variance = sum(value * value for value in centered)
+    if variance == 0:
+        return None
+
+    if np is not None:
+        # Toute l'autocorrélation d'un coup par transformée de Fourier (O(n log n))
+        spectrum = np.fft.rfft(centered, 2 * count)
+        table = np.fft.irfft(spectrum * np.conj(spectrum))[:count] / variance
+
+        def correlation(lag: int) -> float:
+            return float(table[lag])
+    else:
+        def correlation(lag: int) -> float:
+            return sum(a * b for a, b in zip(centered, centered[lag:])) / variance
+
+    # Recherche du premier passage sous zéro, puis du premier pic suivant
+    previous = correlation(1)
+    crossed = previous < 0
+    rising = False  # L'autocorrélation remonte depuis son creux
+    for lag in range(2, count // 2 + 1):
+        current = correlation(lag)
+        if not crossed:
+            crossed = current < 0
+        elif current > previous:
+            rising = True
+        elif rising and current < previous:
+            # L'autocorrélation redescend : le pic était au décalage précédent
+            return lag - 1 if previous >= min_correlation else None
+        previous = current
+    return None
+
+
+def summarize(series: List[PopulationRow]) -> Dict[str, Any]:
+    """Résume la série des populations d'une simulation.
+
+    Args:
+        series (List[PopulationRow]): Série renvoyée par run_headless
+
+    Returns:
+        Dict[str, Any]: Valeurs des colonnes SUMMARY_COLUMNS
+    """
+    fish = [row[1] for row in series]
+    sharks = [row[2] for row in series]
+    return {
+        "chronons": series[-1][0],
+        "fish_extinction": extinction_time(fish),
+        "shark_extinction": extinction_time(sharks),
+        "fish_period": oscillation_period(fish),
+        "shark_period": oscillation_period(sharks),
+        "mean_fish": sum(fish) / len(fish),
+        "mean_sharks": sum(sharks) / len(sharks),
+    }
+
+
+def run_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Exécute une simulation du balayage (fonction appelée dans les processus du pool).
+
+    Args:
+        task (Dict[str, Any]): Paramètres de la simulation (voir expand_grid)
+
+    Returns:
+        Dict[str, Any]: Paramètres de la simulation suivis de son résumé
+    """
+    series = run_headless(**task)
+    return {**task, **summarize(series)}
+
+
+def run_sweep(tasks: Iterable[Dict[str, Any]], processes: Optional[int] = None,
+              progress: Optional[TextIO] = None) -> List[Dict[str, Any]]:
+    """Exécute toutes les simulations d'un balayage sur un pool de processus.
+
+    Args:
+        tasks (Iterable[Dict[str, Any]]): Simulations à exécuter (voir expand_grid)
+        processes (Optional[int]): Nombre de processus ; None utilise tous les cœurs,
+            1 exécute tout dans le processus courant. Defaults to None.
+        progress (Optional[TextIO]): Flux où signaler l'avancement. Defaults to None.
+
+    Returns:
+        List[Dict[str, Any]]: Résultat de chaque simulation, dans l'ordre des tâches
+    """
+    tasks = list(tasks)
+    results: List[Dict[str, Any]] = []
+
+    def collect(result_iterator: Iterable[Dict[str, Any]]) -> None:
+        for result in result_iterator:
+            results.append(result)
+            if progress is not None:
+                progress.write(f"\r{len(results)}/{len(tasks)} simulations")
+                progress.flush()
+
+    if processes == 1:
+        collect(map(run_task, tasks))
+    else:
+        workers = processes or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Plusieurs tâches par envoi : moins d'échanges entre processus pour les petites grilles
+            chunksize = max(1, len(tasks) // (4 * workers))
+            collect(pool.map(run_task, tasks, chunksize=chunksize))
+    if progress is not None:
+        progress.write("\n")
+    return results
+
+
+def write_results(results: List[Dict[str, Any]], stream: TextIO) -> None:
+    """Écrit la table des résultats au format CSV (une ligne par simulation).
+
+    Args:
+        results (List[Dict[str, Any]]): Résultats renvoyés par run_sweep
+        stream (TextIO): Flux de sortie (fichier ou sys.stdout)
+    """
+    writer = csv.DictWriter(stream, fieldnames=list(PARAMETERS) + ["seed"] + SUMMARY_COLUMNS)
+    writer.writeheader()
+    writer.writerows(results)